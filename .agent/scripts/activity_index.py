@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Activity Index - Inove AI Framework
+Índice por dia das janelas de trabalho de cada agente, para o sync_tracker
+detectar trabalho simultâneo no mesmo Epic sem reparsear os logs de sessão.
+
+Arquivo: .agent/cache/epic_activity.json
+    {"days": {"AAAA-MM-DD": {"sig": [mtime_ns, tamanho],
+                              "windows": [{"agent", "start", "end", "ids"}]}}}
+
+Cada janela é uma sessão do log diário (HH:MM — HH:MM) com os IDs de
+Story/Epic citados nas atividades. O índice é atualizado:
+    - pelo auto_session, a cada gravação do log do dia
+    - na consulta, só para os dias cujo arquivo mudou (mtime/tamanho)
+
+Conflito = duas janelas de agentes diferentes no mesmo Epic que se
+sobrepõem no tempo (varredura por intervalos ordenados).
+
+Uso:
+    from activity_index import ActivityIndex, find_overlaps
+
+    index = ActivityIndex(logs_dir)
+    index.refresh(days_back=7)
+    for epic, windows in index.epic_windows(days_back=7).items():
+        print(epic, find_overlaps(windows))
+"""
+
+import os
+import re
+import sys
+import json
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+from backlog_model import extract_task_ids_from_text
+from session_logger import parse_log_file
+
+INDEX_FILE = Path(".agent") / "cache" / "epic_activity.json"
+INDEX_VERSION = 1
+
+DAY_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+class Window(NamedTuple):
+    """Sessão de um agente num Epic."""
+    start: datetime
+    end: datetime
+    agent: str
+    epic: str
+
+
+def _signature(path: Path) -> Optional[List[int]]:
+    try:
+        st = path.stat()
+        return [st.st_mtime_ns, st.st_size]
+    except OSError:
+        return None
+
+
+def _cutoff(days_back: Optional[int]) -> Optional[str]:
+    if days_back is None:
+        return None
+    return (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
+
+
+def parse_day(log_file: Path) -> List[dict]:
+    """Janelas de sessão (já encerradas) de um log diário."""
+    windows = []
+    for session in parse_log_file(log_file):
+        ids = extract_task_ids_from_text("\n".join(session.activities))
+        if ids:
+            windows.append({
+                "agent": session.agent_source,
+                "start": session.start,
+                "end": session.end,
+                "ids": ids,
+            })
+    return windows
+
+
+def default_epic_of(task_id: str) -> Optional[str]:
+    """'3.1' -> '3', '2' -> '2'"""
+    match = re.match(r"^(\d+)", task_id)
+    return match.group(1) if match else None
+
+
+class ActivityIndex:
+    def __init__(self, logs_dir: Path, index_file: Path = INDEX_FILE):
+        self.logs_dir = Path(logs_dir)
+        self.index_file = index_file
+        self.days: Dict[str, dict] = self._load()
+        self._dirty = False
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            data = json.loads(self.index_file.read_text(encoding="utf-8"))
+            return data.get("days", {}) if data.get("version") == INDEX_VERSION else {}
+        except (OSError, ValueError):
+            return {}
+
+    def save(self):
+        if not self._dirty:
+            return
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.index_file.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"version": INDEX_VERSION, "days": self.days}), encoding="utf-8")
+            os.replace(tmp, self.index_file)
+            self._dirty = False
+        except OSError:
+            pass
+
+    def refresh_day(self, log_file: Path) -> bool:
+        """Reindexa um dia se o arquivo mudou. Retorna True se reindexou."""
+        day = log_file.stem
+        sig = _signature(log_file)
+        cached = self.days.get(day)
+        if sig is None:
+            if cached is not None:
+                del self.days[day]
+                self._dirty = True
+            return cached is not None
+        if cached and cached.get("sig") == sig:
+            return False
+        self.days[day] = {"sig": sig, "windows": parse_day(log_file)}
+        self._dirty = True
+        return True
+
+    def refresh(self, days_back: Optional[int] = None) -> int:
+        """
+        Reindexa os dias alterados (só os do período, se `days_back`).
+        Dias fora do período não são nem lidos do disco: o filtro é pelo nome.
+        """
+        since = _cutoff(days_back)
+        seen = set()
+        changed = 0
+        if self.logs_dir.exists():
+            for year_dir in self.logs_dir.iterdir():
+                if not year_dir.is_dir():
+                    continue
+                for log_file in year_dir.glob("*.md"):
+                    day = log_file.stem
+                    if not DAY_RE.match(day) or (since and day < since):
+                        continue
+                    seen.add(day)
+                    changed += self.refresh_day(log_file)
+        for day in [d for d in self.days if (not since or d >= since) and d not in seen]:
+            del self.days[day]
+            self._dirty = True
+        return changed
+
+    def epic_windows(self, days_back: Optional[int] = None,
+                     epic_of: Callable[[str], Optional[str]] = default_epic_of) -> Dict[str, List[Window]]:
+        """Epic -> janelas ordenadas por início, só dos dias do período."""
+        days = sorted(self.days)
+        since = _cutoff(days_back)
+        first = bisect_left(days, since) if since else 0
+
+        by_epic: Dict[str, List[Window]] = {}
+        for day in days[first:]:
+            date = datetime.strptime(day, "%Y-%m-%d")
+            for w in self.days[day]["windows"]:
+                start = date + _clock(w["start"])
+                end = date + _clock(w["end"])
+                if end < start:  # sessão que passou da meia-noite
+                    end += timedelta(days=1)
+                for epic in {epic_of(task_id) for task_id in w["ids"]} - {None}:
+                    by_epic.setdefault(epic, []).append(Window(start, end, w["agent"], epic))
+
+        for windows in by_epic.values():
+            windows.sort()
+        return by_epic
+
+
+def _clock(hhmm: str) -> timedelta:
+    hours, minutes = hhmm.split(":")
+    return timedelta(hours=int(hours), minutes=int(minutes))
+
+
+def find_overlaps(windows: List[Window]) -> List[Tuple[Window, Window]]:
+    """
+    Pares de janelas de agentes diferentes que se sobrepõem no tempo.
+    `windows` precisa estar ordenado por início; janelas que já terminaram
+    saem do conjunto ativo, então o custo é O(n log n + pares).
+    """
+    overlaps = []
+    active: List[Window] = []
+    for window in windows:
+        active = [a for a in active if a.end > window.start]
+        for other in active:
+            if other.agent != window.agent:
+                overlaps.append((other, window))
+        active.append(window)
+    return overlaps
+
+
+def index_log_file(log_file: Path):
+    """Atualiza o índice após gravar um log diário (chamado pelo auto_session)."""
+    index = ActivityIndex(log_file.parent.parent)
+    index.refresh_day(log_file)
+    index.save()
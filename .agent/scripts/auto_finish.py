@@ -10,17 +10,23 @@ Uso:
 Funcionalidades:
     - Detecta padrões de conclusão (palavras-chave, commits)
     - Cruza com BACKLOG.md para identificar Story/Epic
-    - Auto-executa finish_task.py quando apropriado
+    - Marca as tarefas em lote, no mesmo processo (finish_task/progress_tracker)
     - Sugere tarefas candidatas a conclusão
 """
 
 import os
 import re
 import sys
-import subprocess
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+sys.path.insert(0, str(Path(__file__).parent))
+import backlog_model
+import finish_task
+from backlog_model import extract_task_ids_from_text
+import progress_tracker
+from git_index import GitIndex
+
 
 def get_agent_source() -> str:
     """Detecta qual agente está executando."""
@@ -35,43 +41,7 @@ def get_agent_source() -> str:
 
 def find_backlog() -> Path | None:
     """Procura pelo arquivo de backlog."""
-    candidates = [
-        Path("docs/BACKLOG.md"),
-        Path("BACKLOG.md"),
-        Path("docs/planning/BACKLOG.md"),
-        *Path("docs").rglob("global-task-list.md"),
-    ]
-    for candidate in candidates:
-        if candidate.exists():
-            return candidate
-    return None
-
-
-def extract_task_ids_from_text(text: str) -> List[str]:
-    """
-    Extrai IDs de tarefas mencionadas em texto.
-
-    Formatos reconhecidos:
-        - Story 3.1
-        - Epic 2
-        - Task 3.1
-        - #3.1
-        - feat(Story-3.1)
-    """
-    patterns = [
-        r'(?:Story|Epic|Task)\s+(\d+(?:\.\d+)?)',  # Story 3.1, Epic 2
-        r'(?:Story|Epic|Task)-(\d+(?:\.\d+)?)',     # Story-3.1
-        r'#(\d+\.\d+)',                             # #3.1
-        r'\((\d+\.\d+)\)',                          # (3.1)
-    ]
-
-    task_ids = set()
-    for pattern in patterns:
-        matches = re.finditer(pattern, text, re.IGNORECASE)
-        for match in matches:
-            task_ids.add(match.group(1))
-
-    return sorted(list(task_ids))
+    return backlog_model.find_backlog()
 
 
 def detect_completion_keywords(text: str) -> bool:
@@ -95,17 +65,8 @@ def detect_completion_keywords(text: str) -> bool:
 
 
 def get_recent_commit_messages(count: int = 1) -> List[str]:
-    """Obtém mensagens dos commits recentes."""
-    try:
-        result = subprocess.run(
-            ["git", "log", f"-{count}", "--pretty=%B"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        return result.stdout.strip().split('\n\n')
-    except subprocess.CalledProcessError:
-        return []
+    """Obtém mensagens dos commits recentes (via índice do git log)."""
+    return [entry['message'] for entry in GitIndex().recent(count)]
 
 
 def get_pending_tasks(backlog_path: Path) -> List[Tuple[str, str]]:
@@ -115,19 +76,8 @@ def get_pending_tasks(backlog_path: Path) -> List[Tuple[str, str]]:
     Returns:
         Lista de tuplas (task_id, task_title)
     """
-    content = backlog_path.read_text(encoding='utf-8')
-
-    # Regex para tarefas pendentes: "- [ ] **Story X.X:** Título"
-    pattern = re.compile(
-        r'-\s*\[\s*\]\s*\*\*(?:Story|Epic)\s+(\d+(?:\.\d+)?):\*\*\s*(.+?)(?:\n|$)',
-        re.IGNORECASE
-    )
-
-    tasks = []
-    for match in pattern.finditer(content):
-        task_id = match.group(1)
-        task_title = match.group(2).strip()
-        tasks.append((task_id, task_title))
+    # Tarefas pendentes: "- [ ] **Story X.X:** Título"
+    tasks = [(t.task_id, t.title) for t in backlog_model.load_backlog(backlog_path).pending_tasks()]
 
     return tasks
 
@@ -160,65 +110,68 @@ def suggest_completion_candidates(
     return candidates
 
 
-def mark_task_as_done(task_id: str, force: bool = False) -> bool:
+def mark_tasks_as_done(task_ids: List[str], force: bool = False) -> List[str]:
     """
-    Marca uma tarefa como concluída usando finish_task.py.
+    Marca várias tarefas como concluídas no mesmo processo: uma aquisição do
+    lock do BACKLOG e uma única gravação do arquivo (finish_task.mark_tasks_complete).
 
     Args:
-        task_id: ID da tarefa (ex: "3.1")
+        task_ids: IDs das tarefas (ex: ["3.1", "3.2"])
         force: Força conclusão mesmo com aviso de ownership
 
     Returns:
-        True se sucesso, False caso contrário
+        IDs marcados com sucesso
     """
-    script_dir = Path(__file__).parent
-    finish_script = script_dir / "finish_task.py"
+    backlog = find_backlog()
+    if not backlog:
+        print("❌ BACKLOG.md não encontrado.")
+        return []
 
-    if not finish_script.exists():
-        print(f"⚠️ Script finish_task.py não encontrado em {script_dir}")
-        return False
+    marked = []
+    for task_id, success, message in finish_task.mark_tasks_complete(backlog, task_ids, force):
+        if success:
+            marked.append(task_id)
+        else:
+            print(f"⚠️ {message}")
+    return marked
 
-    cmd = [sys.executable, str(finish_script), task_id]
-    if force:
-        cmd.append("--force")
 
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True)
+def mark_task_as_done(task_id: str, force: bool = False) -> bool:
+    """
+    Marca uma tarefa como concluída.
 
-        if result.returncode == 0:
-            print(result.stdout)
-            return True
-        else:
-            print(result.stderr or result.stdout)
-            return False
-    except Exception as e:
-        print(f"❌ Erro ao executar finish_task.py: {e}")
-        return False
+    Args:
+        task_id: ID da tarefa (ex: "3.1")
+        force: Força conclusão mesmo com aviso de ownership
+
+    Returns:
+        True se sucesso, False caso contrário
+    """
+    return bool(mark_tasks_as_done([task_id], force))
 
 
 def update_progress() -> Optional[str]:
     """
-    Atualiza a barra de progresso usando progress_tracker.py.
+    Recalcula o progresso a partir do backlog já parseado (o modelo fica em
+    cache após a gravação) e salva docs/progress-bar.md uma vez, se mudou.
 
     Returns:
-        Output do progress_tracker ou None se falhar
+        Resumo do progresso ou None se falhar
     """
-    script_dir = Path(__file__).parent
-    tracker_script = script_dir / "progress_tracker.py"
-
-    if not tracker_script.exists():
+    backlog = find_backlog()
+    if not backlog:
         return None
 
     try:
-        result = subprocess.run(
-            [sys.executable, str(tracker_script)],
-            capture_output=True,
-            text=True
-        )
-        return result.stdout
+        epics = progress_tracker.summarize(backlog_model.load_backlog(backlog))
+        if not epics:
+            return None
+        progress_tracker.write_progress(epics)
     except Exception:
         return None
 
+    return f"{progress_tracker.format_summary(epics)}\n\n✅ Arquivo gerado: {progress_tracker.OUTPUT_PATH}"
+
 
 def cmd_suggest():
     """Comando: Sugere tarefas candidatas a conclusão."""
@@ -303,9 +256,8 @@ def cmd_check_context():
     response = input("Marcar como concluída? (s/N): ").strip().lower()
 
     if response == 's':
-        for task_id, _ in candidates:
-            if mark_task_as_done(task_id):
-                print(f"✅ Story {task_id} marcada como concluída!")
+        for task_id in mark_tasks_as_done([task_id for task_id, _ in candidates]):
+            print(f"✅ Story {task_id} marcada como concluída!")
 
         # Atualiza progresso
         print()
@@ -318,6 +270,7 @@ def cmd_check_context():
 def cmd_mark(task_id: str, force: bool = False):
     """Comando: Marca uma tarefa específica como concluída."""
     if mark_task_as_done(task_id, force):
+        print(f"✅ Story {task_id} marcada como concluída!")
         print()
         print("📊 Atualizando progresso...")
         progress_output = update_progress()
@@ -350,11 +303,13 @@ def cmd_commit_msg(commit_msg: str):
     # Auto-marca (sem perguntar, já que foi chamado via hook)
     for task_id, task_title in candidates:
         print(f"🔄 Auto-finish detectado: Story {task_id}")
-        if mark_task_as_done(task_id, force=False):
-            print(f"✅ Story {task_id} marcada como concluída automaticamente!")
+    marked = mark_tasks_as_done([task_id for task_id, _ in candidates], force=False)
+    for task_id in marked:
+        print(f"✅ Story {task_id} marcada como concluída automaticamente!")
 
     # Atualiza progresso
-    update_progress()
+    if marked:
+        update_progress()
 
 
 def main():
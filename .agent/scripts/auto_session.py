@@ -17,6 +17,8 @@ from pathlib import Path
 
 SESSION_FILE = Path(".agent/.session_state.json")
 
+sys.path.insert(0, str(Path(__file__).parent))
+
 
 def get_agent_source() -> str:
     """Detecta qual agente está executando."""
@@ -74,6 +76,15 @@ def get_project_name() -> str:
     return cwd.name
 
 
+def index_daily_log(log_file: Path):
+    """Atualiza o índice de atividade por Epic (usado pelo sync_tracker)."""
+    try:
+        from activity_index import index_log_file
+        index_log_file(log_file)
+    except Exception as e:
+        print(f"⚠️ Índice de atividade não atualizado: {e}")
+
+
 def update_daily_log_start(session: dict):
     """Atualiza o log diário com início de sessão."""
     logs_dir = find_logs_dir()
@@ -123,6 +134,7 @@ def update_daily_log_start(session: dict):
 """
 
     log_file.write_text(content, encoding='utf-8')
+    index_daily_log(log_file)
 
 
 def update_daily_log_end(session: dict):
@@ -159,6 +171,7 @@ def update_daily_log_end(session: dict):
         )
 
         log_file.write_text(content, encoding='utf-8')
+        index_daily_log(log_file)
     else:
         print(f"⚠️ Sessão iniciada às {session['start_time']} não encontrada no log")
 
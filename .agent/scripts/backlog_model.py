@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""
+Backlog Model - Inove AI Framework
+Parser único do BACKLOG.md, compartilhado por progress_tracker, finish_task,
+auto_finish, validate_traceability, sync_tracker e dashboard.
+
+O markdown é tokenizado uma vez, linha a linha, em uma árvore:
+
+    Epic   (## Epic N: Nome [OWNER: agente])
+     └─ Story  (### Story N.N: Título  |  - [ ] **Story N.N:** Título)
+         └─ Task   (qualquer checkbox: critérios de aceite, subtarefas)
+
+Cada nó guarda o número da linha (0-based) e o offset em caracteres, então
+quem edita o arquivo vai direto na linha certa sem novo regex no conteúdo
+(Backlog.check + save_backlog: troca só o checkbox e grava atomicamente).
+
+Cache:
+    - local do backlog achado via rglob em docs/
+    - em memória, por (tamanho, mtime) do arquivo
+    - em disco (.agent/cache/backlog.json), por sha1 do conteúdo, para os
+      vários processos disparados pelo mesmo commit (hooks); guarda só os
+      MAX_CACHED_FILES backlogs mais recentes
+
+Uso:
+    from backlog_model import find_backlog, load_backlog
+
+    model = load_backlog(find_backlog())
+    for epic in model.epics:
+        print(epic.name, epic.done, epic.total)
+"""
+
+import os
+import re
+import json
+import shutil
+import hashlib
+from bisect import bisect_right
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+CACHE_FILE = Path(".agent") / "cache" / "backlog.json"
+MODEL_VERSION = 1
+# Backlogs lembrados no cache em disco (os mais recentes; arquivos apagados saem)
+MAX_CACHED_FILES = 8
+
+EPIC_RE = re.compile(
+    r"^##\s+Epic\s+(\d+):\s+(.+?)\s*(?:\[OWNER:\s*(.+?)\])?\s*(?:[✅🔴⏳].*)?$"
+)
+# ### Story 1.1: Título  |  **Story 1.1**: Título
+STORY_RE = re.compile(
+    r"^(?:#{2,3}\s*|\*\*)Story\s+(\d+\.\d+)(?:\*\*)?[:\s]+(.+)$", re.IGNORECASE
+)
+# - [ ] texto  |  - [x] texto (uma posição dentro dos colchetes)
+CHECKBOX_RE = re.compile(r"^(\s*)-\s*\[([ xX])\]\s*(.*)$")
+# **Story 3.1:** / **Epic 2:** / **1.1.1:** no início do texto do checkbox
+TASK_ID_RE = re.compile(
+    r"^\*\*(?:(Story|Epic|Task)\s+)?(\d+(?:\.\d+)*)(?::\*\*|\*\*:?)\s*(.*)$", re.IGNORECASE
+)
+
+
+@dataclass
+class Task:
+    """Uma linha de checkbox."""
+    line: int
+    offset: int
+    indent: int
+    done: bool
+    text: str
+    task_id: Optional[str] = None   # "3.1", "1.1.1"
+    kind: Optional[str] = None      # "Story", "Epic", "Task" ou None (só o ID)
+    title: str = ""
+
+
+@dataclass
+class Story:
+    id: str                          # "1.1"
+    title: str
+    line: int
+    end: int                         # linha final (exclusiva) da seção
+    heading: bool                    # True: ### Story / **Story**; False: checkbox
+    tasks: List[Task] = field(default_factory=list)
+
+
+@dataclass
+class Epic:
+    number: str
+    name: str
+    owner: Optional[str]
+    line: int
+    end: int                         # até o próximo Epic ou fim do arquivo
+    stories: List[Story] = field(default_factory=list)
+    tasks: List[Task] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return len(self.tasks)
+
+    @property
+    def done(self) -> int:
+        return sum(1 for t in self.tasks if t.done)
+
+    @property
+    def percent(self) -> float:
+        return (self.done / self.total * 100) if self.total > 0 else 0
+
+
+class Backlog:
+    """Árvore Epic -> Story -> Task de um BACKLOG.md."""
+
+    def __init__(self, lines: List[str], epics: List[Epic], stories: List[Story],
+                 tasks: List[Task], path: Optional[Path] = None, digest: str = ""):
+        self.lines = lines
+        self.epics = epics
+        self.stories = stories
+        self.tasks = tasks
+        self.path = path
+        self.digest = digest
+        self._link()
+
+    def _link(self):
+        """
+        Liga tasks/stories aos nós pai numa passada só: as três listas estão
+        em ordem de linha e os intervalos de Epics (e de Stories) não se
+        sobrepõem, então basta avançar um ponteiro por lista.
+        """
+        for epic in self.epics:
+            epic.stories, epic.tasks = [], []
+        for story in self.stories:
+            story.tasks = []
+
+        e = 0
+        for story in self.stories:
+            while e < len(self.epics) and self.epics[e].end <= story.line:
+                e += 1
+            if e < len(self.epics) and self.epics[e].line < story.line:
+                self.epics[e].stories.append(story)
+
+        e = s = 0
+        for task in self.tasks:
+            while e < len(self.epics) and self.epics[e].end <= task.line:
+                e += 1
+            if e < len(self.epics) and self.epics[e].line < task.line:
+                self.epics[e].tasks.append(task)
+            while s < len(self.stories) and self.stories[s].end <= task.line:
+                s += 1
+            if s < len(self.stories) and self.stories[s].line < task.line:
+                self.stories[s].tasks.append(task)
+
+        self._epic_lines = [epic.line for epic in self.epics]
+        self._epics_by_number = {e.number: e for e in self.epics}
+        self._stories_by_id = {}
+        for story in self.stories:
+            self._stories_by_id.setdefault(story.id, story)
+
+    @property
+    def content(self) -> str:
+        return "".join(self.lines)
+
+    def epic(self, number: str) -> Optional[Epic]:
+        return self._epics_by_number.get(str(number))
+
+    def story(self, story_id: str) -> Optional[Story]:
+        return self._stories_by_id.get(normalize_id(story_id))
+
+    def epic_of(self, line: int) -> Optional[Epic]:
+        i = bisect_right(self._epic_lines, line) - 1
+        if i >= 0 and line < self.epics[i].end:
+            return self.epics[i]
+        return None
+
+    def section(self, start: int, end: int) -> str:
+        return "".join(self.lines[start:end])
+
+    def find_tasks(self, task_id: str, pending_only: bool = True) -> List[Task]:
+        """Checkboxes com esse ID (**Story 3.1:**, **Epic 1:** ou **3.1:**)."""
+        clean_id = normalize_id(task_id)
+        return [t for t in self.tasks
+                if t.task_id == clean_id and t.kind in (None, "Story", "Epic")
+                and not (pending_only and t.done)]
+
+    def pending_tasks(self) -> List[Task]:
+        """Checkboxes pendentes de Story/Epic (ex: - [ ] **Story 3.1:** Título)."""
+        return [t for t in self.tasks
+                if not t.done and t.kind in ("Story", "Epic") and t.task_id]
+
+    def check(self, task: Task):
+        """Marca só o checkbox dessa task, no modelo em memória (mesmo tamanho de linha)."""
+        raw = self.lines[task.line]
+        m = CHECKBOX_RE.match(raw.rstrip("\r\n"))
+        if not m:
+            raise ValueError(f"Linha {task.line + 1} não é um checkbox")
+        pos = m.start(2)
+        self.lines[task.line] = raw[:pos] + "x" + raw[pos + 1:]
+        task.done = True
+
+    def to_dict(self) -> dict:
+        return {
+            "epics": [{k: v for k, v in asdict(e).items() if k not in ("stories", "tasks")}
+                      for e in self.epics],
+            "stories": [{k: v for k, v in asdict(s).items() if k != "tasks"}
+                        for s in self.stories],
+            "tasks": [asdict(t) for t in self.tasks],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, lines: List[str], path: Optional[Path] = None,
+                  digest: str = "") -> "Backlog":
+        return cls(
+            lines,
+            [Epic(**e) for e in data["epics"]],
+            [Story(**s) for s in data["stories"]],
+            [Task(**t) for t in data["tasks"]],
+            path, digest,
+        )
+
+
+def normalize_id(task_id: str) -> str:
+    """'Story 3.1' / 'story-3.1' / '3.1' -> '3.1'"""
+    return re.sub(r"^(?:story|epic|task)[\s-]*", "", task_id.strip(), flags=re.IGNORECASE).strip()
+
+
+# IDs citados em texto livre (commits, logs de sessão)
+TEXT_ID_PATTERNS = [
+    re.compile(r'(?:Story|Epic|Task)\s+(\d+(?:\.\d+)?)', re.IGNORECASE),  # Story 3.1, Epic 2
+    re.compile(r'(?:Story|Epic|Task)-(\d+(?:\.\d+)?)', re.IGNORECASE),     # Story-3.1
+    re.compile(r'#(\d+\.\d+)'),                                           # #3.1
+    re.compile(r'\((\d+\.\d+)\)'),                                        # (3.1)
+]
+
+
+def extract_task_ids_from_text(text: str) -> List[str]:
+    """
+    Extrai IDs de tarefas mencionadas em texto.
+
+    Formatos reconhecidos:
+        - Story 3.1
+        - Epic 2
+        - Task 3.1
+        - #3.1
+        - feat(Story-3.1)
+    """
+    task_ids = set()
+    for pattern in TEXT_ID_PATTERNS:
+        for match in pattern.finditer(text):
+            task_ids.add(match.group(1))
+    return sorted(task_ids)
+
+
+def cache_path(root: Path = None) -> Path:
+    """Cache em disco do projeto em `root` (padrão: diretório atual)."""
+    return (Path(root) if root else Path(".")) / CACHE_FILE
+
+
+def find_backlog(root: Path = None) -> Optional[Path]:
+    """
+    Procura pelo arquivo de backlog em locais conhecidos.
+
+    Os caminhos fixos custam um stat cada; o rglob em docs/ (que pode ter
+    milhares de relatórios) só roda quando nenhum deles existe e o local
+    lembrado no cache não é mais válido.
+    """
+    root = Path(root) if root else Path(".")
+    docs = root / "docs"
+    for candidate in (docs / "BACKLOG.md", root / "BACKLOG.md", docs / "planning" / "BACKLOG.md"):
+        if candidate.exists():
+            return candidate
+
+    cache_file = cache_path(root)
+    remembered = _load_disk_cache(cache_file).get("location")
+    if remembered and (root / remembered).is_file():
+        return root / remembered
+
+    if docs.is_dir():
+        for name in ("global-task-list.md", "task-list.md"):
+            found = next(docs.rglob(name), None)
+            if found:
+                data = _load_disk_cache(cache_file) or {"version": MODEL_VERSION}
+                data["location"] = str(found.relative_to(root))
+                _write_disk_cache(data, cache_file)
+                return found
+    return None
+
+
+def parse(content: str, path: Optional[Path] = None) -> Backlog:
+    """Tokeniza o markdown em uma passada só."""
+    lines = content.splitlines(keepends=True)
+    epics: List[Epic] = []
+    stories: List[Story] = []
+    tasks: List[Task] = []
+
+    offset = 0
+    for idx, raw in enumerate(lines):
+        line = raw.rstrip("\r\n")
+        start = offset
+        offset += len(raw)
+
+        if line.startswith("#"):
+            m = EPIC_RE.match(line)
+            if m:
+                if epics:
+                    epics[-1].end = idx
+                epics.append(Epic(m.group(1), m.group(2).strip(),
+                                  m.group(3).strip() if m.group(3) else None, idx, len(lines)))
+                _close_story(stories, idx)
+                continue
+            if line.startswith("## ") or line.startswith("# "):
+                _close_story(stories, idx)
+
+        m = STORY_RE.match(line)
+        if m:
+            _close_story(stories, idx)
+            stories.append(Story(m.group(1), m.group(2).strip().replace("**", ""),
+                                 idx, len(lines), True))
+            continue
+
+        m = CHECKBOX_RE.match(line)
+        if not m:
+            continue
+        indent, mark, text = m.groups()
+        task = Task(idx, start, len(indent), mark != " ", text)
+        idm = TASK_ID_RE.match(text)
+        if idm:
+            task.kind = idm.group(1).capitalize() if idm.group(1) else None
+            task.task_id = idm.group(2)
+            task.title = idm.group(3).strip()
+        tasks.append(task)
+
+        # Story em formato checkbox: a seção vai até o próximo checkbox de Story
+        if task.kind == "Story" and "." in task.task_id:
+            _close_story(stories, idx)
+            stories.append(Story(task.task_id, task.title.replace("**", ""),
+                                 idx, len(lines), False))
+
+    return Backlog(lines, epics, stories, tasks, path,
+                   hashlib.sha1(content.encode("utf-8")).hexdigest())
+
+
+def _close_story(stories: List[Story], idx: int):
+    if stories and stories[-1].end > idx:
+        stories[-1].end = idx
+
+
+# ------------------------------------------------------------------
+# Cache
+# ------------------------------------------------------------------
+
+_MEMO: Dict[str, tuple] = {}
+
+
+def _load_disk_cache(cache_file: Path) -> dict:
+    try:
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+        return data if data.get("version") == MODEL_VERSION else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_disk_cache(data: dict, cache_file: Path):
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass
+
+
+def _save_disk_cache(key: str, model: Backlog, cache_file: Path):
+    data = _load_disk_cache(cache_file) or {"version": MODEL_VERSION}
+    files = data.get("files", {})
+    files.pop(key, None)
+    files[key] = {"sha1": model.digest, "model": model.to_dict()}
+    # Mais recente por último: descarta os apagados e os mais antigos
+    kept = [k for k in files if k == key or Path(k).exists()][-MAX_CACHED_FILES:]
+    data["files"] = {k: files[k] for k in kept}
+    _write_disk_cache(data, cache_file)
+
+
+def load_backlog(path: Path, root: Path = None) -> Backlog:
+    """
+    Modelo do backlog em `path`, reaproveitando o cache quando o arquivo
+    não mudou (mtime/tamanho em memória, sha1 do conteúdo em disco).
+    `root` é o projeto cujo cache em disco é usado, como em find_backlog.
+    """
+    path = Path(path)
+    cache_file = cache_path(root)
+    key = str(path.resolve())
+    st = path.stat()
+    memo = _MEMO.get(key)
+    if memo and memo[0] == (st.st_size, st.st_mtime_ns):
+        return memo[1]
+
+    content = path.read_text(encoding="utf-8")
+    digest = hashlib.sha1(content.encode("utf-8")).hexdigest()
+    cached = _load_disk_cache(cache_file).get("files", {}).get(key)
+    model = None
+    if cached and cached.get("sha1") == digest:
+        try:
+            model = Backlog.from_dict(cached["model"], content.splitlines(keepends=True),
+                                      path, digest)
+        except (KeyError, TypeError):
+            model = None
+    if model is None:
+        model = parse(content, path)
+        _save_disk_cache(key, model, cache_file)
+
+    _MEMO[key] = ((st.st_size, st.st_mtime_ns), model)
+    return model
+
+
+def save_backlog(model: Backlog, path: Path = None) -> Path:
+    """
+    Grava o modelo de forma atômica (arquivo temporário + rename no mesmo
+    diretório) e mantém o cache em memória válido para o novo conteúdo.
+    """
+    path = Path(path or model.path)
+    content = model.content
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(content)
+        try:
+            shutil.copymode(path, tmp)
+        except OSError:
+            pass
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+    model.digest = hashlib.sha1(content.encode("utf-8")).hexdigest()
+    st = path.stat()
+    _MEMO[str(path.resolve())] = ((st.st_size, st.st_mtime_ns), model)
+    return path
+
+
+def invalidate(path: Path):
+    """Descarta o modelo em memória (após editar o arquivo)."""
+    _MEMO.pop(str(Path(path).resolve()), None)
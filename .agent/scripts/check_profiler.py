@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Check Profiler - Antigravity Kit
+=================================
+
+Timing instrumentation for verify_all.py. Records, per check:
+    - start/end (wall clock, monotonic)
+    - CPU time (user + sys, this process and its children)
+    - peak RSS (MB) of this process while the check ran, sampled from
+      /proc/self/statm by a background thread (Linux), and how much the
+      check raised it over its starting RSS
+    - peak RSS of the check's child processes (--isolated, tools a check
+      spawns), sampled the same way from /proc/<pid>/task/*/children;
+      getrusage's ru_maxrss cannot be used per check: it is a lifetime
+      high-water mark, and a forked child inherits the parent's
+    - output size (bytes of captured stdout + stderr)
+
+Exports a Chrome trace (open in chrome://tracing or https://ui.perfetto.dev)
+and a critical-path summary: the longest chain of checks that did not
+overlap in time (with sequential checks that is all of them), and whether
+each check is CPU-bound (optimize) or waiting on I/O/subprocesses
+(parallelize).
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+from bisect import bisect_right
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import resource  # POSIX only
+except ImportError:
+    resource = None
+
+TRACE_FILE = Path(".agent") / "logs" / "verify_all.trace.json"
+
+STATM = Path("/proc/self/statm")
+SAMPLE_INTERVAL = 0.02  # seconds between RSS samples
+
+
+def _page_mb() -> float:
+    try:
+        return os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        return 0.0
+
+
+PAGE_MB = _page_mb()
+
+
+def current_rss_mb(statm: Path = STATM) -> Optional[float]:
+    """Resident set size of a process right now (None without /proc)."""
+    try:
+        return int(statm.read_text().split()[1]) * PAGE_MB or None
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def children_rss_mb(pid: int) -> Optional[float]:
+    """Summed RSS of all descendants of pid (None without /proc children lists)."""
+    total, found, stack = 0.0, False, [pid]
+    while stack:
+        proc = Path("/proc") / str(stack.pop())
+        try:
+            tasks = list((proc / "task").iterdir())
+        except OSError:
+            continue
+        for task in tasks:
+            try:
+                kids = (task / "children").read_text().split()
+            except OSError:
+                continue
+            found = True
+            for kid in kids:
+                total += current_rss_mb(Path("/proc") / kid / "statm") or 0.0
+                stack.append(int(kid))
+    return total if found else None
+
+
+class RssSampler:
+    """Peak RSS of this process and of its children between start() and stop(), by polling."""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        self.pid = os.getpid()
+        self.start_mb = current_rss_mb()
+        self.peak_mb = self.start_mb
+        self.child_peak_mb: Optional[float] = None
+        self._done = threading.Event()
+        self._thread = None
+        if self.start_mb is not None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _sample(self):
+        rss = current_rss_mb()
+        if rss is not None and rss > self.peak_mb:
+            self.peak_mb = rss
+        kids = children_rss_mb(self.pid)
+        if kids and kids > (self.child_peak_mb or 0.0):
+            self.child_peak_mb = kids
+
+    def _run(self):
+        while not self._done.wait(self.interval):
+            self._sample()
+
+    def stop(self) -> Optional[float]:
+        if self._thread is not None:
+            self._done.set()
+            self._thread.join()
+            self._sample()
+        return self.peak_mb
+
+
+def _usage() -> Dict[str, float]:
+    """CPU seconds (this process + children) and this process's lifetime max RSS (MB)."""
+    if resource is None:
+        t = os.times()
+        return {"cpu": t.user + t.system + t.children_user + t.children_system, "max_rss": 0.0}
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    kids = resource.getrusage(resource.RUSAGE_CHILDREN)
+    # ru_maxrss is KB on Linux, bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return {
+        "cpu": own.ru_utime + own.ru_stime + kids.ru_utime + kids.ru_stime,
+        "max_rss": own.ru_maxrss / scale,
+    }
+
+
+def _mb(value: Optional[float]) -> Optional[float]:
+    return round(value, 1) if value is not None else None
+
+
+class CheckProfiler:
+    def __init__(self):
+        self.origin = time.monotonic()
+        self.spans: List[dict] = []
+
+    def start(self, name: str, category: str) -> dict:
+        usage = _usage()
+        return {"name": name, "category": category, "start": time.monotonic(),
+                "cpu0": usage["cpu"], "sampler": RssSampler()}
+
+    def end(self, span: dict, result: dict) -> dict:
+        sampler = span["sampler"]
+        peak = sampler.stop()
+        usage = _usage()
+        end = time.monotonic()
+        output_bytes = len((result.get("output") or "").encode("utf-8", "replace")) + \
+            len((result.get("error") or "").encode("utf-8", "replace"))
+        record = {
+            "name": span["name"],
+            "category": span["category"],
+            "start": round(span["start"] - self.origin, 4),
+            "end": round(end - self.origin, 4),
+            "wall": round(end - span["start"], 4),
+            "cpu": round(usage["cpu"] - span["cpu0"], 4),
+            "peak_rss_mb": _mb(peak),
+            "rss_growth_mb": _mb(peak - sampler.start_mb) if peak is not None else None,
+            "child_peak_rss_mb": _mb(sampler.child_peak_mb),
+            "process_max_rss_mb": _mb(usage["max_rss"]),  # lifetime high-water mark
+            "output_bytes": output_bytes,
+            "passed": bool(result.get("passed")),
+            "cached": bool(result.get("cached")),
+            "skipped": bool(result.get("skipped")),
+        }
+        self.spans.append(record)
+        result["profile"] = record
+        return record
+
+    def chrome_trace(self) -> dict:
+        """Complete ('X') events, one row per category, times in microseconds."""
+        tids = {}
+        events = []
+        for span in self.spans:
+            tid = tids.setdefault(span["category"], len(tids) + 1)
+            events.append({
+                "name": span["name"],
+                "cat": span["category"],
+                "ph": "X",
+                "ts": int(span["start"] * 1e6),
+                "dur": int(span["wall"] * 1e6),
+                "pid": 1,
+                "tid": tid,
+                "args": {k: span[k] for k in ("cpu", "peak_rss_mb", "rss_growth_mb", "child_peak_rss_mb",
+                                              "output_bytes", "passed", "cached", "skipped")},
+            })
+        for category, tid in tids.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": tid,
+                           "args": {"name": category}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_trace(self, path: Path) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.chrome_trace(), indent=2), encoding="utf-8")
+        return path
+
+    def critical_path(self) -> dict:
+        """
+        Longest chain of checks that did not overlap in time (weighted
+        interval scheduling over the recorded spans). Checks run one after
+        another today, so the chain is every check ("sequential": True); if
+        checks ever run concurrently, only the chain bounds total wall time.
+
+        cpu/wall near 1 means the check is CPU-bound in this process; near 0
+        means it waits (subprocess, I/O, network) and is a candidate to run
+        in parallel with others.
+        """
+        if not self.spans:
+            return {"total_wall": 0.0, "bound_by": None, "sequential": True, "path": [], "checks": []}
+        total = max(s["end"] for s in self.spans) - min(s["start"] for s in self.spans)
+
+        by_end = sorted(self.spans, key=lambda s: s["end"])
+        ends = [s["end"] for s in by_end]
+        best = [0.0] * (len(by_end) + 1)  # best[i]: longest chain within the first i spans
+        for i, span in enumerate(by_end, 1):
+            prev = bisect_right(ends, span["start"], 0, i - 1)
+            best[i] = max(best[i - 1], best[prev] + span["wall"])
+        path = []
+        i = len(by_end)
+        while i > 0:
+            span = by_end[i - 1]
+            prev = bisect_right(ends, span["start"], 0, i - 1)
+            if best[i] == best[i - 1]:
+                i -= 1
+            else:
+                path.append(span)
+                i = prev
+        path.reverse()
+        on_path = {id(s) for s in path}
+
+        ranked = sorted(self.spans, key=lambda s: -s["wall"])
+        checks = [{
+            "name": s["name"],
+            "wall": s["wall"],
+            "share": round(s["wall"] / total, 3) if total else 0.0,
+            "on_path": id(s) in on_path,
+            "cpu_ratio": round(s["cpu"] / s["wall"], 2) if s["wall"] else 0.0,
+            "peak_rss_mb": s["peak_rss_mb"],
+            "rss_growth_mb": s["rss_growth_mb"],
+            "child_peak_rss_mb": s["child_peak_rss_mb"],
+        } for s in ranked]
+        return {
+            "total_wall": round(total, 3),
+            "bound_by": max(path, key=lambda s: s["wall"])["name"],
+            "sequential": len(path) == len(self.spans),
+            "path": [s["name"] for s in path],
+            "checks": checks,
+        }
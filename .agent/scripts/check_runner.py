@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+In-Process Check Runner - Antigravity Kit
+==========================================
+
+Loads skill scripts once and calls their importable entry point
+
+    run(project_path, **opts) -> dict   # always has a "passed" key
+
+instead of starting a fresh interpreter per check. Used by verify_all.py
+and checklist.py; scripts without run() fall back to a subprocess.
+
+A report with "skipped": true (plus a "message") means the check had
+nothing to inspect; orchestrators show it as skipped, never as a pass.
+
+Modules stay loaded for the life of the orchestrator, so shared imports
+(import_graph, regex tables, ...) are paid for once per verification.
+"""
+
+import io
+import sys
+import json
+import importlib.util
+import traceback
+from contextlib import redirect_stdout, redirect_stderr
+from pathlib import Path
+from typing import Dict, Optional
+
+_MODULES: Dict[Path, Optional[object]] = {}
+
+
+def load_check(script_path: Path):
+    """Import a skill script once. Returns None when it has no run() API."""
+    script_path = Path(script_path).resolve()
+    if script_path in _MODULES:
+        return _MODULES[script_path]
+
+    module = None
+    name = script_path.stem
+    # Registered under its real name with its dir on sys.path, so process
+    # pools inside the check can re-import it in their workers
+    if str(script_path.parent) not in sys.path:
+        sys.path.insert(0, str(script_path.parent))
+    try:
+        spec = importlib.util.spec_from_file_location(name, script_path)
+        candidate = importlib.util.module_from_spec(spec)
+        sys.modules[name] = candidate
+        spec.loader.exec_module(candidate)
+        if callable(getattr(candidate, "run", None)):
+            module = candidate
+    except Exception:
+        sys.modules.pop(name, None)
+        module = None
+
+    _MODULES[script_path] = module
+    return module
+
+
+def run_in_process(script_path: Path, project_path: str, **opts) -> Optional[dict]:
+    """
+    Call the script's run() with stdout/stderr captured.
+
+    Returns None when the script has no run() API (caller should use a
+    subprocess), else dict with keys: passed, skipped, result, output, error
+    """
+    module = load_check(script_path)
+    if module is None:
+        return None
+
+    out, err = io.StringIO(), io.StringIO()
+    result = {}
+    try:
+        with redirect_stdout(out), redirect_stderr(err):
+            result = module.run(project_path, **opts) or {}
+        passed = bool(result.get("passed", False))
+    except SystemExit as e:
+        passed = e.code in (0, None)
+    except Exception:
+        passed = False
+        err.write(traceback.format_exc())
+
+    output = out.getvalue()
+    if result:
+        output += "\n" + json.dumps(result, indent=2, default=str)
+    return {
+        "passed": passed,
+        "skipped": bool(result.get("skipped")),
+        "result": result,
+        "output": output,
+        "error": err.getvalue() or result.get("error", ""),
+    }
+
+
+def skip_message(stdout: str) -> Optional[str]:
+    """
+    For subprocess runs: the skip message from the JSON report the script
+    prints last (print("\\n" + json.dumps(output, indent=2))), else None.
+    """
+    start = stdout.rfind("\n{\n")
+    if start == -1:
+        return None
+    try:
+        report = json.loads(stdout[start:])
+    except ValueError:
+        return None
+    if isinstance(report, dict) and report.get("skipped"):
+        return report.get("message", "")
+    return None
@@ -9,6 +9,7 @@ Use this for incremental validation during development.
 Usage:
     python scripts/checklist.py .                    # Run core checks
     python scripts/checklist.py . --url <URL>        # Include performance checks
+    python scripts/checklist.py . --no-cache         # Rerun checks that passed on an unchanged tree
 
 Priority Order:
     P0: Security Scan (vulnerabilities, secrets)
@@ -25,6 +26,11 @@ import subprocess
 import argparse
 from pathlib import Path
 from typing import List, Tuple, Optional
+from datetime import datetime
+
+sys.path.insert(0, str(Path(__file__).parent))
+from result_cache import ResultCache
+from check_runner import run_in_process, skip_message
 
 # ANSI colors for terminal output
 class Colors:
@@ -73,18 +79,54 @@ def check_script_exists(script_path: Path) -> bool:
     """Check if script file exists"""
     return script_path.exists() and script_path.is_file()
 
-def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None) -> dict:
+def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None,
+               cache: Optional[ResultCache] = None, isolated: bool = False) -> dict:
     """
     Run a validation script and capture results
     
+    A pass stored in the result cache is reused when the check's script and
+    input files are unchanged. Scripts exposing run() are called in-process
+    unless isolated is set.
+    
     Returns:
-        dict with keys: name, passed, output, skipped
+        dict with keys: name, passed, output, skipped, duration, cached
     """
     if not check_script_exists(script_path):
         print_warning(f"{name}: Script not found, skipping")
         return {"name": name, "passed": True, "output": "", "skipped": True}
     
+    key = cache.key(name, script_path) if cache else None
+    hit = cache.get(key) if cache else None
+    if hit:
+        print_success(f"{name}: PASSED (cached, {hit['duration']:.1f}s)")
+        return {"name": name, "passed": True, "output": "", "skipped": False,
+                "cached": True, "duration": hit["duration"]}
+    
     print_step(f"Running: {name}")
+    start_time = datetime.now()
+    
+    inproc = None if isolated else run_in_process(script_path, project_path, url=url)
+    if inproc is not None:
+        if inproc["skipped"]:
+            print_warning(f"{name}: SKIPPED - {inproc['result'].get('message', '')}")
+        elif inproc["passed"]:
+            print_success(f"{name}: PASSED")
+        else:
+            print_error(f"{name}: FAILED")
+            if inproc["error"]:
+                print(f"  Error: {inproc['error'][:200]}")
+        result = {
+            "name": name,
+            "passed": inproc["passed"],
+            "output": inproc["output"],
+            "error": inproc["error"],
+            "result": inproc["result"],
+            "skipped": inproc["skipped"],
+            "duration": (datetime.now() - start_time).total_seconds()
+        }
+        if cache:
+            cache.put(key, result)
+        return result
     
     # Build command
     cmd = ["python", str(script_path), project_path]
@@ -101,21 +143,29 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
         )
         
         passed = result.returncode == 0
+        skip = skip_message(result.stdout) if passed else None
+        duration = (datetime.now() - start_time).total_seconds()
         
-        if passed:
+        if skip is not None:
+            print_warning(f"{name}: SKIPPED - {skip}")
+        elif passed:
             print_success(f"{name}: PASSED")
         else:
             print_error(f"{name}: FAILED")
             if result.stderr:
                 print(f"  Error: {result.stderr[:200]}")
         
-        return {
+        result = {
             "name": name,
             "passed": passed,
             "output": result.stdout,
             "error": result.stderr,
-            "skipped": False
+            "skipped": skip is not None,
+            "duration": duration
         }
+        if cache:
+            cache.put(key, result)
+        return result
     
     except subprocess.TimeoutExpired:
         print_error(f"{name}: TIMEOUT (>5 minutes)")
@@ -148,7 +198,8 @@ def print_summary(results: List[dict]):
         else:
             status = f"{Colors.RED}❌{Colors.ENDC}"
         
-        print(f"{status} {r['name']}")
+        suffix = f" (cached, {r['duration']:.1f}s)" if r.get("cached") else ""
+        print(f"{status} {r['name']}{suffix}")
     
     print()
     
@@ -167,11 +218,14 @@ def main():
 Examples:
   python scripts/checklist.py .                      # Core checks only
   python scripts/checklist.py . --url http://localhost:3000  # Include performance
+  python scripts/checklist.py . --no-cache                   # Ignore cached passes
         """
     )
     parser.add_argument("project", help="Project path to validate")
     parser.add_argument("--url", help="URL for performance checks (lighthouse, playwright)")
     parser.add_argument("--skip-performance", action="store_true", help="Skip performance checks even if URL provided")
+    parser.add_argument("--no-cache", action="store_true", help="Rerun every check, ignoring cached passes")
+    parser.add_argument("--isolated", action="store_true", help="Run each check in its own subprocess")
     
     args = parser.parse_args()
     
@@ -186,17 +240,19 @@ Examples:
     print(f"URL: {args.url if args.url else 'Not provided (performance checks skipped)'}")
     
     results = []
+    cache = ResultCache(project_path, enabled=not args.no_cache)
     
     # Run core checks
     print_header("📋 CORE CHECKS")
     for name, script_path, required in CORE_CHECKS:
         script = project_path / script_path
-        result = run_script(name, script, str(project_path))
+        result = run_script(name, script, str(project_path), cache=cache, isolated=args.isolated)
         results.append(result)
         
         # If required check fails, stop
         if required and not result["passed"] and not result.get("skipped"):
             print_error(f"CRITICAL: {name} failed. Stopping checklist.")
+            cache.save()
             print_summary(results)
             sys.exit(1)
     
@@ -205,9 +261,11 @@ Examples:
         print_header("⚡ PERFORMANCE CHECKS")
         for name, script_path, required in PERFORMANCE_CHECKS:
             script = project_path / script_path
-            result = run_script(name, script, str(project_path), args.url)
+            result = run_script(name, script, str(project_path), args.url, cache, args.isolated)
             results.append(result)
     
+    cache.save()
+    
     # Print summary
     all_passed = print_summary(results)
     
@@ -14,6 +14,7 @@ from pathlib import Path
 
 # Importar módulos necessários
 sys.path.insert(0, str(Path(__file__).parent))
+import backlog_model
 import progress_tracker
 import session_logger
 import auto_session
@@ -61,8 +62,7 @@ def load_progress() -> dict:
             "next_tasks": []
         }
 
-    content = backlog_path.read_text(encoding="utf-8")
-    epics = progress_tracker.parse_backlog(content)
+    epics = progress_tracker.summarize(backlog_model.load_backlog(backlog_path))
 
     if not epics:
         return {
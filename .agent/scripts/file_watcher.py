@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+File Watcher - Inove AI Framework
+Observa arquivos e chama um callback quando mudam. Usado pelo modo --watch
+do progress_tracker e do validate_traceability.
+
+Backends:
+    - inotify (Linux, via ctypes, sem dependências): observa os diretórios
+      dos arquivos, então também pega editores que gravam via rename
+    - polling de (mtime, tamanho) nos demais sistemas
+
+Uso:
+    from file_watcher import watch
+
+    def on_change(changed: set[Path]):
+        print("mudou:", changed)
+
+    watch([Path("docs/BACKLOG.md")], on_change)   # bloqueia até Ctrl+C
+"""
+
+import os
+import sys
+import time
+import select
+import struct
+import ctypes
+import ctypes.util
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Set
+
+POLL_INTERVAL = 0.5
+# Agrupa rajadas de eventos (editor grava tmp + rename + chmod)
+DEBOUNCE = 0.05
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0x00000800
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_MODIFY
+EVENT_HEADER = struct.Struct("iIII")
+
+
+def _signature(path: Path):
+    try:
+        st = path.stat()
+        return st.st_mtime_ns, st.st_size
+    except OSError:
+        return None
+
+
+def _load_inotify():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class FileWatcher:
+    def __init__(self, paths: Iterable[Path], interval: float = POLL_INTERVAL):
+        self.paths = [Path(p).resolve() for p in paths]
+        self.interval = interval
+        self.signatures = {p: _signature(p) for p in self.paths}
+        self.fd: Optional[int] = None
+        self.dirs: Dict[int, Path] = {}
+        self._setup_inotify()
+
+    @property
+    def backend(self) -> str:
+        return "inotify" if self.fd is not None else "polling"
+
+    def _setup_inotify(self):
+        libc = _load_inotify()
+        if libc is None:
+            return
+        fd = libc.inotify_init1(IN_NONBLOCK)
+        if fd < 0:
+            return
+        for directory in {p.parent for p in self.paths}:
+            wd = libc.inotify_add_watch(fd, str(directory).encode(), WATCH_MASK)
+            if wd < 0:
+                os.close(fd)
+                self.dirs = {}
+                return
+            self.dirs[wd] = directory
+        self.fd = fd
+
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+    def _changed(self, candidates: Iterable[Path]) -> Set[Path]:
+        """Confirma pela assinatura (inotify também avisa de gravações sem mudança)."""
+        changed = set()
+        for path in candidates:
+            sig = _signature(path)
+            if sig != self.signatures.get(path):
+                self.signatures[path] = sig
+                changed.add(path)
+        return changed
+
+    def _read_events(self, timeout: float) -> Set[Path]:
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        time.sleep(DEBOUNCE)
+        touched = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, _, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0").decode(errors="replace")
+                offset += length
+                directory = self.dirs.get(wd)
+                if directory is not None and name:
+                    touched.add(directory / name)
+        return {p for p in self.paths if p in touched}
+
+    def wait(self, timeout: float = None) -> Set[Path]:
+        """Bloqueia até algum arquivo mudar (ou timeout) e devolve os que mudaram."""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if self.fd is not None:
+                changed = self._changed(self._read_events(
+                    self.interval if remaining is None else min(self.interval, remaining)))
+            else:
+                time.sleep(self.interval if remaining is None else min(self.interval, remaining))
+                changed = self._changed(self.paths)
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+
+def watch(paths: Iterable[Path], on_change: Callable[[Set[Path]], None],
+          interval: float = POLL_INTERVAL):
+    """Chama on_change(arquivos_alterados) a cada mudança, até Ctrl+C."""
+    watcher = FileWatcher(paths, interval)
+    print(f"👀 Observando {len(watcher.paths)} arquivo(s) via {watcher.backend}. Ctrl+C para sair.")
+    try:
+        while True:
+            changed = watcher.wait()
+            if changed:
+                on_change(changed)
+    except KeyboardInterrupt:
+        print("\n👋 Watch encerrado.")
+    finally:
+        watcher.close()
@@ -8,18 +8,11 @@ import datetime
 # Importar LockManager
 sys.path.insert(0, str(Path(__file__).parent))
 from lock_manager import LockManager
+from backlog_model import Backlog, find_backlog, invalidate, load_backlog, normalize_id, save_backlog
 
 def find_backlog_file(root_path: Path) -> Path | None:
     """Procura pelo arquivo de backlog."""
-    candidates = [
-        root_path / "docs" / "BACKLOG.md",
-        root_path / "BACKLOG.md",
-        root_path / "docs" / "planning" / "BACKLOG.md"
-    ]
-    for path in candidates:
-        if path.exists():
-            return path
-    return None
+    return find_backlog(root_path)
 
 def get_agent_source() -> str:
     """Detecta qual agente está executando."""
@@ -32,7 +25,7 @@ def get_agent_source() -> str:
     return 'antigravity'
 
 
-def check_epic_ownership(content: str, task_id: str, agent_source: str, force: bool) -> tuple[bool, str]:
+def check_epic_ownership(model: Backlog, task_id: str, agent_source: str, force: bool) -> tuple[bool, str]:
     """
     Verifica se o agente tem permissão para modificar a tarefa baseado no ownership do Epic.
 
@@ -40,29 +33,16 @@ def check_epic_ownership(content: str, task_id: str, agent_source: str, force: b
         (allow, message) - allow=True se pode prosseguir, message com aviso se houver
     """
     # Extrai Epic ID da task_id (ex: "3.1" -> Epic 3, "2.3" -> Epic 2)
-    clean_id = task_id.lower().replace("story", "").replace("epic", "").strip()
-
-    # Tenta extrair o número do Epic
-    epic_num_match = re.match(r'^(\d+)', clean_id)
+    epic_num_match = re.match(r'^(\d+)', normalize_id(task_id))
     if not epic_num_match:
         return True, ""  # Não conseguiu determinar Epic, permite
 
     epic_num = epic_num_match.group(1)
-
-    # Procura pelo Epic no conteúdo
-    epic_pattern = re.compile(
-        rf"^##\s+Epic\s+{epic_num}:\s+(.+?)\s*(?:\[OWNER:\s*(.+?)\])?\s*(?:[✅🔴⏳].*)?$",
-        re.MULTILINE
-    )
-
-    epic_match = epic_pattern.search(content)
-    if not epic_match:
-        return True, ""  # Epic não encontrado ou sem owner, permite
-
-    epic_owner = epic_match.group(2).strip() if epic_match.group(2) else None
+    epic = model.epic(epic_num)
+    epic_owner = epic.owner if epic else None
 
     if not epic_owner:
-        return True, ""  # Sem owner definido, permite
+        return True, ""  # Epic não encontrado ou sem owner, permite
 
     if epic_owner == agent_source:
         return True, ""  # Owner correto, permite
@@ -74,85 +54,99 @@ def check_epic_ownership(content: str, task_id: str, agent_source: str, force: b
         return False, f"⚠️ Epic {epic_num} pertence a '{epic_owner}'. Use --force para sobrescrever."
 
 
-def mark_task_complete(backlog_path: Path, task_id: str, force: bool = False) -> tuple[bool, str]:
-    """Marca uma tarefa como concluída no backlog."""
+def complete_tasks(model: Backlog, task_ids: list[str], agent_source: str,
+                   force: bool = False) -> list[tuple[str, bool, str]]:
+    """
+    Marca as tarefas no modelo em memória, uma linha por ID.
+
+    Para cada ID troca só o primeiro checkbox pendente correspondente,
+    preferindo "**Story 3.1:**"/"**Epic 1:**" a "**3.1:**".
+
+    Returns:
+        Lista de (task_id, sucesso, mensagem)
+    """
+    results = []
+    for task_id in task_ids:
+        allow, ownership_msg = check_epic_ownership(model, task_id, agent_source, force)
+        if not allow:
+            results.append((task_id, False, ownership_msg))
+            continue
+
+        matches = model.find_tasks(task_id)
+        if not matches:
+            results.append((task_id, False, f"Tarefa '{task_id}' não encontrada ou já concluída."))
+            continue
+
+        task = min(matches, key=lambda t: (t.kind is None, t.line))
+        model.check(task)
+        message = f"Tarefa '{task_id}' marcada como concluída em {model.path.name} (linha {task.line + 1})."
+        if ownership_msg:
+            message = f"{ownership_msg}\n{message}"
+        results.append((task_id, True, message))
+    return results
+
+
+def mark_tasks_complete(backlog_path: Path, task_ids: list[str],
+                        force: bool = False) -> list[tuple[str, bool, str]]:
+    """
+    Marca várias tarefas como concluídas com uma única aquisição do lock.
+
+    O backlog é parseado antes do lock (ou vem do cache); dentro do lock só
+    há um stat, a troca dos checkboxes e o rename atômico do arquivo.
+
+    Returns:
+        Lista de (task_id, sucesso, mensagem), na ordem de task_ids
+    """
     lock_mgr = LockManager()
     agent_source = get_agent_source()
 
-    # Tenta adquirir lock com espera
-    if not lock_mgr.wait_for_lock("backlog", agent_source, max_wait=30):
-        return False, "⏳ BACKLOG bloqueado por outro agente. Tente novamente em alguns instantes."
-
     try:
-        content = backlog_path.read_text(encoding="utf-8")
+        load_backlog(backlog_path)  # aquece o cache fora do lock
     except Exception as e:
-        lock_mgr.release_lock("backlog", agent_source)
-        return False, f"Erro ao ler o arquivo: {e}"
+        return [(task_id, False, f"Erro ao ler o arquivo: {e}") for task_id in task_ids]
 
-    # Verifica ownership (modo soft)
-    allow, ownership_msg = check_epic_ownership(content, task_id, agent_source, force)
-    if not allow:
-        lock_mgr.release_lock("backlog", agent_source)
-        return False, ownership_msg
-
-    # Regex flexível para IDs (ex: "3.1", "Story 3.1", "Epic 1")
-    # Tenta casar: "- [ ] **Story {task_id}:" ou "- [ ] **{task_id}:"
-    # O task_id pode vir como "3.1" ou "Story 3.1". Vamos limpar.
-    
-    clean_id = task_id.lower().replace("story", "").replace("epic", "").strip()
-    
-    # Padrões para tentar encontrar a task
-    # 1. "- [ ] **Story 3.1:**"
-    # 2. "- [ ] **Epic 1:**"
-    # 3. "- [ ] 3.1:"
-    
-    patterns = [
-        # Match exato de Story/Epic com ID
-        (rf"(-\s*\[)\s*(\]\s*\*\*(?:Story|Epic)\s+{re.escape(clean_id)}:)", r"\1x\2"),
-        # Match apenas do ID (caso o usuário mande "3.1" e no texto esteja "**3.1:**")
-        (rf"(-\s*\[)\s*(\]\s*\*\*{re.escape(clean_id)}:)", r"\1x\2"),
-    ]
-
-    new_content = content
-    found = False
-
-    for pattern, replacement in patterns:
-        # Verifica se existe antes de substituir para saber se achou
-        if re.search(pattern, new_content, re.IGNORECASE):
-            new_content = re.sub(pattern, replacement, new_content, flags=re.IGNORECASE)
-            found = True
-            # Se achou e substituiu, para (assume IDs únicos ou substitui todos se repetido, 
-            # mas o break aqui é para não aplicar múltiplos patterns na mesma linha se eles se sobreporem)
-            # Na verdade, re.sub substitui todas as ocorrências.
-            break
-
-    if not found:
-        lock_mgr.release_lock("backlog", agent_source)
-        return False, f"Tarefa '{task_id}' não encontrada ou já concluída."
+    # Tenta adquirir lock com espera
+    if not lock_mgr.wait_for_lock("backlog", agent_source, max_wait=30):
+        return [(task_id, False, "⏳ BACKLOG bloqueado por outro agente. Tente novamente em alguns instantes.")
+                for task_id in task_ids]
 
     try:
-        backlog_path.write_text(new_content, encoding="utf-8")
-        success_msg = f"Tarefa '{task_id}' marcada como concluída em {backlog_path.name}."
-        # Adiciona mensagem de ownership se houver
-        if ownership_msg:
-            success_msg = f"{ownership_msg}\n{success_msg}"
-        return True, success_msg
+        # Revalida pelo mtime: outro agente pode ter gravado antes do lock
+        model = load_backlog(backlog_path)
+        results = complete_tasks(model, task_ids, agent_source, force)
+        if any(ok for _, ok, _ in results):
+            try:
+                save_backlog(model, backlog_path)
+            except Exception as e:
+                invalidate(backlog_path)
+                return [(task_id, False, f"Erro ao salvar arquivo: {e}") if ok else (task_id, ok, msg)
+                        for task_id, ok, msg in results]
+        return results
     except Exception as e:
-        return False, f"Erro ao salvar arquivo: {e}"
+        invalidate(backlog_path)
+        return [(task_id, False, f"Erro ao ler o arquivo: {e}") for task_id in task_ids]
     finally:
         # Sempre libera o lock ao final
         lock_mgr.release_lock("backlog", agent_source)
 
+
+def mark_task_complete(backlog_path: Path, task_id: str, force: bool = False) -> tuple[bool, str]:
+    """Marca uma tarefa como concluída no backlog."""
+    _, success, message = mark_tasks_complete(backlog_path, [task_id], force)[0]
+    return success, message
+
+
 def main():
-    if len(sys.argv) < 2:
-        print("❌ Uso: python finish_task.py <TASK_ID> [--force]")
+    task_ids = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    if not task_ids:
+        print("❌ Uso: python finish_task.py <TASK_ID> [<TASK_ID> ...] [--force]")
         print("Exemplo: python finish_task.py '3.1'")
+        print("         python finish_task.py 3.1 3.2 4.1")
         print()
         print("Opções:")
         print("  --force    Força a marcação mesmo se houver aviso de ownership")
         sys.exit(1)
 
-    task_id = sys.argv[1]
     force = "--force" in sys.argv
     root = Path.cwd()
 
@@ -161,13 +155,15 @@ def main():
         print("❌ Arquivo BACKLOG.md não encontrado em ./docs ou ./docs/planning")
         sys.exit(1)
 
-    success, message = mark_task_complete(backlog_file, task_id, force)
+    results = mark_tasks_complete(backlog_file, task_ids, force)
 
-    if success:
-        print(f"✅ {message}")
-        # Opcional: Trigger logic could go here (e.g., run progress tracker)
-    else:
-        print(f"⚠️ {message}")
+    for _, success, message in results:
+        if success:
+            print(f"✅ {message}")
+        else:
+            print(f"⚠️ {message}")
+
+    if not all(success for _, success, _ in results):
         sys.exit(1)
 
 if __name__ == "__main__":
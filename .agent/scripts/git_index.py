@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Git Index - Inove AI Framework
+Índice local do git log para sync_tracker e auto_finish, sem rodar
+`git log --since=... -- <path>` (que percorre todo o histórico) a cada consulta.
+
+Arquivos (em .agent/cache/):
+    git_log.jsonl       um commit por linha, do mais antigo ao mais novo (append-only)
+    git_log.state.json  SHA do último commit indexado
+
+Atualização incremental: só `git log <último_sha>..HEAD` é lido. Se o último
+SHA deixou de ser ancestral de HEAD (rebase, reset), o índice é refeito.
+
+Cada entrada:
+    {"hash", "author", "date" (autor, ISO), "committed" (ISO), "message",
+     "files": [...], "task_ids": [...]}
+
+Uso:
+    from git_index import GitIndex
+
+    index = GitIndex()
+    index.commits_since(7, paths=["docs/BACKLOG.md"])   # mais novo primeiro
+    index.recent(5)                                     # últimos 5 commits
+
+    python .agent/scripts/git_index.py [--rebuild]
+"""
+
+import os
+import sys
+import json
+import subprocess
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+from backlog_model import extract_task_ids_from_text
+
+INDEX_DIR = Path(".agent") / "cache"
+INDEX_FILE = INDEX_DIR / "git_log.jsonl"
+STATE_FILE = INDEX_DIR / "git_log.state.json"
+
+RECORD_SEP = "\x1e"
+FIELD_SEP = "\x1f"
+LOG_FORMAT = f"{RECORD_SEP}%H{FIELD_SEP}%an{FIELD_SEP}%aI{FIELD_SEP}%cI{FIELD_SEP}%B{FIELD_SEP}"
+GIT_TIMEOUT = 60
+# O arquivo segue a ordem topológica, não a de data: um merge de branch antigo
+# anexa commits velhos depois de commits recentes. Só para de ler depois de
+# tantos commits seguidos anteriores ao corte.
+STOP_AFTER_OLDER = 200
+
+
+def _git(*args: str) -> Optional[str]:
+    try:
+        result = subprocess.run(["git", *args], capture_output=True, text=True, timeout=GIT_TIMEOUT)
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def _read_reverse(path: Path, block_size: int = 64 * 1024) -> Iterator[str]:
+    """Linhas do arquivo do fim para o começo, lendo em blocos."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        tail = b""
+        while position > 0:
+            step = min(block_size, position)
+            position -= step
+            f.seek(position)
+            chunk = f.read(step) + tail
+            lines = chunk.split(b"\n")
+            tail = lines.pop(0)
+            for line in reversed(lines):
+                if line.strip():
+                    yield line.decode("utf-8")
+        if tail.strip():
+            yield tail.decode("utf-8")
+
+
+class GitIndex:
+    def __init__(self, index_file: Path = INDEX_FILE, state_file: Path = STATE_FILE):
+        self.index_file = index_file
+        self.state_file = state_file
+        self._updated = False
+
+    def _load_state(self) -> dict:
+        try:
+            return json.loads(self.state_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self, state: dict):
+        tmp = self.state_file.with_suffix(".tmp")
+        tmp.write_text(json.dumps(state), encoding="utf-8")
+        os.replace(tmp, self.state_file)
+
+    def update(self, rebuild: bool = False) -> int:
+        """Indexa os commits novos desde o último SHA. Retorna quantos entraram."""
+        self._updated = True
+        head = (_git("rev-parse", "HEAD") or "").strip()
+        if not head:
+            return 0
+
+        state = {} if rebuild else self._load_state()
+        last = state.get("head")
+        if last == head and self.index_file.exists():
+            return 0
+
+        mode = "a"
+        if not last or not self.index_file.exists() or \
+                _git("merge-base", "--is-ancestor", last, head) is None:
+            # Primeira execução ou histórico reescrito: refaz do zero
+            mode, revs = "w", [head]
+        else:
+            revs = [f"{last}..{head}"]
+
+        output = _git("log", "--reverse", "--name-only", f"--pretty=format:{LOG_FORMAT}", *revs)
+        if output is None:
+            return 0
+
+        entries = []
+        for record in output.split(RECORD_SEP):
+            fields = record.split(FIELD_SEP)
+            if len(fields) < 6:
+                continue
+            sha, author, date, committed, message, files = fields[:6]
+            message = message.strip()
+            entries.append({
+                "hash": sha,
+                "author": author,
+                "date": date,
+                "committed": committed,
+                "message": message,
+                "files": [f for f in files.splitlines() if f.strip()],
+                "task_ids": extract_task_ids_from_text(message),
+            })
+
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.index_file, mode, encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        count = len(entries) + (0 if mode == "w" else state.get("count", 0))
+        self._save_state({"head": head, "count": count})
+        return len(entries)
+
+    def newest_first(self) -> Iterator[dict]:
+        """Entradas do índice, do commit mais novo para o mais antigo."""
+        if not self._updated:
+            self.update()
+        if not self.index_file.exists():
+            return
+        for line in _read_reverse(self.index_file):
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+    def recent(self, count: int = 1) -> List[dict]:
+        """Os `count` commits mais recentes."""
+        entries = []
+        for entry in self.newest_first():
+            if len(entries) >= count:
+                break
+            entries.append(entry)
+        return entries
+
+    def commits_since(self, days_back: int, paths: List[str] = None) -> List[dict]:
+        """
+        Commits dos últimos `days_back` dias (data do commit, como git log --since),
+        opcionalmente só os que tocaram algum dos `paths`. Para depois de
+        STOP_AFTER_OLDER commits seguidos mais antigos que o corte, sem ler o
+        resto do índice.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
+        wanted = set(paths or [])
+        commits = []
+        older = 0
+        for entry in self.newest_first():
+            if datetime.fromisoformat(entry["committed"]) < cutoff:
+                older += 1
+                if older >= STOP_AFTER_OLDER:
+                    break
+                continue
+            older = 0
+            if wanted and not wanted.intersection(entry["files"]):
+                continue
+            commits.append(entry)
+        return commits
+
+
+def main():
+    rebuild = "--rebuild" in sys.argv
+    index = GitIndex()
+    added = index.update(rebuild=rebuild)
+    state = index._load_state()
+    print(f"✅ Índice do git log: {state.get('count', 0)} commits ({added} novos)")
+    print(f"   {INDEX_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -32,23 +32,23 @@ cat > "$POST_COMMIT" << 'EOF'
 # Post-commit hook - Auto-update progress after commit
 # Detecta task IDs no commit message e marca como concluídas
 
-# Extrair task ID do commit message (ex: "feat(Story-3.1): ..." ou "fix(Epic-2): ...")
+# Extrair task IDs do commit message (ex: "feat(Story-3.1): ..." ou "fix(Epic-2): ...")
 COMMIT_MSG=$(git log -1 --pretty=%B)
-TASK_ID=$(echo "$COMMIT_MSG" | grep -oP '(?<=Story-|Epic-|story-|epic-)\d+\.?\d*' | head -1)
+TASK_IDS=$(echo "$COMMIT_MSG" | grep -oP '(?<=Story-|Epic-|story-|epic-)\d+\.?\d*' | sort -u | tr '\n' ' ')
 
-if [ -n "$TASK_ID" ]; then
+if [ -n "$TASK_IDS" ]; then
     echo ""
-    echo "🔄 Task detectada no commit: $TASK_ID"
+    echo "🔄 Tasks detectadas no commit: $TASK_IDS"
 
-    # Tenta marcar como concluída
-    if python .agent/scripts/finish_task.py "$TASK_ID" 2>/dev/null; then
-        echo "✅ Task $TASK_ID marcada como concluída"
-
-        # Atualiza progresso
-        python .agent/scripts/progress_tracker.py 2>/dev/null || true
+    # Marca todas em uma única chamada (um lock, uma gravação)
+    if python .agent/scripts/finish_task.py $TASK_IDS 2>/dev/null; then
+        echo "✅ Tasks marcadas como concluídas: $TASK_IDS"
     else
-        echo "⚠️ Não foi possível marcar task $TASK_ID (pode já estar concluída)"
+        echo "⚠️ Nem todas as tasks foram marcadas (podem já estar concluídas)"
     fi
+
+    # Atualiza progresso
+    python .agent/scripts/progress_tracker.py 2>/dev/null || true
 fi
 
 exit 0
@@ -5,18 +5,31 @@ Analisa o backlog de tarefas e gera uma barra de progresso visual.
 
 Uso:
     python .agent/scripts/progress_tracker.py [caminho_backlog]
+    python .agent/scripts/progress_tracker.py [caminho_backlog] --watch
 
 Se nenhum caminho for fornecido, procura automaticamente em:
     - docs/BACKLOG.md
+    - BACKLOG.md
+    - docs/planning/BACKLOG.md
     - docs/*/global-task-list.md
 """
 
-import re
 import sys
+import json
+import time
+import hashlib
 from datetime import datetime
 from pathlib import Path
 from typing import NamedTuple
 
+sys.path.insert(0, str(Path(__file__).parent))
+import backlog_model
+
+OUTPUT_PATH = Path("docs/progress-bar.md")
+EPIC_CACHE = Path(".agent") / "cache" / "progress_epics.json"
+# Linha com timestamp, ignorada ao comparar o relatório novo com o atual
+TIMESTAMP_PREFIX = "**Última Atualização:**"
+
 
 class Epic(NamedTuple):
     """Representa um Epic com suas métricas."""
@@ -32,16 +45,16 @@ class Epic(NamedTuple):
 
 def find_backlog() -> Path | None:
     """Procura pelo arquivo de backlog em locais conhecidos."""
-    candidates = [
-        Path("docs/BACKLOG.md"),
-        *Path("docs").rglob("global-task-list.md"),
-        *Path("docs").rglob("task-list.md"),
+    return backlog_model.find_backlog()
+
+
+def summarize(model: backlog_model.Backlog) -> list[Epic]:
+    """Converte a árvore do backlog em métricas por Epic (ignora Epics sem tarefas)."""
+    return [
+        Epic(name=e.name, total=e.total, done=e.done, owner=e.owner)
+        for e in model.epics
+        if e.total > 0
     ]
-    
-    for candidate in candidates:
-        if candidate.exists():
-            return candidate
-    return None
 
 
 def parse_backlog(content: str) -> list[Epic]:
@@ -53,35 +66,58 @@ def parse_backlog(content: str) -> list[Epic]:
         - [x] **Story N.N:** Título
         - [ ] **Story N.N:** Título
     """
-    epics: list[Epic] = []
+    return summarize(backlog_model.parse(content))
 
-    # Regex para encontrar Epics com ownership opcional
-    # Captura: nome do epic e owner (se existir)
-    epic_pattern = re.compile(
-        r"^##\s+Epic\s+\d+:\s+(.+?)\s*(?:\[OWNER:\s*(.+?)\])?\s*(?:[✅🔴⏳].*)?$",
-        re.MULTILINE
-    )
 
-    # Divide o conteúdo por Epics
-    epic_matches = list(epic_pattern.finditer(content))
+def split_epics(content: str) -> list[str]:
+    """Seções do backlog, uma por Epic (do cabeçalho até o próximo Epic)."""
+    sections: list[list[str]] = []
+    for line in content.splitlines(keepends=True):
+        if line.startswith("##") and "Epic" in line and backlog_model.EPIC_RE.match(line.rstrip("\r\n")):
+            sections.append([])
+        if sections:
+            sections[-1].append(line)
+    return ["".join(section) for section in sections]
 
-    for idx, match in enumerate(epic_matches):
-        epic_name = match.group(1).strip()
-        epic_owner = match.group(2).strip() if match.group(2) else None
 
-        # Extrai o conteúdo do Epic (até o próximo Epic ou fim do documento)
-        start_pos = match.end()
-        end_pos = epic_matches[idx + 1].start() if idx + 1 < len(epic_matches) else len(content)
-        epic_content = content[start_pos:end_pos]
+def summarize_incremental(content: str, cache_path: Path = EPIC_CACHE,
+                          memory: dict = None) -> list[Epic]:
+    """
+    Como parse_backlog, mas só reconta os Epics cuja seção mudou: cada seção
+    tem um sha1, e as métricas dos Epics inalterados vêm do cache.
 
-        # Conta tarefas (Stories e Subtarefas)
-        done = len(re.findall(r"^\s*-\s*\[x\]", epic_content, re.MULTILINE | re.IGNORECASE))
-        pending = len(re.findall(r"^\s*-\s*\[\s\]", epic_content, re.MULTILINE))
-        total = done + pending
+    Com `memory` (modo --watch) o cache fica só em memória, sem tocar o disco.
+    """
+    if memory is not None:
+        cached = memory
+    else:
+        try:
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            cached = {}
 
+    epics: list[Epic] = []
+    current = {}
+    for section in split_epics(content):
+        digest = hashlib.sha1(section.encode("utf-8")).hexdigest()
+        if digest in cached:
+            name, owner, total, done = cached[digest]
+        else:
+            epic = backlog_model.parse(section).epics[0]
+            name, owner, total, done = epic.name, epic.owner, epic.total, epic.done
+        current[digest] = [name, owner, total, done]
         if total > 0:
-            epics.append(Epic(name=epic_name, total=total, done=done, owner=epic_owner))
+            epics.append(Epic(name=name, total=total, done=done, owner=owner))
 
+    if memory is not None:
+        memory.clear()
+        memory.update(current)
+    elif current != cached:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps(current), encoding="utf-8")
+        except OSError:
+            pass
     return epics
 
 
@@ -166,10 +202,85 @@ def generate_progress_report(epics: list[Epic]) -> str:
     return "\n".join(lines)
 
 
+def _without_timestamp(report: str) -> list[str]:
+    return [line for line in report.splitlines() if not line.startswith(TIMESTAMP_PREFIX)]
+
+
+def write_progress(epics: list[Epic], output_path: Path = OUTPUT_PATH) -> bool:
+    """
+    Gera o progress-bar.md e só regrava o arquivo se algum número mudou
+    (o timestamp sozinho não conta).
+
+    Returns:
+        True se o arquivo foi gravado
+    """
+    report = generate_progress_report(epics)
+    try:
+        current = output_path.read_text(encoding="utf-8")
+        if _without_timestamp(current) == _without_timestamp(report):
+            return False
+    except OSError:
+        pass
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(report, encoding="utf-8")
+    return True
+
+
+def format_summary(epics: list[Epic]) -> str:
+    """Resumo de progresso para o console."""
+    total = sum(e.total for e in epics)
+    done = sum(e.done for e in epics)
+    percent = (done / total * 100) if total > 0 else 0
+
+    lines = [
+        "📊 **Progresso Atualizado!**",
+        "",
+        f"{generate_bar(percent)} {percent:.1f}%",
+        "",
+        f"Concluídas: {done}/{total}",
+        "",
+        "Por Epic:",
+    ]
+    for epic in epics:
+        status = "✅" if epic.percent == 100 else "🔄"
+        owner_text = ""
+        if epic.owner:
+            owner_emoji = "🤖" if epic.owner == "antigravity" else "🔵"
+            owner_text = f" [{owner_emoji} {epic.owner}]"
+        lines.append(f"  {status} {epic.name}{owner_text}: {epic.percent:.0f}% ({epic.done}/{epic.total})")
+    return "\n".join(lines)
+
+
+def watch_progress(backlog_path: Path):
+    """Modo --watch: regenera o progresso a cada mudança no backlog."""
+    from file_watcher import watch
+
+    memory: dict = {}
+
+    def on_change(changed):
+        start = time.perf_counter()
+        try:
+            epics = summarize_incremental(backlog_path.read_text(encoding="utf-8"), memory=memory)
+        except OSError as e:
+            print(f"❌ Erro ao ler {backlog_path}: {e}")
+            return
+        written = write_progress(epics)
+        elapsed = (time.perf_counter() - start) * 1000
+        print()
+        print(format_summary(epics))
+        status = "atualizado" if written else "sem mudanças"
+        print(f"⚡ {OUTPUT_PATH} {status} em {elapsed:.0f} ms")
+
+    on_change(set())
+    watch([backlog_path], on_change)
+
+
 def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+
     # Determina o caminho do backlog
-    if len(sys.argv) > 1:
-        backlog_path = Path(sys.argv[1])
+    if args:
+        backlog_path = Path(args[0])
     else:
         backlog_path = find_backlog()
     
@@ -179,45 +290,29 @@ def main():
         sys.exit(1)
     
     print(f"📖 Lendo: {backlog_path}")
+
+    if "--watch" in sys.argv:
+        watch_progress(backlog_path)
+        return
     
-    content = backlog_path.read_text(encoding="utf-8")
-    epics = parse_backlog(content)
+    epics = summarize_incremental(backlog_path.read_text(encoding="utf-8"))
     
     if not epics:
         print("⚠️  Nenhum Epic encontrado no backlog.")
         print("   Verifique se o formato está correto (## Epic N: Nome)")
         sys.exit(1)
     
-    # Gera o relatório
-    report = generate_progress_report(epics)
-    
-    # Salva em docs/progress-bar.md
-    output_path = Path("docs/progress-bar.md")
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(report, encoding="utf-8")
+    # Gera o relatório em docs/progress-bar.md
+    written = write_progress(epics)
     
     # Exibe resumo
-    total = sum(e.total for e in epics)
-    done = sum(e.done for e in epics)
-    percent = (done / total * 100) if total > 0 else 0
-    
-    print()
-    print("📊 **Progresso Atualizado!**")
-    print()
-    print(f"{generate_bar(percent)} {percent:.1f}%")
     print()
-    print(f"Concluídas: {done}/{total}")
+    print(format_summary(epics))
     print()
-    print("Por Epic:")
-    for epic in epics:
-        status = "✅" if epic.percent == 100 else "🔄"
-        owner_text = ""
-        if epic.owner:
-            owner_emoji = "🤖" if epic.owner == "antigravity" else "🔵"
-            owner_text = f" [{owner_emoji} {epic.owner}]"
-        print(f"  {status} {epic.name}{owner_text}: {epic.percent:.0f}% ({epic.done}/{epic.total})")
-    print()
-    print(f"✅ Arquivo gerado: {output_path}")
+    if written:
+        print(f"✅ Arquivo gerado: {OUTPUT_PATH}")
+    else:
+        print(f"✅ Sem mudanças: {OUTPUT_PATH} já está atualizado")
 
 
 if __name__ == "__main__":
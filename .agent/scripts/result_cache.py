@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Verification Result Cache - Antigravity Kit
+============================================
+
+Persistent store of passing check results shared by verify_all.py and
+checklist.py. A result is reused when the check name, the check script's
+version and the content hash of the files that check reads are all unchanged.
+
+Key = sha1(check name + script version + inputs digest)
+    - script version: content of the skill directory (scripts + data files)
+    - inputs digest:  content of the project files matching CHECK_INPUTS
+
+File contents are hashed once and memoized by (size, mtime), so an unchanged
+tree costs one stat per file. Only passes are stored; failures always rerun.
+
+Usage (from an orchestrator):
+    from result_cache import ResultCache
+    cache = ResultCache(project_path)
+    key = cache.key(name, script_path)
+    hit = cache.get(key)            # None or the stored result
+    cache.put(key, result)
+    cache.save()
+"""
+
+import os
+import json
+import hashlib
+import subprocess
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional
+
+CACHE_FILE = Path(".agent") / "cache" / "verify_results.json"
+CACHE_VERSION = 1
+
+SKIP_DIRS = {"node_modules", ".git", "__pycache__", ".venv", "venv", ".agent"}
+
+CODE_EXTENSIONS = {".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs", ".py", ".vue", ".svelte", ".dart"}
+WEB_EXTENSIONS = {".ts", ".tsx", ".js", ".jsx", ".html", ".css", ".vue", ".svelte", ".md", ".mdx"}
+LOCKFILES = ["package.json", "package-lock.json", "yarn.lock", "pnpm-lock.yaml",
+             "node_modules/.package-lock.json"]
+
+# What each check reads. Missing entry = every tracked or untracked,
+# non-ignored project file.
+#   extensions: project files with these suffixes (None = all)
+#   prefixes:   project files whose name starts with one of these (.env*)
+#   files:      extra paths, read even when gitignored
+#   dirs:       directories hashed in full, even when gitignored (build output)
+#   ignored:    list files by walking the tree, gitignored ones included
+#               (for checks that os.walk the project themselves)
+#   skip_dirs:  extra directories the check itself never enters
+#   deps:       extra script files the check imports from other skills
+CHECK_INPUTS = {
+    "security_scan.py": {"extensions": {".js", ".ts", ".jsx", ".tsx", ".py", ".go", ".java", ".rb", ".php",
+                                        ".json", ".yaml", ".yml", ".toml", ".env"},
+                         "prefixes": [".env"], "ignored": True,
+                         "skip_dirs": {"dist", "build", ".next"},
+                         "files": LOCKFILES + ["next.config.mjs", "nginx.conf"]},
+    "dependency_analyzer.py": {"extensions": set(), "files": LOCKFILES},
+    "lint_runner.py": {"extensions": CODE_EXTENSIONS,
+                       "files": LOCKFILES + ["tsconfig.json", "eslint.config.js", "pyproject.toml"]},
+    "type_coverage.py": {"extensions": {".ts", ".tsx", ".py"}},
+    "schema_validator.py": {"extensions": {".prisma", ".sql", ".ts"}},
+    "index_advisor.py": {"extensions": {".sql", ".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs"}},
+    "ux_audit.py": {"extensions": WEB_EXTENSIONS},
+    "accessibility_checker.py": {"extensions": WEB_EXTENSIONS},
+    "seo_checker.py": {"extensions": WEB_EXTENSIONS},
+    "geo_checker.py": {"extensions": WEB_EXTENSIONS},
+    "mobile_audit.py": {"extensions": CODE_EXTENSIONS},
+    "i18n_checker.py": {"extensions": CODE_EXTENSIONS | {".json"}},
+    "perf_budget.py": {"extensions": set(), "files": ["performance-budget.json"],
+                       "dirs": ["dist", "build", "out"]},
+    "bundle_analyzer.py": {"extensions": CODE_EXTENSIONS | {".html"}, "files": LOCKFILES,
+                           "deps": [".agent/skills/nextjs-react-expert/scripts/import_graph.py"]},
+}
+
+# Results depend on a live server, not on the tree
+UNCACHEABLE = {"lighthouse_audit.py", "playwright_runner.py"}
+
+
+class ResultCache:
+    def __init__(self, project_path: Path, enabled: bool = True):
+        self.project_path = Path(project_path)
+        self.enabled = enabled
+        self.path = self.project_path / CACHE_FILE
+        self.data = self._load() if enabled else {}
+        self.data.setdefault("version", CACHE_VERSION)
+        self.data.setdefault("results", {})
+        self.data.setdefault("files", {})
+        self._listing: Optional[List[str]] = None
+        self._dirty = False
+
+    def _load(self) -> dict:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            return data if data.get("version") == CACHE_VERSION else {}
+        except (OSError, ValueError):
+            return {}
+
+    def save(self):
+        if not self.enabled or not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self.data, indent=2), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+    # ------------------------------------------------------------------
+    # Hashing
+    # ------------------------------------------------------------------
+
+    def file_digest(self, path: Path) -> Optional[str]:
+        """sha1 of a file's content, memoized by size and mtime."""
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        rel = str(path)
+        memo = self.data["files"].get(rel)
+        if memo and memo[0] == st.st_size and memo[1] == st.st_mtime_ns:
+            return memo[2]
+        h = hashlib.sha1()
+        try:
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 16), b""):
+                    h.update(block)
+        except OSError:
+            return None
+        digest = h.hexdigest()
+        self.data["files"][rel] = [st.st_size, st.st_mtime_ns, digest]
+        self._dirty = True
+        return digest
+
+    def project_files(self) -> List[str]:
+        """Tracked + untracked-not-ignored files, listed once per run."""
+        if self._listing is not None:
+            return self._listing
+        try:
+            proc = subprocess.run(
+                ["git", "ls-files", "-co", "--exclude-standard"],
+                cwd=str(self.project_path), capture_output=True, text=True, timeout=30
+            )
+            if proc.returncode == 0:
+                self._listing = sorted(
+                    f for f in proc.stdout.splitlines()
+                    if f and not any(part in SKIP_DIRS for part in Path(f).parts)
+                )
+                return self._listing
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            pass
+        self._listing = sorted(self._walk(self.project_path))
+        return self._listing
+
+    def _walk(self, root: Path, skip_dirs: frozenset = frozenset()) -> List[str]:
+        files = []
+        for dirpath, dirs, names in os.walk(root):
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS and d not in skip_dirs]
+            for name in names:
+                files.append(str((Path(dirpath) / name).relative_to(self.project_path)))
+        return files
+
+    def script_version(self, script_path: Path, deps: List[str]) -> str:
+        """Digest of the check's skill directory plus cross-skill imports."""
+        skill_dir = script_path.parent.parent
+        h = hashlib.sha1()
+        paths = [Path(d) / n for d, _, names in os.walk(skill_dir)
+                 if "__pycache__" not in d for n in names]
+        paths += [self.project_path / d for d in deps]
+        for path in sorted(paths):
+            h.update(f"{path.name}\0{self.file_digest(path)}\n".encode())
+        return h.hexdigest()
+
+    def inputs_digest(self, script_name: str) -> str:
+        spec = CHECK_INPUTS.get(script_name, {})
+        extensions = spec.get("extensions")
+        prefixes = tuple(spec.get("prefixes", ()))
+        if spec.get("ignored"):
+            listing = self._walk(self.project_path, frozenset(spec.get("skip_dirs", ())))
+        else:
+            listing = self.project_files()
+        rels = [f for f in listing
+                if extensions is None or Path(f).suffix.lower() in extensions
+                or (prefixes and Path(f).name.startswith(prefixes))]
+        rels += [f for f in spec.get("files", []) if (self.project_path / f).is_file()]
+        for d in spec.get("dirs", []):
+            if (self.project_path / d).is_dir():
+                rels += self._walk(self.project_path / d)
+
+        h = hashlib.sha1()
+        for rel in sorted(set(rels)):
+            h.update(f"{rel}\0{self.file_digest(self.project_path / rel)}\n".encode())
+        return h.hexdigest()
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    def key(self, name: str, script_path: Path) -> Optional[str]:
+        """Cache key for a check, or None when the check is not cacheable."""
+        if not self.enabled or script_path.name in UNCACHEABLE or not script_path.exists():
+            return None
+        spec = CHECK_INPUTS.get(script_path.name, {})
+        version = self.script_version(script_path, spec.get("deps", []))
+        inputs = self.inputs_digest(script_path.name)
+        return hashlib.sha1(f"{name}\0{version}\0{inputs}".encode()).hexdigest()
+
+    def get(self, key: Optional[str]) -> Optional[Dict]:
+        if key is None:
+            return None
+        return self.data["results"].get(key)
+
+    def put(self, key: Optional[str], result: Dict):
+        """Store a passing, non-skipped result."""
+        if key is None or not result.get("passed") or result.get("skipped"):
+            return
+        # One entry per check: older keys for the same check are dead
+        for old in [k for k, v in self.data["results"].items() if v.get("name") == result["name"]]:
+            del self.data["results"][old]
+        self.data["results"][key] = {
+            "name": result["name"],
+            "passed": True,
+            "duration": result.get("duration", 0),
+            "cached_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        self._dirty = True
@@ -6,22 +6,25 @@ Detecta e reporta conflitos entre agentes trabalhando simultaneamente.
 Uso:
     python .agent/scripts/sync_tracker.py
     python .agent/scripts/sync_tracker.py --detailed
+    python .agent/scripts/sync_tracker.py --check-conflicts [--all]
 
 Funcionalidades:
     - Verifica locks ativos
-    - Detecta múltiplos agentes trabalhando no mesmo Epic
+    - Detecta agentes com sessões sobrepostas no mesmo Epic
     - Analisa git log para edições recentes no BACKLOG
     - Gera relatório de sincronização
 """
 
 import sys
-import subprocess
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Dict, Optional
 
 # Importa módulos do sistema
 sys.path.insert(0, str(Path(__file__).parent))
+import backlog_model
+from activity_index import ActivityIndex, default_epic_of, find_overlaps
+from git_index import GitIndex
 from lock_manager import LockManager
 from session_logger import get_last_activity_by_agent, find_logs_dir
 
@@ -50,95 +53,89 @@ def get_active_session() -> Optional[dict]:
 
 def get_recent_backlog_commits(days_back: int = 7) -> List[dict]:
     """
-    Obtém commits recentes que modificaram o BACKLOG.
+    Obtém commits recentes que modificaram o BACKLOG (via índice do git log).
 
     Returns:
         Lista de commits com author, date, message
     """
-    try:
-        result = subprocess.run(
-            [
-                "git", "log",
-                f"--since={days_back} days ago",
-                "--pretty=format:%H|%an|%ai|%s",
-                "--", "docs/BACKLOG.md", "BACKLOG.md"
-            ],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-
-        commits = []
-        for line in result.stdout.strip().split('\n'):
-            if not line:
-                continue
-
-            parts = line.split('|', 3)
-            if len(parts) == 4:
-                commits.append({
-                    'hash': parts[0],
-                    'author': parts[1],
-                    'date': parts[2],
-                    'message': parts[3]
-                })
-
-        return commits
-
-    except subprocess.CalledProcessError:
-        return []
+    commits = GitIndex().commits_since(days_back, paths=["docs/BACKLOG.md", "BACKLOG.md"])
+    return [
+        {
+            'hash': c['hash'],
+            'author': c['author'],
+            'date': c['date'],
+            'message': c['message'].split('\n', 1)[0],
+            'task_ids': c['task_ids'],
+        }
+        for c in commits
+    ]
 
 
-def detect_concurrent_epic_work(days_back: int = 7) -> List[dict]:
+def detect_concurrent_epic_work(days_back: Optional[int] = 7) -> List[dict]:
     """
-    Detecta se múltiplos agentes estão trabalhando no mesmo Epic.
+    Detecta se múltiplos agentes trabalharam no mesmo Epic ao mesmo tempo.
+
+    Usa o índice de atividade (activity_index): janelas de sessão por dia,
+    reindexadas só quando o log do dia muda, e compara os intervalos de
+    agentes diferentes em cada Epic.
+
+    Args:
+        days_back: Período analisado (None = todo o histórico)
 
     Returns:
-        Lista de conflitos potenciais
+        Lista de conflitos potenciais, cada um com as janelas sobrepostas
     """
     logs_dir = find_logs_dir()
     if not logs_dir:
         return []
 
-    # Obtém atividades por agente
-    agent_stats = get_last_activity_by_agent(logs_dir, days_back)
-
-    # Analisa atividades para detectar Epics sobrepostos
-    from auto_finish import extract_story_ids
-    import re
-
-    epic_work: Dict[str, List[str]] = {}  # epic_id -> [agents]
+    index = ActivityIndex(logs_dir)
+    index.refresh(days_back)
+    index.save()
 
-    for agent, stats in agent_stats.items():
-        activities = stats.get('last_activity', '')
+    # Story -> Epic pela árvore do backlog (quando existir)
+    backlog_path = backlog_model.find_backlog()
+    model = backlog_model.load_backlog(backlog_path) if backlog_path else None
 
-        # Extrai IDs de stories
-        story_ids = extract_story_ids(activities)
+    def epic_of(task_id: str) -> Optional[str]:
+        story = model.story(task_id) if model else None
+        epic = model.epic_of(story.line) if story else None
+        return str(epic.number) if epic else default_epic_of(task_id)
 
-        for story_id in story_ids:
-            # Extrai Epic ID
-            epic_match = re.match(r'^(\d+)', story_id)
-            if epic_match:
-                epic_id = f"Epic {epic_match.group(1)}"
-
-                if epic_id not in epic_work:
-                    epic_work[epic_id] = []
-
-                if agent not in epic_work[epic_id]:
-                    epic_work[epic_id].append(agent)
-
-    # Detecta conflitos (mais de um agente no mesmo Epic)
     conflicts = []
-    for epic_id, agents in epic_work.items():
-        if len(agents) > 1:
-            conflicts.append({
-                'epic': epic_id,
-                'agents': agents,
-                'severity': 'warning'
+    by_epic = index.epic_windows(days_back, epic_of)
+    for epic_number in sorted(by_epic, key=lambda e: int(e) if e.isdigit() else 0):
+        overlaps = find_overlaps(by_epic[epic_number])
+        if not overlaps:
+            continue
+
+        agents = []
+        windows = []
+        for first, second in overlaps:
+            for window in (first, second):
+                if window.agent not in agents:
+                    agents.append(window.agent)
+            windows.append({
+                'start': max(first.start, second.start),
+                'end': min(first.end, second.end),
+                'agents': [first.agent, second.agent],
             })
 
+        conflicts.append({
+            'epic': f"Epic {epic_number}",
+            'agents': agents,
+            'severity': 'warning',
+            'windows': windows,
+        })
+
     return conflicts
 
 
+def format_window(window: dict) -> str:
+    """'2026-02-02 14:10–14:45'"""
+    return f"{window['start'].strftime('%Y-%m-%d %H:%M')}–{window['end'].strftime('%H:%M')}"
+
+
 def generate_sync_report(detailed: bool = False) -> str:
     """
     Gera relatório de sincronização.
@@ -254,7 +251,8 @@ def generate_sync_report(detailed: bool = False) -> str:
                 for a in agents
             ])
 
-            lines.append(f"- **{epic}:** Múltiplos agentes ({agents_str})")
+            last = conflict['windows'][-1]
+            lines.append(f"- **{epic}:** Múltiplos agentes ({agents_str}) — {format_window(last)}")
 
         lines.append("")
     else:
@@ -299,9 +297,9 @@ def cmd_report(detailed: bool = False):
     print(report)
 
 
-def cmd_check_conflicts():
+def cmd_check_conflicts(full_history: bool = False):
     """Comando: Verifica apenas conflitos."""
-    conflicts = detect_concurrent_epic_work(days_back=7)
+    conflicts = detect_concurrent_epic_work(days_back=None if full_history else 7)
 
     if not conflicts:
         print("✅ Nenhum conflito detectado.")
@@ -318,6 +316,8 @@ def cmd_check_conflicts():
         ])
 
         print(f"  • {epic}: {agents_str}")
+        for window in conflict['windows']:
+            print(f"      {format_window(window)} ({' × '.join(window['agents'])})")
 
 
 def cmd_locks():
@@ -348,14 +348,15 @@ def main():
         print("\nComandos disponíveis:")
         print("  (sem argumentos)   Gera relatório de sincronização")
         print("  --detailed         Gera relatório detalhado com commits")
-        print("  --check-conflicts  Verifica apenas conflitos")
+        print("  --check-conflicts  Verifica apenas conflitos (últimos 7 dias)")
+        print("    --all            Considera todo o histórico de sessões")
         print("  --locks            Lista locks ativos")
         sys.exit(0)
 
     detailed = "--detailed" in sys.argv
 
     if "--check-conflicts" in sys.argv:
-        cmd_check_conflicts()
+        cmd_check_conflicts(full_history="--all" in sys.argv)
     elif "--locks" in sys.argv:
         cmd_locks()
     else:
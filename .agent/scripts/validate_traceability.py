@@ -8,17 +8,24 @@ Uso:
     python .agent/scripts/validate_traceability.py
     python .agent/scripts/validate_traceability.py --strict
     python .agent/scripts/validate_traceability.py --output json
+    python .agent/scripts/validate_traceability.py --watch
 """
 
 import os
 import re
+import sys
 import json
+import time
+import hashlib
 import argparse
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass, asdict
 
+sys.path.insert(0, str(Path(__file__).parent))
+import backlog_model
+
 # Paths
 DOCS_DIR = Path("docs")
 PLANNING_DIR = DOCS_DIR / "planning"
@@ -30,6 +37,25 @@ DATABASE_PATH = PLANNING_DIR / "04-database.md"
 JOURNEYS_PATH = PLANNING_DIR / "05-user-journeys.md"
 REPORT_PATH = PLANNING_DIR / "TRACEABILITY-REPORT.md"
 
+AC_CACHE_PATH = Path(".agent") / "cache" / "traceability_ac.json"
+
+# RF01, RF-01, RF_1 (qualquer zero à esquerda)
+RF_ID_RE = re.compile(r'\bRF[-_]?(\d+)', re.IGNORECASE)
+
+# Presença de Acceptance Criteria numa seção de story
+AC_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'Critérios?\s+de\s+Aceite',
+        r'Acceptance\s+Criteria',
+        r'Given\s+.+When\s+.+Then',
+        r'DADO\s+.+QUANDO\s+.+ENTÃO',
+        r'-\s*\[\s*\]\s*.+',  # Checkboxes como AC
+    )
+]
+
+# sha1 da seção -> tem AC
+_ac_cache: Dict[str, bool] = {}
+
 
 @dataclass
 class ValidationResult:
@@ -62,9 +88,16 @@ def read_file(path: Path) -> Optional[str]:
     return None
 
 
+def normalize_rf_id(raw: str) -> Optional[str]:
+    """RF01 / RF-1 / rf_001 -> RF-01"""
+    match = RF_ID_RE.search(raw)
+    return f"RF-{int(match.group(1)):02d}" if match else None
+
+
 def extract_requirements(prd_content: str) -> List[Dict]:
     """Extrai requisitos funcionais do PRD"""
     requirements = []
+    seen = set()
 
     # Padrões para encontrar RFs
     patterns = [
@@ -77,111 +110,122 @@ def extract_requirements(prd_content: str) -> List[Dict]:
     for pattern in patterns:
         matches = re.findall(pattern, prd_content, re.IGNORECASE)
         for match in matches:
-            rf_id = match[0].upper().replace('_', '-').replace('RF', 'RF-')
-            if not rf_id.startswith('RF-'):
-                rf_id = 'RF-' + rf_id.replace('RF', '')
             # Normaliza para RF-01, RF-02, etc
-            rf_id = re.sub(r'RF-?(\d+)', lambda m: f'RF-{m.group(1).zfill(2)}', rf_id)
-
-            description = match[1].strip()[:100]  # Limita descrição
+            rf_id = normalize_rf_id(match[0])
 
             # Evita duplicatas
-            if not any(r['id'] == rf_id for r in requirements):
-                requirements.append({
-                    'id': rf_id,
-                    'description': description,
-                    'covered': False,
-                    'stories': []
-                })
+            if rf_id in seen:
+                continue
+            seen.add(rf_id)
+
+            description = match[1].strip()[:100]  # Limita descrição
+            requirements.append({
+                'id': rf_id,
+                'description': description,
+                'covered': False,
+                'stories': []
+            })
 
     return requirements
 
 
-def extract_stories(backlog_content: str) -> List[Dict]:
-    """Extrai stories do backlog"""
+def extract_stories(model: backlog_model.Backlog) -> List[Dict]:
+    """Extrai stories do backlog (### Story 1.1, **Story 1.1**, - [ ] **Story 1.1:**)"""
     stories = []
+    seen = set()
+
+    for story in model.stories:
+        story_id = f"Story-{story.id}"
+
+        # Evita duplicatas
+        if story_id in seen:
+            continue
+        seen.add(story_id)
+        stories.append({
+            'id': story_id,
+            'description': story.title[:100],
+            'has_acceptance_criteria': False,
+            'requirements': []
+        })
 
-    # Padrões para encontrar stories
-    patterns = [
-        r'###?\s*Story\s+(\d+\.\d+)[:\s]+([^\n]+)',  # ### Story 1.1: Nome
-        r'\*\*Story\s+(\d+\.\d+)\*\*[:\s]+([^\n]+)',  # **Story 1.1:** Nome
-        r'-\s*\[[ x]\]\s*\*\*Story\s+(\d+\.\d+)[:\*]*\s*([^\n]+)',  # - [ ] **Story 1.1:** Nome
-    ]
+    return stories
 
-    for pattern in patterns:
-        matches = re.findall(pattern, backlog_content, re.IGNORECASE)
-        for match in matches:
-            story_id = f"Story-{match[0]}"
-            description = match[1].strip().replace('**', '')[:100]
 
-            # Evita duplicatas
-            if not any(s['id'] == story_id for s in stories):
-                stories.append({
-                    'id': story_id,
-                    'description': description,
-                    'has_acceptance_criteria': False,
-                    'requirements': []
-                })
+def story_sections(model: backlog_model.Backlog) -> Dict[str, str]:
+    """Story-X.Y -> conteúdo da seção (linhas após o título até a próxima Story/Epic)"""
+    sections = {}
+    for story in model.stories:
+        sections.setdefault(f"Story-{story.id}", model.section(story.line + 1, story.end))
+    return sections
 
-    return stories
 
+def load_ac_cache() -> None:
+    """Carrega o cache de AC por hash de seção (.agent/cache)"""
+    try:
+        _ac_cache.update(json.loads(AC_CACHE_PATH.read_text(encoding='utf-8')))
+    except (OSError, ValueError):
+        pass
 
-def check_story_has_ac(backlog_content: str, story_id: str) -> bool:
-    """Verifica se uma story tem Acceptance Criteria"""
-    # Encontra a seção da story
-    story_pattern = rf'Story\s+{story_id.replace("Story-", "")}[:\s]+'
-    match = re.search(story_pattern, backlog_content, re.IGNORECASE)
 
-    if not match:
+def save_ac_cache(sections: Dict[str, str]) -> None:
+    """Salva o cache mantendo só as seções atuais"""
+    keys = {hashlib.sha1(section.encode('utf-8')).hexdigest() for section in sections.values()}
+    data = {k: v for k, v in _ac_cache.items() if k in keys}
+    try:
+        AC_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        AC_CACHE_PATH.write_text(json.dumps(data), encoding='utf-8')
+    except OSError:
+        pass
+
+
+def section_has_ac(section: str) -> bool:
+    """Avalia os padrões de AC uma vez por conteúdo de seção"""
+    key = hashlib.sha1(section.encode('utf-8')).hexdigest()
+    if key not in _ac_cache:
+        _ac_cache[key] = any(pattern.search(section) for pattern in AC_PATTERNS)
+    return _ac_cache[key]
+
+
+def check_story_has_ac(sections: Dict[str, str], story_id: str) -> bool:
+    """Verifica se uma story tem Acceptance Criteria"""
+    section = sections.get(story_id)
+    if section is None:
         return False
+    return section_has_ac(section)
 
-    # Pega conteúdo após a story até a próxima story ou epic
-    start_pos = match.end()
-    next_section = re.search(r'(###?\s*Story|##\s*Epic)', backlog_content[start_pos:])
-    end_pos = start_pos + next_section.start() if next_section else len(backlog_content)
 
-    section_content = backlog_content[start_pos:end_pos]
+def build_rf_index(model: backlog_model.Backlog) -> Dict[str, List[str]]:
+    """
+    Índice invertido RF -> stories que o mencionam, em uma passada pelo backlog.
 
-    # Verifica presença de AC
-    ac_patterns = [
-        r'Critérios?\s+de\s+Aceite',
-        r'Acceptance\s+Criteria',
-        r'Given\s+.+When\s+.+Then',
-        r'DADO\s+.+QUANDO\s+.+ENTÃO',
-        r'-\s*\[\s*\]\s*.+',  # Checkboxes como AC
-    ]
+    Toda menção entra no índice (cobre o RF); a story é a da seção que contém
+    a linha. Menções fora de stories (ex: "Requisitos relacionados" do Epic)
+    cobrem o RF sem vincular story.
+    """
+    story_at: List[Optional[str]] = [None] * len(model.lines)
+    for story in model.stories:
+        for idx in range(story.line, story.end):
+            story_at[idx] = f"Story-{story.id}"
 
-    for pattern in ac_patterns:
-        if re.search(pattern, section_content, re.IGNORECASE):
-            return True
+    index: Dict[str, Dict[str, None]] = {}
+    for idx, line in enumerate(model.lines):
+        if 'rf' not in line.lower():
+            continue
+        for match in RF_ID_RE.finditer(line):
+            stories = index.setdefault(f"RF-{int(match.group(1)):02d}", {})
+            if story_at[idx]:
+                stories[story_at[idx]] = None
 
-    return False
+    return {rf_id: list(stories) for rf_id, stories in index.items()}
 
 
-def map_requirements_to_stories(requirements: List[Dict], backlog_content: str) -> None:
+def map_requirements_to_stories(requirements: List[Dict], model: backlog_model.Backlog) -> None:
     """Mapeia quais stories cobrem quais requisitos"""
+    index = build_rf_index(model)
     for req in requirements:
-        # Busca menções ao RF no backlog
-        rf_patterns = [
-            req['id'],
-            req['id'].replace('-', ''),
-            req['id'].replace('RF-', 'RF'),
-            req['id'].replace('RF-0', 'RF-'),
-        ]
-
-        for pattern in rf_patterns:
-            if pattern.lower() in backlog_content.lower():
-                req['covered'] = True
-                # Encontra qual story menciona
-                lines = backlog_content.split('\n')
-                current_story = None
-                for line in lines:
-                    story_match = re.search(r'Story\s+(\d+\.\d+)', line, re.IGNORECASE)
-                    if story_match:
-                        current_story = f"Story-{story_match.group(1)}"
-                    if pattern.lower() in line.lower() and current_story:
-                        if current_story not in req['stories']:
-                            req['stories'].append(current_story)
+        if req['id'] in index:
+            req['covered'] = True
+            req['stories'] = index[req['id']]
 
 
 def find_orphan_stories(stories: List[Dict], requirements: List[Dict]) -> List[str]:
@@ -450,13 +494,23 @@ def print_console_report(report: TraceabilityReport, verbose: bool = False) -> N
     print("=" * 60 + "\n")
 
 
-def main():
-    parser = argparse.ArgumentParser(description='Valida rastreabilidade entre requisitos e backlog')
-    parser.add_argument('--strict', action='store_true', help='Falha se houver qualquer warning')
-    parser.add_argument('--output', choices=['console', 'json', 'markdown'], default='console')
-    parser.add_argument('--verbose', '-v', action='store_true', help='Saída detalhada')
-    args = parser.parse_args()
+_prd_cache: Dict[str, tuple] = {}
 
+
+def load_requirements() -> List[Dict]:
+    """Requisitos do PRD; só reparseia quando o arquivo muda (mtime/tamanho)"""
+    st = PRD_PATH.stat()
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _prd_cache.get('prd')
+    if not cached or cached[0] != signature:
+        cached = (signature, extract_requirements(read_file(PRD_PATH) or ""))
+        _prd_cache['prd'] = cached
+    # Cópias novas: o mapeamento marca cobertura nos dicts
+    return [dict(req, stories=[]) for req in cached[1]]
+
+
+def build_report(strict: bool = False) -> Optional[TraceabilityReport]:
+    """Roda a validação completa. None se PRD ou Backlog não existirem."""
     # Verifica documentos
     documents_found = {
         'Product Brief': BRIEF_PATH.exists(),
@@ -469,23 +523,21 @@ def main():
 
     # Se não tem PRD ou Backlog, não pode continuar
     if not documents_found['PRD'] or not documents_found['Backlog']:
-        print("❌ PRD ou Backlog não encontrado. Execute /define primeiro.")
-        exit(1)
+        return None
 
-    # Lê conteúdo dos arquivos
-    prd_content = read_file(PRD_PATH) or ""
-    backlog_content = read_file(BACKLOG_PATH) or ""
-
-    # Extrai dados
-    requirements = extract_requirements(prd_content)
-    stories = extract_stories(backlog_content)
+    # Extrai dados (PRD e backlog ficam em cache até mudarem)
+    requirements = load_requirements()
+    backlog = backlog_model.load_backlog(BACKLOG_PATH)
+    stories = extract_stories(backlog)
 
     # Mapeia cobertura
-    map_requirements_to_stories(requirements, backlog_content)
+    map_requirements_to_stories(requirements, backlog)
 
-    # Verifica AC em cada story
+    # Verifica AC em cada story (uma seção por story, cache por hash da seção)
+    sections = story_sections(backlog)
     for story in stories:
-        story['has_acceptance_criteria'] = check_story_has_ac(backlog_content, story['id'])
+        story['has_acceptance_criteria'] = check_story_has_ac(sections, story['id'])
+    save_ac_cache(sections)
 
     # Encontra órfãs
     orphan_stories = find_orphan_stories(stories, requirements)
@@ -504,11 +556,11 @@ def main():
 
     # Determina status
     status = determine_status(issues)
-    if args.strict and status == "PASSED_WITH_WARNINGS":
+    if strict and status == "PASSED_WITH_WARNINGS":
         status = "FAILED"
 
     # Cria relatório
-    report = TraceabilityReport(
+    return TraceabilityReport(
         timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         documents_found=documents_found,
         requirements=requirements,
@@ -521,10 +573,12 @@ def main():
         status=status
     )
 
-    # Output
-    if args.output == 'json':
+
+def emit_report(report: TraceabilityReport, output: str, verbose: bool = False) -> None:
+    """Imprime o relatório no formato pedido e salva o markdown"""
+    if output == 'json':
         print(json.dumps(asdict(report), indent=2, ensure_ascii=False))
-    elif args.output == 'markdown':
+    elif output == 'markdown':
         md_report = generate_markdown_report(report)
         print(md_report)
         # Também salva em arquivo
@@ -538,12 +592,56 @@ def main():
         with open(REPORT_PATH, 'w', encoding='utf-8') as f:
             f.write(md_report)
 
-        print_console_report(report, args.verbose)
+        print_console_report(report, verbose)
+
+
+def watch_traceability(args) -> None:
+    """Modo --watch: revalida a cada mudança no PRD ou no BACKLOG"""
+    from file_watcher import watch
+
+    def on_change(changed):
+        start = time.perf_counter()
+        report = build_report(args.strict)
+        if report is None:
+            print("❌ PRD ou Backlog não encontrado.")
+            return
+        emit_report(report, args.output, args.verbose)
+        names = ", ".join(sorted(p.name for p in changed)) or "inicial"
+        print(f"⚡ {names} -> revalidado em {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    on_change(set())
+    watch([PRD_PATH, BACKLOG_PATH], on_change)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Valida rastreabilidade entre requisitos e backlog')
+    parser.add_argument('--strict', action='store_true', help='Falha se houver qualquer warning')
+    parser.add_argument('--output', choices=['console', 'json', 'markdown'], default='console')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Saída detalhada')
+    parser.add_argument('--watch', action='store_true',
+                        help='Observa PRD e BACKLOG e revalida a cada mudança')
+    args = parser.parse_args()
+
+    load_ac_cache()
+
+    if args.watch:
+        if not PRD_PATH.exists() or not BACKLOG_PATH.exists():
+            print("❌ PRD ou Backlog não encontrado. Execute /define primeiro.")
+            exit(1)
+        watch_traceability(args)
+        exit(0)
+
+    report = build_report(args.strict)
+    if report is None:
+        print("❌ PRD ou Backlog não encontrado. Execute /define primeiro.")
+        exit(1)
+
+    emit_report(report, args.output, args.verbose)
 
     # Exit code
-    if status == "FAILED":
+    if report.status == "FAILED":
         exit(1)
-    elif status == "PASSED_WITH_WARNINGS" and args.strict:
+    elif report.status == "PASSED_WITH_WARNINGS" and args.strict:
         exit(1)
     else:
         exit(0)
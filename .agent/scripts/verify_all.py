@@ -7,15 +7,22 @@ Runs COMPLETE validation including all checks + performance + E2E.
 Use this before deployment or major releases.
 
 Usage:
-    python scripts/verify_all.py . --url <URL>
+    python scripts/verify_all.py .                # Offline checks only
+    python scripts/verify_all.py . --url <URL>    # Include Lighthouse & E2E
+    python scripts/verify_all.py . --no-cache     # Rerun checks that passed on an unchanged tree
+
+Every run writes a Chrome trace of per-check wall/CPU time, peak RSS and
+output size to .agent/logs/verify_all.trace.json and prints the critical path.
 
 Includes ALL checks:
     ✅ Security Scan (OWASP, secrets, dependencies)
     ✅ Lint & Type Coverage
     ✅ Schema Validation
+    ✅ Index Advisor
     ✅ Test Suite (unit + integration)
     ✅ UX Audit (psychology, accessibility)
     ✅ SEO Check
+    ✅ Performance Budget (offline, built dist/)
     ✅ Lighthouse (Core Web Vitals)
     ✅ Playwright E2E
     ✅ Bundle Analysis (if applicable)
@@ -29,6 +36,11 @@ from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).parent))
+from result_cache import ResultCache
+from check_runner import run_in_process, skip_message
+from check_profiler import CheckProfiler, TRACE_FILE
+
 # ANSI colors
 class Colors:
     HEADER = '\033[95m'
@@ -82,6 +94,7 @@ VERIFICATION_SUITE = [
         "category": "Data Layer",
         "checks": [
             ("Schema Validation", ".agent/skills/database-design/scripts/schema_validator.py", False),
+            ("Index Advisor", ".agent/skills/database-design/scripts/index_advisor.py", False),
         ]
     },
     
@@ -111,13 +124,21 @@ VERIFICATION_SUITE = [
         ]
     },
     
-    # P6: Performance (requires URL)
+    # P6: Performance (offline - runs without a URL)
     {
         "category": "Performance",
+        "checks": [
+            ("Performance Budget", ".agent/skills/performance-profiling/scripts/perf_budget.py", False),
+            ("Bundle Analysis", ".agent/skills/performance-profiling/scripts/bundle_analyzer.py", False),
+        ]
+    },
+    
+    # P6b: Live Performance (requires URL)
+    {
+        "category": "Live Performance",
         "requires_url": True,
         "checks": [
             ("Lighthouse Audit", ".agent/skills/performance-profiling/scripts/lighthouse_audit.py", True),
-            ("Bundle Analysis", ".agent/skills/performance-profiling/scripts/bundle_analyzer.py", False),
         ]
     },
     
@@ -147,15 +168,50 @@ VERIFICATION_SUITE = [
     },
 ]
 
-def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None) -> dict:
-    """Run validation script"""
+def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None,
+               cache: Optional[ResultCache] = None, isolated: bool = False) -> dict:
+    """
+    Run validation script, reusing a cached pass when its inputs are unchanged.
+    Scripts exposing run() are called in-process unless isolated is set.
+    """
     if not script_path.exists():
         print_warning(f"{name}: Script not found, skipping")
         return {"name": name, "passed": True, "skipped": True, "duration": 0}
     
+    key = cache.key(name, script_path) if cache else None
+    hit = cache.get(key) if cache else None
+    if hit:
+        print_success(f"{name}: PASSED (cached {hit['cached_at']}, {hit['duration']:.1f}s)")
+        return {"name": name, "passed": True, "skipped": False, "cached": True,
+                "duration": hit["duration"], "output": "", "error": ""}
+    
     print_step(f"Running: {name}")
     start_time = datetime.now()
     
+    inproc = None if isolated else run_in_process(script_path, project_path, url=url)
+    if inproc is not None:
+        duration = (datetime.now() - start_time).total_seconds()
+        if inproc["skipped"]:
+            print_warning(f"{name}: SKIPPED - {inproc['result'].get('message', '')}")
+        elif inproc["passed"]:
+            print_success(f"{name}: PASSED ({duration:.1f}s)")
+        else:
+            print_error(f"{name}: FAILED ({duration:.1f}s)")
+            if inproc["error"]:
+                print(f"  {inproc['error'][:300]}")
+        result = {
+            "name": name,
+            "passed": inproc["passed"],
+            "output": inproc["output"],
+            "error": inproc["error"],
+            "result": inproc["result"],
+            "skipped": inproc["skipped"],
+            "duration": duration
+        }
+        if cache:
+            cache.put(key, result)
+        return result
+    
     # Build command
     cmd = ["python", str(script_path), project_path]
     if url and ("lighthouse" in script_path.name.lower() or "playwright" in script_path.name.lower()):
@@ -172,22 +228,28 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
         
         duration = (datetime.now() - start_time).total_seconds()
         passed = result.returncode == 0
+        skip = skip_message(result.stdout) if passed else None
         
-        if passed:
+        if skip is not None:
+            print_warning(f"{name}: SKIPPED - {skip}")
+        elif passed:
             print_success(f"{name}: PASSED ({duration:.1f}s)")
         else:
             print_error(f"{name}: FAILED ({duration:.1f}s)")
             if result.stderr:
                 print(f"  {result.stderr[:300]}")
         
-        return {
+        result = {
             "name": name,
             "passed": passed,
             "output": result.stdout,
             "error": result.stderr,
-            "skipped": False,
+            "skipped": skip is not None,
             "duration": duration
         }
+        if cache:
+            cache.put(key, result)
+        return result
     
     except subprocess.TimeoutExpired:
         duration = (datetime.now() - start_time).total_seconds()
@@ -199,7 +261,33 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
         print_error(f"{name}: ERROR - {str(e)}")
         return {"name": name, "passed": False, "skipped": False, "duration": duration, "error": str(e)}
 
-def print_final_report(results: List[dict], start_time: datetime):
+def print_critical_path(profiler: CheckProfiler, trace_path: Optional[Path], top: int = 5):
+    """Print which checks bound total wall time"""
+    summary = profiler.critical_path()
+    if not summary["checks"]:
+        return
+    if summary["sequential"]:
+        scope = "checks ran sequentially, so all are on it"
+    else:
+        scope = f"{len(summary['path'])} of {len(summary['checks'])} checks on it"
+    print(f"{Colors.BOLD}Critical Path (wall {summary['total_wall']:.1f}s, {scope}; "
+          f"longest: {summary['bound_by']}):{Colors.ENDC}")
+    for c in summary["checks"][:top]:
+        kind = "cpu-bound" if c["cpu_ratio"] >= 0.5 else "waiting"
+        memory = []
+        if c["peak_rss_mb"] is not None:
+            memory.append(f"peak rss {c['peak_rss_mb']} MB (+{c['rss_growth_mb']})")
+        if c["child_peak_rss_mb"] is not None:
+            memory.append(f"child rss {c['child_peak_rss_mb']} MB")
+        marker = " " if summary["sequential"] or c["on_path"] else "~"
+        print(f" {marker}{c['share']*100:5.1f}%  {c['wall']:6.1f}s  {c['name']:<22} "
+              f"cpu/wall {c['cpu_ratio']:.2f} ({kind}){', ' if memory else ''}{', '.join(memory)}")
+    if trace_path:
+        print(f"  Trace: {trace_path} (chrome://tracing or ui.perfetto.dev)")
+    print()
+
+def print_final_report(results: List[dict], start_time: datetime,
+                       profiler: Optional[CheckProfiler] = None, trace_path: Optional[Path] = None):
     """Print comprehensive final report"""
     total_duration = (datetime.now() - start_time).total_seconds()
     
@@ -210,12 +298,16 @@ def print_final_report(results: List[dict], start_time: datetime):
     passed = sum(1 for r in results if r["passed"] and not r.get("skipped"))
     failed = sum(1 for r in results if not r["passed"] and not r.get("skipped"))
     skipped = sum(1 for r in results if r.get("skipped"))
+    cached = sum(1 for r in results if r.get("cached"))
     
     print(f"Total Duration: {total_duration:.1f}s")
     print(f"Total Checks: {total}")
     print(f"{Colors.GREEN}✅ Passed: {passed}{Colors.ENDC}")
     print(f"{Colors.RED}❌ Failed: {failed}{Colors.ENDC}")
     print(f"{Colors.YELLOW}⏭️  Skipped: {skipped}{Colors.ENDC}")
+    if cached:
+        saved = sum(r.get("duration", 0) for r in results if r.get("cached"))
+        print(f"{Colors.CYAN}♻️  Cached: {cached} (saved ~{saved:.1f}s){Colors.ENDC}")
     print()
     
     # Category breakdown
@@ -236,10 +328,15 @@ def print_final_report(results: List[dict], start_time: datetime):
             status = f"{Colors.RED}❌{Colors.ENDC}"
         
         duration_str = f"({r.get('duration', 0):.1f}s)" if not r.get("skipped") else ""
+        if r.get("cached"):
+            duration_str = f"({r.get('duration', 0):.1f}s, cached)"
         print(f"  {status} {r['name']} {duration_str}")
     
     print()
     
+    if profiler:
+        print_critical_path(profiler, trace_path)
+    
     # Failed checks detail
     if failed > 0:
         print(f"{Colors.BOLD}{Colors.RED}❌ FAILED CHECKS:{Colors.ENDC}")
@@ -266,14 +363,20 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
+  python scripts/verify_all.py .
   python scripts/verify_all.py . --url http://localhost:3000
   python scripts/verify_all.py . --url https://staging.example.com --no-e2e
+  python scripts/verify_all.py . --no-cache
+  python scripts/verify_all.py . --trace /tmp/verify.trace.json
         """
     )
     parser.add_argument("project", help="Project path to validate")
-    parser.add_argument("--url", required=True, help="URL for performance & E2E checks")
+    parser.add_argument("--url", help="URL for Lighthouse & E2E checks (offline checks run without it)")
     parser.add_argument("--no-e2e", action="store_true", help="Skip E2E tests")
     parser.add_argument("--stop-on-fail", action="store_true", help="Stop on first failure")
+    parser.add_argument("--no-cache", action="store_true", help="Rerun every check, ignoring cached passes")
+    parser.add_argument("--isolated", action="store_true", help="Run each check in its own subprocess")
+    parser.add_argument("--trace", help=f"Chrome trace output (default: <project>/{TRACE_FILE.as_posix()})")
     
     args = parser.parse_args()
     
@@ -285,11 +388,14 @@ Examples:
     
     print_header("🚀 ANTIGRAVITY KIT - FULL VERIFICATION SUITE")
     print(f"Project: {project_path}")
-    print(f"URL: {args.url}")
+    print(f"URL: {args.url if args.url else 'Not provided (Lighthouse & E2E skipped)'}")
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     start_time = datetime.now()
     results = []
+    cache = ResultCache(project_path, enabled=not args.no_cache)
+    profiler = CheckProfiler()
+    trace_path = Path(args.trace) if args.trace else project_path / TRACE_FILE
     
     # Run all verification categories
     for suite in VERIFICATION_SUITE:
@@ -308,18 +414,25 @@ Examples:
         
         for name, script_path, required in suite["checks"]:
             script = project_path / script_path
-            result = run_script(name, script, str(project_path), args.url)
+            span = profiler.start(name, category)
+            result = run_script(name, script, str(project_path), args.url, cache, args.isolated)
+            profiler.end(span, result)
             result["category"] = category
             results.append(result)
             
             # Stop on critical failure if flag set
             if args.stop_on_fail and required and not result["passed"] and not result.get("skipped"):
                 print_error(f"CRITICAL: {name} failed. Stopping verification.")
-                print_final_report(results, start_time)
+                cache.save()
+                profiler.write_trace(trace_path)
+                print_final_report(results, start_time, profiler, trace_path)
                 sys.exit(1)
     
+    cache.save()
+    profiler.write_trace(trace_path)
+    
     # Print final report
-    all_passed = print_final_report(results, start_time)
+    all_passed = print_final_report(results, start_time, profiler, trace_path)
     
     sys.exit(0 if all_passed else 1)
 
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Index Advisor - Static EXPLAIN-style review of Supabase migrations
+Replays supabase/migrations/*.sql in order to reconstruct the final schema,
+then reports what would force sequential scans in production. Pure Python,
+no database connection required.
+
+Checks:
+    - Foreign keys without an index on the referencing columns
+      (joins and ON DELETE cascades scan the child table)
+    - RLS policies on columns without an index
+      (the predicate runs for every row of every query on the table)
+    - Tables without a primary key (wide tables are flagged high)
+    - Hot paths: supabase-js filters/orderings in the app code
+      (.from('t').eq('col') / .order('col')) on unindexed columns
+
+Usage:
+    python index_advisor.py <project_path> [--migrations supabase/migrations]
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List
+
+# Fix Windows console encoding
+try:
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+except:
+    pass
+
+sys.path.insert(0, str(Path(__file__).parent))
+from schema_parser import SchemaGraph, load_schema
+
+MIGRATIONS_DIR = Path('supabase') / 'migrations'
+CODE_EXTENSIONS = {'.ts', '.tsx', '.js', '.jsx', '.mjs', '.cjs'}
+SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '.next', 'coverage', '__pycache__',
+             '.agent', 'supabase'}
+
+# Tables with at least this many columns and no PK are high risk
+WIDE_TABLE_COLUMNS = 8
+
+SEVERITY_WEIGHT = {'high': 3, 'medium': 2, 'low': 1}
+
+# supabase-js query builder calls whose first argument is a schema/table/column name
+QUERY_CALL_RE = re.compile(
+    r"""\.(schema|from|eq|neq|gt|gte|lt|lte|like|ilike|is|in|contains|containedBy|order|filter)"""
+    r"""\(\s*['"`]([\w.]+)['"`]""")
+ORDER_CALLS = {'order'}
+
+
+def find_migrations(project_path: Path, override: str = None) -> List[Path]:
+    """Migrations in replay order (Supabase names them <timestamp>_<name>.sql)"""
+    directory = project_path / (override or MIGRATIONS_DIR)
+    if not directory.is_dir():
+        return []
+    return sorted(directory.glob('*.sql'), key=lambda p: p.name)
+
+
+def find_query_paths(project_path: Path, graph: SchemaGraph) -> Dict[tuple, dict]:
+    """
+    (table, column, kind) -> {"calls": n, "sites": [...]} for supabase-js chains.
+    Filters attach to the last .from() seen in the same file, which also covers
+    `query = query.eq(...)` built up over several statements.
+    """
+    paths = {}
+    for root, dirs, files in os.walk(project_path):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for name in files:
+            filepath = Path(root) / name
+            if filepath.suffix not in CODE_EXTENSIONS:
+                continue
+            try:
+                content = filepath.read_text(encoding='utf-8')
+            except (OSError, UnicodeDecodeError):
+                continue
+            if '.from(' not in content:
+                continue
+
+            rel = str(filepath.relative_to(project_path))
+            schema, table = None, None
+            for m in QUERY_CALL_RE.finditer(content):
+                call, arg = m.group(1), m.group(2)
+                if call == 'schema':
+                    schema = arg
+                elif call == 'from':
+                    table = graph.resolve(arg if '.' in arg else f"{schema or 'public'}.{arg}")
+                    schema = None
+                elif table is not None:
+                    column = arg.split('.')[0]
+                    kind = 'order' if call in ORDER_CALLS else 'filter'
+                    entry = paths.setdefault((table, column, kind), {"calls": 0, "sites": []})
+                    entry["calls"] += 1
+                    line = content.count('\n', 0, m.start()) + 1
+                    entry["sites"].append(f"{rel}:{line}")
+    return paths
+
+
+def advise(graph: SchemaGraph, query_paths: Dict[tuple, dict]) -> List[dict]:
+    findings = []
+
+    def add(severity, check, table, columns, message, fix, sites=None):
+        findings.append({
+            "severity": severity,
+            "check": check,
+            "table": table,
+            "columns": list(columns),
+            "message": message,
+            "fix": fix,
+            "sites": sites or [],
+        })
+
+    for table, fk in graph.unindexed_foreign_keys():
+        cols = ', '.join(fk.columns)
+        add('high', 'unindexed_fk', table.name, fk.columns,
+            f"FK ({cols}) -> {fk.ref_table} has no index: joins and deletes on "
+            f"{fk.ref_table} scan {table.name}",
+            f"CREATE INDEX ON {table.name} ({cols});", [f"{Path(fk.source or table.source).name}:{fk.line}"])
+
+    for table in graph.tables.values():
+        if table.rls:
+            for policy in table.policies:
+                for col in policy.columns:
+                    if not graph.is_indexed(table, (col,)):
+                        add('high', 'rls_unindexed', table.name, (col,),
+                            f"RLS policy \"{policy.name}\" ({policy.command}) filters on "
+                            f"unindexed {col}: evaluated for every row scanned",
+                            f"CREATE INDEX ON {table.name} ({col});",
+                            [f"{Path(policy.source or table.source).name}:{policy.line}"])
+
+        if not table.primary_key:
+            wide = len(table.columns) >= WIDE_TABLE_COLUMNS
+            add('high' if wide else 'medium', 'no_primary_key', table.name, (),
+                f"No primary key ({len(table.columns)} columns): updates/deletes by row "
+                f"and logical replication need a full scan",
+                f"ALTER TABLE {table.name} ADD PRIMARY KEY (...);")
+
+    for (name, column, kind), entry in sorted(query_paths.items(), key=lambda x: -x[1]["calls"]):
+        table = graph.tables.get(name)
+        if table is None or column not in table.columns or graph.is_indexed(table, (column,)):
+            continue
+        verb = 'ordered by' if kind == 'order' else 'filtered on'
+        add('low' if kind == 'order' else 'medium', f'hot_path_{kind}', name, (column,),
+            f"{entry['calls']} query call(s) {verb} unindexed {column}",
+            f"CREATE INDEX ON {name} ({column});", entry["sites"])
+
+    findings.sort(key=lambda f: -SEVERITY_WEIGHT[f["severity"]])
+    return findings
+
+
+def table_risk(findings: List[dict]) -> List[dict]:
+    """Estimated hot-path risk per table (sum of severity weights)"""
+    scores = {}
+    for f in findings:
+        scores[f["table"]] = scores.get(f["table"], 0) + SEVERITY_WEIGHT[f["severity"]]
+    return [{"table": t, "risk": s} for t, s in sorted(scores.items(), key=lambda x: -x[1])]
+
+
+def run(project_path=".", migrations: str = None, **opts) -> dict:
+    """Replay migrations, print the advice and return the result (importable entry point)."""
+    project_path = Path(project_path).resolve()
+
+    print(f"\n{'='*60}")
+    print(f"[INDEX ADVISOR] Static Index Review of SQL Migrations")
+    print(f"{'='*60}")
+    print(f"Project: {project_path}")
+    print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("-"*60)
+
+    files = find_migrations(project_path, migrations)
+    if not files:
+        print("No SQL migrations found.")
+        return {"script": "index_advisor", "project": str(project_path),
+                "migrations": 0, "passed": True, "message": "No SQL migrations found"}
+
+    graph = load_schema(files)
+    query_paths = find_query_paths(project_path, graph)
+    findings = advise(graph, query_paths)
+    risk = table_risk(findings)
+
+    print(f"Replayed {len(files)} migrations -> {len(graph.tables)} tables, "
+          f"{sum(len(t.foreign_keys) for t in graph.tables.values())} foreign keys, "
+          f"{sum(e['calls'] for e in query_paths.values())} query call sites")
+
+    if findings:
+        print("\nFindings:")
+        for f in findings:
+            print(f"  [{f['severity'].upper()}] {f['table']}: {f['message']}")
+            print(f"      Fix: {f['fix']}")
+            for site in f["sites"][:3]:
+                print(f"      at {site}")
+        print("\nEstimated hot-path risk by table:")
+        for r in risk:
+            print(f"  {r['risk']:>3}  {r['table']}")
+    else:
+        print("\n[OK] No index issues found")
+
+    high = sum(1 for f in findings if f["severity"] == "high")
+    return {
+        "script": "index_advisor",
+        "project": str(project_path),
+        "migrations": len(files),
+        "tables": len(graph.tables),
+        "findings": findings,
+        "table_risk": risk,
+        "passed": high == 0
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Static index advisor for Supabase SQL migrations")
+    parser.add_argument("project", nargs="?", default=".", help="Project path")
+    parser.add_argument("--migrations", help=f"Migrations dir (default: {MIGRATIONS_DIR.as_posix()})")
+    args, _ = parser.parse_known_args()
+
+    output = run(args.project, migrations=args.migrations)
+    print("\n" + json.dumps(output, indent=2))
+    sys.exit(0 if output["passed"] else 1)
+
+
+if __name__ == "__main__":
+    main()
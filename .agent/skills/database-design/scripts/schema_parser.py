@@ -0,0 +1,724 @@
+#!/usr/bin/env python3
+"""
+Schema Parser
+Single-pass tokenizers and parsers for Prisma schemas and SQL DDL
+(supabase/migrations) that build one in-memory schema graph.
+SQL files are replayed in order (CREATE / ALTER / DROP / RENAME, RLS and
+policies), so the graph is the schema as it stands after the last migration.
+Shared by schema_validator, index_advisor and other database-design scripts.
+
+Usage: python schema_parser.py <schema.prisma | migration.sql>...
+"""
+
+import re
+import sys
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+
+class Token(NamedTuple):
+    kind: str   # 'ident', 'string', 'number', 'attr', 'punct', 'nl', 'qident', 'dollar'
+    value: str
+    line: int
+
+
+class ForeignKey(NamedTuple):
+    columns: Tuple[str, ...]
+    ref_table: str
+    ref_columns: Tuple[str, ...]
+    line: int
+    source: str = ''
+
+
+class Policy(NamedTuple):
+    name: str
+    command: str                 # ALL, SELECT, INSERT, UPDATE, DELETE
+    columns: Tuple[str, ...]     # table columns referenced by USING / WITH CHECK
+    line: int
+    source: str = ''
+
+
+@dataclass
+class Table:
+    """A Prisma model or SQL table"""
+    name: str
+    source: str
+    line: int
+    columns: Dict[str, str] = field(default_factory=dict)   # name -> type, in order
+    primary_key: Tuple[str, ...] = ()
+    indexes: List[Tuple[str, ...]] = field(default_factory=list)  # incl. unique constraints
+    foreign_keys: List[ForeignKey] = field(default_factory=list)
+    constraints: Dict[str, tuple] = field(default_factory=dict)   # name -> (kind, value)
+    rls: bool = False
+    policies: List[Policy] = field(default_factory=list)
+
+    def drop_column(self, column: str):
+        """Postgres drops indexes and constraints that involve a dropped column"""
+        self.columns.pop(column, None)
+        if column in self.primary_key:
+            self.primary_key = ()
+        self.indexes = [idx for idx in self.indexes if column not in idx]
+        self.foreign_keys = [fk for fk in self.foreign_keys if column not in fk.columns]
+        self.policies = [p for p in self.policies if column not in p.columns]
+
+    def rename_column(self, old: str, new: str):
+        self.columns = {(new if c == old else c): t for c, t in self.columns.items()}
+        swap = lambda cols: tuple(new if c == old else c for c in cols)
+        self.primary_key = swap(self.primary_key)
+        self.indexes = [swap(idx) for idx in self.indexes]
+        self.foreign_keys = [fk._replace(columns=swap(fk.columns)) for fk in self.foreign_keys]
+        self.policies = [p._replace(columns=swap(p.columns)) for p in self.policies]
+
+    def drop_constraint(self, name: str):
+        kind, value = self.constraints.pop(name, (None, None))
+        if kind == 'pk':
+            self.primary_key = ()
+        elif kind == 'index' and value in self.indexes:
+            self.indexes.remove(value)
+        elif kind == 'fk' and value in self.foreign_keys:
+            self.foreign_keys.remove(value)
+
+
+class SchemaGraph:
+    """Tables plus FK edges, with index coverage lookups"""
+
+    def __init__(self):
+        self.tables: Dict[str, Table] = {}
+        self.enums: Dict[str, List[str]] = {}
+        self.index_names: Dict[str, Tuple[str, Tuple[str, ...]]] = {}  # schema.index -> (table, cols)
+
+    def add(self, table: Table) -> Table:
+        self.tables[table.name] = table
+        return table
+
+    def resolve(self, name: str) -> Optional[str]:
+        """Exact name, else a unique schema-qualified match ('x' -> 'public.x')"""
+        if name in self.tables:
+            return name
+        matches = [t for t in self.tables if t.rsplit('.', 1)[-1] == name.rsplit('.', 1)[-1]]
+        return matches[0] if len(matches) == 1 else None
+
+    def is_indexed(self, table: Table, columns: Tuple[str, ...]) -> bool:
+        """True when columns are a leading prefix of the PK or of some index"""
+        n = len(columns)
+        candidates = [table.primary_key] + table.indexes
+        return any(len(idx) >= n and set(idx[:n]) == set(columns) for idx in candidates if idx)
+
+    def unindexed_foreign_keys(self) -> List[Tuple[Table, ForeignKey]]:
+        return [(t, fk) for t in self.tables.values() for fk in t.foreign_keys
+                if not self.is_indexed(t, fk.columns)]
+
+    def referencing(self, name: str) -> List[Tuple[Table, ForeignKey]]:
+        """FK edges pointing at table name"""
+        return [(t, fk) for t in self.tables.values() for fk in t.foreign_keys
+                if self.resolve(fk.ref_table) == name]
+
+
+# ============================================================================
+#  PRISMA
+# ============================================================================
+
+PRISMA_TOKEN_RE = re.compile(r'''
+    (?P<nl>\n)
+  | (?P<ws>[ \t\r]+)
+  | (?P<comment>//[^\n]*)
+  | (?P<string>"(?:\\.|[^"\\\n])*")
+  | (?P<attr>@@?[A-Za-z_][\w.]*)
+  | (?P<ident>[A-Za-z_]\w*)
+  | (?P<number>-?\d+(?:\.\d+)?)
+  | (?P<punct>[{}()\[\],:=?!.])
+''', re.X)
+
+PRISMA_BLOCKS = {'model', 'enum', 'view', 'type', 'datasource', 'generator'}
+
+
+def tokenize_prisma(text: str) -> Iterator[Token]:
+    line = 1
+    for m in PRISMA_TOKEN_RE.finditer(text):
+        kind = m.lastgroup
+        if kind == 'nl':
+            yield Token('nl', '\n', line)
+            line += 1
+        elif kind not in ('ws', 'comment'):
+            yield Token(kind, m.group(), line)
+
+
+def _split_statements(tokens: List[Token]) -> List[List[Token]]:
+    """Newline-separated statements of a block body (newlines inside () / [] are kept)"""
+    statements, current, depth = [], [], 0
+    for tok in tokens:
+        if tok.kind == 'nl' and depth == 0:
+            if current:
+                statements.append(current)
+            current = []
+            continue
+        if tok.value in '([':
+            depth += 1
+        elif tok.value in ')]':
+            depth -= 1
+        if tok.kind != 'nl':
+            current.append(tok)
+    if current:
+        statements.append(current)
+    return statements
+
+
+def _attr_args(tokens: List[Token], start: int) -> Tuple[List[Token], int]:
+    """Tokens inside the parenthesis following tokens[start-1], and the index after it"""
+    if start >= len(tokens) or tokens[start].value != '(':
+        return [], start
+    depth, i = 0, start
+    while i < len(tokens):
+        if tokens[i].value == '(':
+            depth += 1
+        elif tokens[i].value == ')':
+            depth -= 1
+            if depth == 0:
+                return tokens[start + 1:i], i + 1
+        i += 1
+    return tokens[start + 1:], i
+
+
+def _list_arg(args: List[Token], key: Optional[str] = None) -> Tuple[str, ...]:
+    """Field names from `key: [a, b(sort: Desc)]`, or the first positional list"""
+    i = 0
+    if key is not None:
+        while i < len(args) - 1 and not (args[i].value == key and args[i + 1].value == ':'):
+            i += 1
+        if i >= len(args) - 1:
+            return ()
+        i += 2
+    while i < len(args) and args[i].value != '[':
+        if key is None and args[i].value == ':':
+            return ()  # first argument is named, no positional list
+        i += 1
+    names, bracket, paren = [], 0, 0
+    for tok in args[i:]:
+        if tok.value == '[':
+            bracket += 1
+        elif tok.value == ']':
+            bracket -= 1
+            if bracket == 0:
+                break
+        elif tok.value == '(':
+            paren += 1
+        elif tok.value == ')':
+            paren -= 1
+        elif tok.kind == 'ident' and bracket == 1 and paren == 0:
+            names.append(tok.value)
+    return tuple(names)
+
+
+def parse_prisma(text: str, source: str, graph: Optional[SchemaGraph] = None,
+                 strip_relations: bool = True) -> SchemaGraph:
+    """
+    Parse a Prisma schema into graph (models become tables).
+    strip_relations=False leaves relation fields in place, for callers that
+    parse several files and call strip_relation_fields once at the end.
+    """
+    graph = graph if graph is not None else SchemaGraph()
+    tokens = list(tokenize_prisma(text))
+    i = 0
+    while i < len(tokens):
+        tok = tokens[i]
+        if tok.kind != 'ident' or tok.value not in PRISMA_BLOCKS or i + 2 >= len(tokens):
+            i += 1
+            continue
+        block, name = tok.value, tokens[i + 1].value
+        j = i + 2
+        while j < len(tokens) and tokens[j].value != '{':
+            j += 1
+        depth, k = 0, j
+        while k < len(tokens):
+            if tokens[k].value == '{':
+                depth += 1
+            elif tokens[k].value == '}':
+                depth -= 1
+                if depth == 0:
+                    break
+            k += 1
+        body = tokens[j + 1:k]
+        if block in ('model', 'view'):
+            _parse_model(graph, name, body, source, tok.line)
+        elif block == 'enum':
+            graph.enums[name] = [t.value for t in body if t.kind == 'ident']
+        i = k + 1
+
+    if strip_relations:
+        strip_relation_fields(graph, {source})
+    return graph
+
+
+def strip_relation_fields(graph: SchemaGraph, sources: Set[str]):
+    """Relation fields (typed with another model) are not columns"""
+    for table in graph.tables.values():
+        if table.source in sources:
+            for col, col_type in list(table.columns.items()):
+                if col_type in graph.tables:
+                    del table.columns[col]
+
+
+def _parse_model(graph: SchemaGraph, name: str, body: List[Token], source: str, line: int):
+    table = graph.add(Table(name, source, line))
+    for stmt in _split_statements(body):
+        head = stmt[0]
+        if head.kind == 'attr':
+            args, _ = _attr_args(stmt, 1)
+            cols = _list_arg(args) or _list_arg(args, 'fields')
+            if head.value == '@@id':
+                table.primary_key = cols
+            elif head.value in ('@@index', '@@unique'):
+                table.indexes.append(cols)
+            continue
+        if head.kind != 'ident' or len(stmt) < 2:
+            continue
+
+        field_name, field_type = head.value, stmt[1].value
+        i = 2
+        while i < len(stmt) and stmt[i].kind == 'punct' and stmt[i].value in '?[]!':
+            i += 1
+        table.columns[field_name] = field_type
+        while i < len(stmt):
+            if stmt[i].kind != 'attr':
+                i += 1
+                continue
+            attr = stmt[i].value
+            args, i = _attr_args(stmt, i + 1)
+            if attr == '@id':
+                table.primary_key = (field_name,)
+            elif attr == '@unique':
+                table.indexes.append((field_name,))
+            elif attr == '@relation':
+                fields = _list_arg(args, 'fields')
+                if fields:
+                    table.foreign_keys.append(ForeignKey(
+                        fields, field_type, _list_arg(args, 'references'), stmt[0].line, source))
+
+
+# ============================================================================
+#  SQL
+# ============================================================================
+
+SQL_TOKEN_RE = re.compile(r'''
+    (?P<nl>\n)
+  | (?P<ws>[ \t\r\f]+)
+  | (?P<comment>--[^\n]*|/\*.*?\*/)
+  | (?P<dollar>\$(?P<tag>[A-Za-z_]*)\$.*?\$(?P=tag)\$)
+  | (?P<string>[EeBbXxNn]?'(?:''|[^'])*')
+  | (?P<qident>"(?:""|[^"])*")
+  | (?P<ident>[A-Za-z_][\w$]*)
+  | (?P<number>\d+(?:\.\d+)?)
+  | (?P<punct>::|<=|>=|<>|!=|[(),;.=<>+\-*/%\[\]:])
+''', re.X | re.S)
+
+
+def tokenize_sql(text: str) -> Iterator[Token]:
+    line = 1
+    for m in SQL_TOKEN_RE.finditer(text):
+        kind, value = m.lastgroup, m.group()
+        if kind not in ('nl', 'ws', 'comment'):
+            yield Token(kind, value, line)
+        line += value.count('\n')
+
+
+def split_sql_statements(tokens: Iterator[Token]) -> Iterator[List[Token]]:
+    current = []
+    for tok in tokens:
+        if tok.value == ';':
+            if current:
+                yield current
+            current = []
+        else:
+            current.append(tok)
+    if current:
+        yield current
+
+
+def sql_name(tok: Token) -> str:
+    """Identifier as Postgres stores it: quoted kept, unquoted folded to lower case"""
+    if tok.kind == 'qident':
+        return tok.value[1:-1].replace('""', '"')
+    return tok.value.lower()
+
+
+class SqlCursor:
+    """Keyword-aware cursor over one statement's tokens"""
+
+    def __init__(self, tokens: List[Token]):
+        self.tokens = tokens
+        self.i = 0
+
+    def peek(self, offset: int = 0) -> Optional[Token]:
+        j = self.i + offset
+        return self.tokens[j] if j < len(self.tokens) else None
+
+    def at(self, *words: str) -> bool:
+        for n, word in enumerate(words):
+            tok = self.peek(n)
+            if tok is None or tok.kind not in ('ident', 'punct') or tok.value.upper() != word:
+                return False
+        return True
+
+    def accept(self, *words: str) -> bool:
+        if self.at(*words):
+            self.i += len(words)
+            return True
+        return False
+
+    def next(self) -> Optional[Token]:
+        tok = self.peek()
+        self.i += 1
+        return tok
+
+    def qualified_name(self) -> str:
+        """schema.name -> 'schema.name'; bare name -> 'public.name'"""
+        parts = [sql_name(self.next())]
+        while self.at('.'):
+            self.i += 1
+            parts.append(sql_name(self.next()))
+        return '.'.join(parts) if len(parts) > 1 else f'public.{parts[0]}'
+
+    def group(self) -> List[Token]:
+        """Tokens inside the parenthesis at the cursor; cursor moves past it"""
+        if not self.at('('):
+            return []
+        depth, start = 0, self.i
+        while self.i < len(self.tokens):
+            tok = self.tokens[self.i]
+            self.i += 1
+            if tok.value == '(':
+                depth += 1
+            elif tok.value == ')':
+                depth -= 1
+                if depth == 0:
+                    return self.tokens[start + 1:self.i - 1]
+        return self.tokens[start + 1:]
+
+    def rest(self) -> List[Token]:
+        return self.tokens[self.i:]
+
+
+def split_commas(tokens: List[Token]) -> List[List[Token]]:
+    """Top-level comma separated items"""
+    items, current, depth = [], [], 0
+    for tok in tokens:
+        if tok.value == '(':
+            depth += 1
+        elif tok.value == ')':
+            depth -= 1
+        if tok.value == ',' and depth == 0:
+            items.append(current)
+            current = []
+        else:
+            current.append(tok)
+    if current:
+        items.append(current)
+    return items
+
+
+def column_list(tokens: List[Token]) -> Tuple[str, ...]:
+    """Index/constraint columns; stops at the first expression (not index-usable)"""
+    cols = []
+    for item in split_commas(tokens):
+        if not item or item[0].kind not in ('ident', 'qident') or \
+                (len(item) > 1 and item[1].value == '('):
+            break
+        cols.append(sql_name(item[0]))
+    return tuple(cols)
+
+
+def parse_references(cur: SqlCursor) -> Tuple[str, Tuple[str, ...]]:
+    """After REFERENCES: target table and its columns"""
+    target = cur.qualified_name()
+    return target, column_list(cur.group())
+
+
+def parse_table_element(table: Table, item: List[Token], line: int, source: str = ''):
+    """One CREATE TABLE element (column or table constraint)"""
+    cur = SqlCursor(item)
+    constraint = sql_name(cur.next()) if cur.accept('CONSTRAINT') else None
+    if cur.accept('PRIMARY', 'KEY'):
+        table.primary_key = column_list(cur.group())
+        if constraint:
+            table.constraints[constraint] = ('pk', table.primary_key)
+    elif cur.accept('UNIQUE'):
+        cur.accept('NULLS', 'NOT', 'DISTINCT')
+        cols = column_list(cur.group())
+        if cols:
+            table.indexes.append(cols)
+            if constraint:
+                table.constraints[constraint] = ('index', cols)
+    elif cur.accept('FOREIGN', 'KEY'):
+        cols = column_list(cur.group())
+        if cur.accept('REFERENCES'):
+            target, ref_cols = parse_references(cur)
+            fk = ForeignKey(cols, target, ref_cols, line, source)
+            table.foreign_keys.append(fk)
+            if constraint:
+                table.constraints[constraint] = ('fk', fk)
+    elif cur.at('CHECK') or cur.at('EXCLUDE') or cur.at('LIKE'):
+        return
+    else:
+        parse_column_def(table, cur, line, source)
+
+
+COLUMN_CONSTRAINT_WORDS = ['CONSTRAINT', 'NOT', 'NULL', 'DEFAULT', 'PRIMARY', 'UNIQUE',
+                           'REFERENCES', 'CHECK', 'GENERATED', 'COLLATE']
+
+
+def parse_column_def(table: Table, cur: SqlCursor, line: int, source: str = ''):
+    name = sql_name(cur.next())
+    type_tokens = []
+    while cur.peek() is not None and not any(cur.at(k) for k in COLUMN_CONSTRAINT_WORDS):
+        tok = cur.next()
+        if tok.value == '(' and type_tokens:
+            cur.i -= 1
+            type_tokens[-1] += '(' + ''.join(t.value for t in cur.group()) + ')'
+        else:
+            type_tokens.append(tok.value)
+    table.columns[name] = ' '.join(type_tokens).upper()
+
+    while cur.peek() is not None:
+        if cur.accept('PRIMARY', 'KEY'):
+            table.primary_key = (name,)
+        elif cur.accept('UNIQUE'):
+            table.indexes.append((name,))
+        elif cur.accept('REFERENCES'):
+            target, ref_cols = parse_references(cur)
+            table.foreign_keys.append(ForeignKey((name,), target, ref_cols, line, source))
+        elif cur.at('('):
+            cur.group()
+        else:
+            cur.next()
+
+
+def parse_sql(text: str, source: str, graph: Optional[SchemaGraph] = None) -> SchemaGraph:
+    """Apply the DDL statements of one SQL file to graph"""
+    graph = graph if graph is not None else SchemaGraph()
+    for stmt in split_sql_statements(tokenize_sql(text)):
+        cur = SqlCursor(stmt)
+        line = stmt[0].line
+        if cur.accept('CREATE'):
+            cur.accept('OR', 'REPLACE')
+            for modifier in ('GLOBAL', 'LOCAL', 'TEMPORARY', 'TEMP', 'UNLOGGED'):
+                cur.accept(modifier)
+            if cur.accept('TABLE'):
+                cur.accept('IF', 'NOT', 'EXISTS')
+                name = cur.qualified_name()
+                table = graph.add(Table(name, source, line))
+                for item in split_commas(cur.group()):
+                    if item:
+                        parse_table_element(table, item, item[0].line, source)
+            elif cur.at('UNIQUE', 'INDEX') or cur.at('INDEX'):
+                parse_create_index(graph, cur)
+            elif cur.accept('POLICY'):
+                parse_create_policy(graph, cur, line, source)
+        elif cur.accept('ALTER', 'TABLE'):
+            parse_alter_table(graph, cur, source)
+        elif cur.accept('DROP'):
+            parse_drop(graph, cur)
+    return graph
+
+
+def parse_drop(graph: SchemaGraph, cur: SqlCursor):
+    """DROP TABLE / DROP INDEX / DROP POLICY"""
+    if cur.accept('POLICY'):
+        cur.accept('IF', 'EXISTS')
+        policy = sql_name(cur.next())
+        if cur.accept('ON'):
+            name = graph.resolve(cur.qualified_name())
+            if name:
+                table = graph.tables[name]
+                table.policies = [p for p in table.policies if p.name != policy]
+        return
+
+    kind = 'TABLE' if cur.accept('TABLE') else 'INDEX' if cur.accept('INDEX') else None
+    if kind is None:
+        return
+    cur.accept('CONCURRENTLY')
+    cur.accept('IF', 'EXISTS')
+    for item in split_commas(cur.rest()):
+        item = [t for t in item if t.value.upper() not in ('CASCADE', 'RESTRICT')]
+        if not item:
+            continue
+        target = SqlCursor(item).qualified_name()
+        if kind == 'TABLE':
+            name = graph.resolve(target)
+            if name:
+                # CASCADE drops the FK constraints pointing at it
+                for table in graph.tables.values():
+                    table.foreign_keys = [fk for fk in table.foreign_keys
+                                          if graph.resolve(fk.ref_table) != name]
+                del graph.tables[name]
+                graph.index_names = {k: v for k, v in graph.index_names.items() if v[0] != name}
+        else:
+            key = target if target in graph.index_names else next(
+                (k for k in graph.index_names if k.rsplit('.', 1)[-1] == target.rsplit('.', 1)[-1]), None)
+            if key:
+                table_name, cols = graph.index_names.pop(key)
+                table = graph.tables.get(table_name)
+                if table and cols in table.indexes:
+                    table.indexes.remove(cols)
+
+
+def parse_create_policy(graph: SchemaGraph, cur: SqlCursor, line: int, source: str = ''):
+    """CREATE POLICY name ON table [AS ..] [FOR cmd] [TO ..] [USING (..)] [WITH CHECK (..)]"""
+    policy = sql_name(cur.next())
+    if not cur.accept('ON'):
+        return
+    name = graph.resolve(cur.qualified_name())
+    if not name:
+        return
+    table = graph.tables[name]
+    command, expr = 'ALL', []
+    while cur.peek() is not None:
+        if cur.accept('FOR'):
+            command = cur.next().value.upper()
+        elif cur.accept('USING') or cur.accept('WITH', 'CHECK'):
+            expr.extend(cur.group())
+        else:
+            cur.next()
+    columns = []
+    for i, tok in enumerate(expr):
+        nxt = expr[i + 1].value if i + 1 < len(expr) else ''
+        col = sql_name(tok) if tok.kind in ('ident', 'qident') else None
+        if col in table.columns and nxt != '(' and col not in columns:
+            columns.append(col)
+    table.policies.append(Policy(policy, command, tuple(columns), line, source))
+
+
+def parse_create_index(graph: SchemaGraph, cur: SqlCursor):
+    cur.accept('UNIQUE')
+    cur.accept('INDEX')
+    cur.accept('CONCURRENTLY')
+    cur.accept('IF', 'NOT', 'EXISTS')
+    index_name = None if cur.at('ON') else sql_name(cur.next())
+    if not cur.accept('ON'):
+        return
+    cur.accept('ONLY')
+    name = graph.resolve(cur.qualified_name())
+    if cur.accept('USING'):
+        cur.next()
+    cols = column_list(cur.group())
+    if name and cols:  # pure expression indexes cannot serve column lookups
+        graph.tables[name].indexes.append(cols)
+        if index_name:
+            schema = name.rsplit('.', 1)[0]
+            graph.index_names[f'{schema}.{index_name}'] = (name, cols)
+
+
+def parse_alter_table(graph: SchemaGraph, cur: SqlCursor, source: str = ''):
+    cur.accept('IF', 'EXISTS')
+    cur.accept('ONLY')
+    name = graph.resolve(cur.qualified_name())
+    if not name:
+        return
+    table = graph.tables[name]
+    for action in split_commas(cur.rest()):
+        act = SqlCursor(action)
+        if act.accept('ADD'):
+            if act.at('CONSTRAINT') or act.at('PRIMARY') or act.at('UNIQUE') or act.at('FOREIGN'):
+                parse_table_element(table, act.rest(), action[0].line, source)
+            elif not (act.at('CHECK') or act.at('EXCLUDE')):
+                act.accept('COLUMN')
+                act.accept('IF', 'NOT', 'EXISTS')
+                parse_column_def(table, act, action[0].line, source)
+        elif act.accept('DROP'):
+            if act.accept('CONSTRAINT'):
+                act.accept('IF', 'EXISTS')
+                table.drop_constraint(sql_name(act.next()))
+            else:
+                act.accept('COLUMN')
+                act.accept('IF', 'EXISTS')
+                drop_column(graph, table, sql_name(act.next()))
+        elif act.accept('RENAME'):
+            if act.accept('TO'):
+                rename_table(graph, table, sql_name(act.next()))
+            elif act.accept('CONSTRAINT'):
+                old = sql_name(act.next())
+                act.accept('TO')
+                if old in table.constraints:
+                    table.constraints[sql_name(act.next())] = table.constraints.pop(old)
+            else:
+                act.accept('COLUMN')
+                old = sql_name(act.next())
+                act.accept('TO')
+                rename_column(graph, table, old, sql_name(act.next()))
+        elif act.accept('ALTER'):
+            act.accept('COLUMN')
+            column = sql_name(act.next())
+            if (act.accept('TYPE') or act.accept('SET', 'DATA', 'TYPE')) and column in table.columns:
+                table.columns[column] = ' '.join(t.value for t in act.rest()
+                                                 if t.value.upper() != 'USING').upper()
+        elif act.accept('ENABLE', 'ROW', 'LEVEL', 'SECURITY') or \
+                act.accept('FORCE', 'ROW', 'LEVEL', 'SECURITY'):
+            table.rls = True
+        elif act.accept('DISABLE', 'ROW', 'LEVEL', 'SECURITY'):
+            table.rls = False
+
+
+def rename_table(graph: SchemaGraph, table: Table, new: str):
+    """ALTER TABLE .. RENAME TO keeps the schema; FKs follow the table"""
+    old = table.name
+    table.name = f"{old.rsplit('.', 1)[0]}.{new}"
+    graph.tables = {(table.name if k == old else k): v for k, v in graph.tables.items()}
+    for other in graph.tables.values():
+        other.foreign_keys = [fk._replace(ref_table=table.name) if fk.ref_table == old else fk
+                              for fk in other.foreign_keys]
+    graph.index_names = {k: ((table.name, cols) if t == old else (t, cols))
+                         for k, (t, cols) in graph.index_names.items()}
+
+
+def rename_column(graph: SchemaGraph, table: Table, old: str, new: str):
+    """RENAME COLUMN; named indexes keep pointing at the renamed column"""
+    table.rename_column(old, new)
+    graph.index_names = {k: ((t, tuple(new if c == old else c for c in cols)) if t == table.name else (t, cols))
+                         for k, (t, cols) in graph.index_names.items()}
+
+
+def drop_column(graph: SchemaGraph, table: Table, column: str):
+    """DROP COLUMN; the indexes Postgres drops with it lose their names too"""
+    table.drop_column(column)
+    graph.index_names = {k: (t, cols) for k, (t, cols) in graph.index_names.items()
+                         if not (t == table.name and column in cols)}
+
+
+def load_schema(paths: List[Path], graph: Optional[SchemaGraph] = None) -> SchemaGraph:
+    """Parse .prisma and .sql files (SQL in the given order) into one graph"""
+    graph = graph if graph is not None else SchemaGraph()
+    prisma_sources = set()
+    for path in paths:
+        text = path.read_text(encoding='utf-8', errors='ignore')
+        if path.suffix == '.prisma':
+            parse_prisma(text, str(path), graph, strip_relations=False)
+            prisma_sources.add(str(path))
+        elif path.suffix == '.sql':
+            parse_sql(text, str(path), graph)
+    # After every file: a relation may point at a model from another file
+    strip_relation_fields(graph, prisma_sources)
+    return graph
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python schema_parser.py <schema.prisma | migration.sql>...")
+        sys.exit(1)
+
+    graph = load_schema([Path(p) for p in sys.argv[1:]])
+    print(json.dumps({
+        name: {
+            "columns": t.columns,
+            "primary_key": t.primary_key,
+            "indexes": t.indexes,
+            "foreign_keys": [fk._asdict() for fk in t.foreign_keys],
+            "rls": t.rls,
+            "policies": [p._asdict() for p in t.policies],
+        }
+        for name, t in graph.tables.items()
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
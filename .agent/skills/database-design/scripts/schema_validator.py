@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 Schema Validator - Database schema validation
-Validates Prisma schemas and checks for common issues.
+Validates Prisma schemas and Supabase SQL migrations and checks for common issues.
 
 Usage:
     python schema_validator.py <project_path>
@@ -9,13 +9,13 @@ Usage:
 Checks:
     - Prisma schema syntax
     - Missing relations
-    - Index recommendations
+    - Index recommendations (unindexed foreign keys / relation fields)
     - Naming conventions
 """
 
+import os
 import sys
 import json
-import re
 from pathlib import Path
 from datetime import datetime
 
@@ -25,63 +25,76 @@ try:
 except:
     pass
 
+sys.path.insert(0, str(Path(__file__).parent))
+from schema_parser import SchemaGraph, load_schema
+
+SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '.next', 'coverage', '__pycache__',
+             '.venv', 'venv', '.agent'}
+DRIZZLE_DIRS = {'drizzle', 'schema'}
+
 
 def find_schema_files(project_path: Path) -> list:
-    """Find database schema files."""
+    """Find database schema files in one pruned walk (vendored trees are never entered)."""
     schemas = []
     
-    # Prisma schema
-    prisma_files = list(project_path.glob('**/prisma/schema.prisma'))
-    schemas.extend([('prisma', f) for f in prisma_files])
-    
-    # Drizzle schema files
-    drizzle_files = list(project_path.glob('**/drizzle/*.ts'))
-    drizzle_files.extend(project_path.glob('**/schema/*.ts'))
-    for f in drizzle_files:
-        if 'schema' in f.name.lower() or 'table' in f.name.lower():
-            schemas.append(('drizzle', f))
-    
-    return schemas[:10]  # Limit
+    for root, dirs, files in os.walk(project_path):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS)
+        root_path = Path(root)
+        for name in sorted(files):
+            file_path = root_path / name
+            if name.endswith('.prisma'):
+                # Prisma schema
+                schemas.append(('prisma', file_path))
+            elif name.endswith('.sql') and root_path.parts[-2:] == ('supabase', 'migrations'):
+                # Supabase migrations, replayed in filename (timestamp) order
+                schemas.append(('sql', file_path))
+            elif name.endswith('.ts') and root_path.name in DRIZZLE_DIRS and \
+                    ('schema' in name.lower() or 'table' in name.lower()):
+                # Drizzle schema files
+                schemas.append(('drizzle', file_path))
+    
+    return schemas
+
 
+def index_issues(graph: SchemaGraph, prisma: bool) -> list:
+    """Foreign keys whose columns are not the leading columns of any index."""
+    issues = []
+    for table, fk in graph.unindexed_foreign_keys():
+        cols = ', '.join(fk.columns)
+        if prisma:
+            issues.append(f"Relation {table.name}.[{cols}] -> {fk.ref_table} is not indexed: "
+                          f"add @@index([{cols}]) to {table.name}")
+        else:
+            issues.append(f"Foreign key {table.name}({cols}) -> {fk.ref_table} is not indexed: "
+                          f"CREATE INDEX ON {table.name} ({cols});")
+    return issues
 
-def validate_prisma_schema(file_path: Path) -> list:
-    """Validate Prisma schema file."""
+
+def validate_prisma_schema(files: list) -> list:
+    """Validate Prisma schema files as one schema (relations may span files)."""
     issues = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
-        
-        # Find all models
-        models = re.findall(r'model\s+(\w+)\s*{([^}]+)}', content, re.DOTALL)
+        graph = load_schema(files)
         
-        for model_name, model_body in models:
+        for model_name, model in graph.tables.items():
             # Check naming convention (PascalCase)
             if not model_name[0].isupper():
                 issues.append(f"Model '{model_name}' should be PascalCase")
             
             # Check for id field
-            if '@id' not in model_body and 'id' not in model_body.lower():
+            if not model.primary_key and not any(cols for cols in model.indexes):
                 issues.append(f"Model '{model_name}' might be missing @id field")
             
             # Check for createdAt/updatedAt
-            if 'createdAt' not in model_body and 'created_at' not in model_body:
+            if 'createdAt' not in model.columns and 'created_at' not in model.columns:
                 issues.append(f"Model '{model_name}' missing createdAt field (recommended)")
-            
-            # Check for @relation without fields
-            relations = re.findall(r'@relation\([^)]*\)', model_body)
-            for rel in relations:
-                if 'fields:' not in rel and 'references:' not in rel:
-                    pass  # Implicit relation, ok
-            
-            # Check for @@index suggestions
-            foreign_keys = re.findall(r'(\w+Id)\s+\w+', model_body)
-            for fk in foreign_keys:
-                if f'@@index([{fk}])' not in content and f'@@index(["{fk}"])' not in content:
-                    issues.append(f"Consider adding @@index([{fk}]) for better query performance in {model_name}")
+        
+        # Check for @@index on relation scalars
+        issues.extend(index_issues(graph, prisma=True))
         
         # Check for enum definitions
-        enums = re.findall(r'enum\s+(\w+)\s*{', content)
-        for enum_name in enums:
+        for enum_name in graph.enums:
             if not enum_name[0].isupper():
                 issues.append(f"Enum '{enum_name}' should be PascalCase")
         
@@ -91,8 +104,25 @@ def validate_prisma_schema(file_path: Path) -> list:
     return issues
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+def validate_sql_migrations(files: list) -> list:
+    """Replay migrations in order into one schema and validate the result."""
+    issues = []
+    
+    try:
+        graph = load_schema(files)
+        for name, table in graph.tables.items():
+            if not table.primary_key:
+                issues.append(f"Table '{name}' has no primary key")
+        issues.extend(index_issues(graph, prisma=False))
+    except Exception as e:
+        issues.append(f"Error reading migrations: {str(e)[:50]}")
+    
+    return issues
+
+
+def run(project_path=".", **opts) -> dict:
+    """Run the checks and return the structured result (importable entry point)."""
+    project_path = Path(project_path).resolve()
     
     print(f"\n{'='*60}")
     print(f"[SCHEMA VALIDATOR] Database Schema Validation")
@@ -114,19 +144,17 @@ def main():
             "passed": True,
             "message": "No schema files found"
         }
-        print(json.dumps(output, indent=2))
-        sys.exit(0)
+        return output
     
     # Validate each schema
     all_issues = []
     
     for schema_type, file_path in schemas:
+        if schema_type in ('sql', 'prisma'):
+            continue
         print(f"\nValidating: {file_path.name} ({schema_type})")
         
-        if schema_type == 'prisma':
-            issues = validate_prisma_schema(file_path)
-        else:
-            issues = []  # Drizzle validation could be added
+        issues = []  # Drizzle validation could be added
         
         if issues:
             all_issues.append({
@@ -135,6 +163,30 @@ def main():
                 "issues": issues
             })
     
+    # A multi-file Prisma schema is one graph: relations resolve across files
+    prisma_files = [f for t, f in schemas if t == 'prisma']
+    if prisma_files:
+        print(f"\nValidating: {', '.join(f.name for f in prisma_files)} (prisma)")
+        issues = validate_prisma_schema(prisma_files)
+        if issues:
+            all_issues.append({
+                "file": ", ".join(f.name for f in prisma_files),
+                "type": "prisma",
+                "issues": issues
+            })
+    
+    # Migrations describe one schema together, so validate them as a set
+    migrations = [f for t, f in schemas if t == 'sql']
+    if migrations:
+        print(f"\nValidating: {len(migrations)} SQL migrations (replayed in order)")
+        issues = validate_sql_migrations(migrations)
+        if issues:
+            all_issues.append({
+                "file": str(migrations[0].parent.relative_to(project_path)),
+                "type": "sql",
+                "issues": issues
+            })
+    
     # Summary
     print("\n" + "="*60)
     print("SCHEMA ISSUES")
@@ -163,9 +215,13 @@ def main():
         "issues": all_issues
     }
     
+    return output
+
+
+def main():
+    output = run(sys.argv[1] if len(sys.argv) > 1 else ".")
     print("\n" + json.dumps(output, indent=2))
-    
-    sys.exit(0)
+    sys.exit(0 if output["passed"] else 1)
 
 
 if __name__ == "__main__":
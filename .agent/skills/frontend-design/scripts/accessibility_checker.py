@@ -14,6 +14,7 @@ Checks:
     - Semantic HTML
 """
 
+import os
 import sys
 import json
 import re
@@ -27,18 +28,20 @@ except:
     pass
 
 
+SKIP_DIRS = {'node_modules', '.next', 'dist', 'build', '.git'}
+MARKUP_EXTENSIONS = {'.html', '.jsx', '.tsx'}
+
+
 def find_html_files(project_path: Path) -> list:
-    """Find all HTML/JSX/TSX files."""
-    patterns = ['**/*.html', '**/*.jsx', '**/*.tsx']
-    skip_dirs = {'node_modules', '.next', 'dist', 'build', '.git'}
-    
+    """Find all HTML/JSX/TSX files, pruning SKIP_DIRS before descending."""
     files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            if not any(skip in f.parts for skip in skip_dirs):
-                files.append(f)
+    for root, dirs, names in os.walk(project_path):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for name in names:
+            if Path(name).suffix.lower() in MARKUP_EXTENSIONS:
+                files.append(Path(root) / name)
     
-    return files[:50]
+    return sorted(files)
 
 
 def check_accessibility(file_path: Path) -> list:
@@ -108,8 +111,9 @@ def check_accessibility(file_path: Path) -> list:
     return issues
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+def run(project_path=".", **opts) -> dict:
+    """Run the checks and return the structured result (importable entry point)."""
+    project_path = Path(project_path).resolve()
     
     print(f"\n{'='*60}")
     print(f"[ACCESSIBILITY CHECKER] WCAG Compliance Audit")
@@ -131,8 +135,7 @@ def main():
             "passed": True,
             "message": "No HTML files found"
         }
-        print(json.dumps(output, indent=2))
-        sys.exit(0)
+        return output
     
     # Check each file
     all_issues = []
@@ -174,9 +177,13 @@ def main():
         "passed": passed
     }
     
+    return output
+
+
+def main():
+    output = run(sys.argv[1] if len(sys.argv) > 1 else ".")
     print("\n" + json.dumps(output, indent=2))
-    
-    sys.exit(0 if passed else 1)
+    sys.exit(0 if output["passed"] else 1)
 
 
 if __name__ == "__main__":
@@ -688,17 +688,23 @@ class UXAuditor:
             "compliant": len(self.issues) == 0
         }
 
+def run(path=".", **opts) -> dict:
+    """Audit a file or directory and return the report (importable entry point)."""
+    auditor = UXAuditor()
+    if os.path.isfile(path): auditor.audit_file(path)
+    else: auditor.audit_directory(path)
+    
+    report = auditor.get_report()
+    report['passed'] = report['compliant']
+    return report
+
 def main():
     if len(sys.argv) < 2: sys.exit(1)
     
     path = sys.argv[1]
     is_json = "--json" in sys.argv
     
-    auditor = UXAuditor()
-    if os.path.isfile(path): auditor.audit_file(path)
-    else: auditor.audit_directory(path)
-    
-    report = auditor.get_report()
+    report = run(path)
     
     if is_json:
         print(json.dumps(report))
@@ -16,6 +16,7 @@ WHAT IT CHECKS:
 Usage:
     python geo_checker.py <project_path>
 """
+import os
 import sys
 import re
 import json
@@ -44,56 +45,72 @@ SKIP_FILES = {
 }
 
 
-def is_page_file(file_path: Path) -> bool:
-    """Check if this file is likely a public-facing page."""
+PAGE_EXTENSIONS = {'.html', '.htm', '.jsx', '.tsx'}
+PAGE_DIRS = {'pages', 'app', 'routes'}
+
+# Likely page indicators
+PAGE_INDICATORS = ['page', 'index', 'home', 'about', 'contact', 'blog',
+                   'post', 'article', 'product', 'service', 'landing']
+
+
+def walk_files(project_path: Path, extensions: set):
+    """Yield files by extension, pruning SKIP_DIRS before descending."""
+    for root, dirs, files in os.walk(project_path):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for name in files:
+            if Path(name).suffix.lower() in extensions:
+                yield Path(root) / name
+
+
+def page_score(file_path: Path) -> int:
+    """Score how likely a file is a public-facing page (0 = not a page)."""
     name = file_path.stem.lower()
     
     # Skip config/utility files
     if any(skip in name for skip in SKIP_FILES):
-        return False
+        return 0
     
     # Skip test files
     if name.endswith('.test') or name.endswith('.spec'):
-        return False
+        return 0
     if name.startswith('test_') or name.startswith('spec_'):
-        return False
+        return 0
     
-    # Likely page indicators
-    page_indicators = ['page', 'index', 'home', 'about', 'contact', 'blog', 
-                       'post', 'article', 'product', 'service', 'landing']
+    score = 0
     
     # Check if it's in a pages/app directory (Next.js, etc.)
     parts = [p.lower() for p in file_path.parts]
-    if 'pages' in parts or 'app' in parts or 'routes' in parts:
-        return True
+    if any(d in parts for d in PAGE_DIRS):
+        score += 3
     
     # Check filename indicators
-    if any(ind in name for ind in page_indicators):
-        return True
+    if name in PAGE_INDICATORS:
+        score += 2
+    elif any(ind in name for ind in PAGE_INDICATORS):
+        score += 1
     
     # HTML files are usually pages
     if file_path.suffix.lower() == '.html':
-        return True
+        score += 2
     
-    return False
+    return score
+
+
+def is_page_file(file_path: Path) -> bool:
+    """Check if this file is likely a public-facing page."""
+    return page_score(file_path) > 0
 
 
 def find_web_pages(project_path: Path) -> list:
-    """Find public-facing web pages only."""
-    patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
-    
-    files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            # Skip excluded directories
-            if any(skip in f.parts for skip in SKIP_DIRS):
-                continue
-            
-            # Check if it's likely a page
-            if is_page_file(f):
-                files.append(f)
-    
-    return files[:30]  # Limit to 30 pages
+    """Find public-facing web pages only, most page-like first."""
+    scored = []
+    for f in walk_files(project_path, PAGE_EXTENSIONS):
+        score = page_score(f.relative_to(project_path))
+        if score > 0:
+            scored.append((score, f))
+    
+    scored.sort(key=lambda x: (-x[0], str(x[1])))
+    return [f for _, f in scored]
 
 
 def check_page(file_path: Path) -> dict:
@@ -219,8 +236,8 @@ def check_page(file_path: Path) -> dict:
     }
 
 
-def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
+def run(target=".", **opts) -> dict:
+    """Run the checks and return the structured result (importable entry point)."""
     target_path = Path(target).resolve()
     
     print("\n" + "=" * 60)
@@ -237,8 +254,7 @@ def main():
         print("    Looking for: HTML, JSX, TSX files in pages/app directories")
         print("    Skipping: docs, tests, config files, node_modules")
         output = {"script": "geo_checker", "pages_found": 0, "passed": True}
-        print("\n" + json.dumps(output, indent=2))
-        sys.exit(0)
+        return output
     
     print(f"Found {len(pages)} public pages to analyze\n")
     
@@ -280,9 +296,13 @@ def main():
         "average_score": round(avg_score),
         "passed": avg_score >= 60
     }
+    return output
+
+
+def main():
+    output = run(sys.argv[1] if len(sys.argv) > 1 else ".")
     print("\n" + json.dumps(output, indent=2))
-    
-    sys.exit(0 if avg_score >= 60 else 1)
+    sys.exit(0 if output["passed"] else 1)
 
 
 if __name__ == "__main__":
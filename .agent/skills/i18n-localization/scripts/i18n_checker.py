@@ -2,10 +2,21 @@
 """
 i18n Checker - Detects hardcoded strings and missing translations.
 Scans for untranslated text in React, Vue, and Python files.
+
+Every code file is checked; results are cached per content hash in
+.agent/cache/i18n_checker.json so unchanged files are not re-scanned.
+Locale key sets and per-namespace diffs are kept in .agent/cache/i18n_locales.json;
+only namespaces whose files changed are re-compared.
+
+Usage: python i18n_checker.py <project_path> [--no-cache]
 """
+import os
 import sys
 import re
 import json
+import hashlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Fix Windows console encoding for Unicode output
@@ -50,24 +61,146 @@ I18N_PATTERNS = [
     r'i18n\.',             # Generic i18n
 ]
 
+# Compiled once and shared by every file (and every worker process)
+HARDCODED_RES = {k: [re.compile(p) for p in v] for k, v in HARDCODED_PATTERNS.items()}
+I18N_RE = re.compile('|'.join(I18N_PATTERNS))
+
+CODE_EXTENSIONS = {
+    '.tsx': 'jsx', '.jsx': 'jsx', '.ts': 'jsx', '.js': 'jsx',
+    '.vue': 'vue',
+    '.py': 'python'
+}
+SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '__pycache__', 'venv', '.venv',
+             'test', 'tests', '__tests__', 'spec'}
+
+# Per-file results keyed by content hash; invalidated when the patterns change
+CACHE_FILE = Path('.agent') / 'cache' / 'i18n_checker.json'
+PATTERNS_VERSION = hashlib.sha1(
+    json.dumps([HARDCODED_PATTERNS, I18N_PATTERNS], sort_keys=True).encode()
+).hexdigest()[:12]
+
+# Below this many uncached files a process pool costs more than it saves
+PARALLEL_THRESHOLD = 200
+# Files per task sent to the pool
+BATCH_SIZE = 64
+
+LOCALE_DIRS = {'locales', 'translations', 'lang', 'i18n', 'messages'}
+LOCALE_CACHE_FILE = Path('.agent') / 'cache' / 'i18n_locales.json'
+BASE_LANGS = ['en', 'en-US', 'en_US']
+
 def find_locale_files(project_path: Path) -> list:
-    """Find translation/locale files."""
-    patterns = [
-        "**/locales/**/*.json",
-        "**/translations/**/*.json",
-        "**/lang/**/*.json",
-        "**/i18n/**/*.json",
-        "**/messages/*.json",
-        "**/*.po",  # gettext
-    ]
-    
+    """Find translation/locale files, pruning SKIP_DIRS before descending."""
     files = []
-    for pattern in patterns:
-        files.extend(project_path.glob(pattern))
-    
-    return [f for f in files if 'node_modules' not in str(f)]
+    for root, dirs, names in os.walk(project_path):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        in_locale_dir = any(part in LOCALE_DIRS for part in Path(root).relative_to(project_path).parts)
+        for name in names:
+            if name.endswith('.po') or (in_locale_dir and name.endswith('.json')):
+                files.append(Path(root) / name)
+    return sorted(files)
+
+def locale_of(f: Path) -> tuple:
+    """(language, namespace) for a locale file.
+
+    locales/en/common.json -> ('en', 'common'); messages/en.json -> ('en', '_').
+    """
+    if f.parent.name in LOCALE_DIRS:
+        return f.stem, '_'
+    return f.parent.name, f.stem
+
+class LocaleIndex:
+    """Per-locale key sets, persisted so unchanged files are never re-parsed.
+
+    Diffs are kept per (language, namespace); when a file changes only the
+    pairs involving its namespace are recomputed.
+    """
 
-def check_locale_completeness(locale_files: list) -> dict:
+    def __init__(self, project_path: Path, use_cache: bool = True):
+        self.project_path = project_path
+        self.use_cache = use_cache
+        self.files = {}   # relpath -> {'sig', 'lang', 'ns', 'keys'}
+        self.diffs = {}   # 'lang/ns' -> [missing, extra] (sorted key lists)
+        self.base_lang = None
+        if use_cache:
+            try:
+                data = json.loads((project_path / LOCALE_CACHE_FILE).read_text(encoding='utf-8'))
+                self.files = data.get('files', {})
+                self.diffs = data.get('diffs', {})
+                self.base_lang = data.get('base_lang')
+            except (OSError, ValueError):
+                pass
+
+    def save(self):
+        if not self.use_cache:
+            return
+        try:
+            path = self.project_path / LOCALE_CACHE_FILE
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps({'files': self.files, 'diffs': self.diffs,
+                                        'base_lang': self.base_lang}), encoding='utf-8')
+        except OSError:
+            pass
+
+    def update(self, locale_files: list) -> set:
+        """Reload changed files; return the namespaces whose keys changed."""
+        changed_ns = set()
+        current = set()
+        for f in locale_files:
+            if f.suffix != '.json':
+                continue
+            rel = str(f.relative_to(self.project_path))
+            current.add(rel)
+            try:
+                st = f.stat()
+            except OSError:
+                continue
+            sig = [st.st_mtime_ns, st.st_size]
+            entry = self.files.get(rel)
+            if entry and entry['sig'] == sig:
+                continue
+            try:
+                keys = sorted(flatten_keys(json.loads(f.read_text(encoding='utf-8'))))
+            except (OSError, ValueError, AttributeError):
+                continue
+            lang, ns = locale_of(f)
+            if not entry or entry['keys'] != keys:
+                changed_ns.add(ns)
+            self.files[rel] = {'sig': sig, 'lang': lang, 'ns': ns, 'keys': keys}
+        for rel in set(self.files) - current:
+            changed_ns.add(self.files.pop(rel)['ns'])
+        return changed_ns
+
+    def key_sets(self) -> dict:
+        locales = {}
+        for entry in self.files.values():
+            locales.setdefault(entry['lang'], {})[entry['ns']] = set(entry['keys'])
+        return locales
+
+    def compare(self, changed_ns: set) -> dict:
+        """Diff every language against the base, recomputing only changed namespaces."""
+        locales = self.key_sets()
+        langs = sorted(locales)
+        base = next((l for l in BASE_LANGS if l in locales), langs[0] if langs else None)
+        if base != self.base_lang:
+            self.base_lang = base
+            self.diffs = {}
+            changed_ns = {ns for by_ns in locales.values() for ns in by_ns}
+
+        namespaces = {ns for by_ns in locales.values() for ns in by_ns}
+        self.diffs = {k: v for k, v in self.diffs.items() if k.split('/', 1)[1] in namespaces
+                      and k.split('/', 1)[0] in locales}
+        for ns in changed_ns & namespaces:
+            base_keys = locales[base].get(ns, set())
+            for lang in langs:
+                if lang == base:
+                    continue
+                other_keys = locales[lang].get(ns, set())
+                self.diffs[f"{lang}/{ns}"] = [sorted(base_keys - other_keys),
+                                              sorted(other_keys - base_keys)]
+        return self.diffs
+
+def check_locale_completeness(locale_files: list, project_path: Path = None,
+                              use_cache: bool = True) -> dict:
     """Check if all locales have the same keys."""
     issues = []
     passed = []
@@ -75,114 +208,184 @@ def check_locale_completeness(locale_files: list) -> dict:
     if not locale_files:
         return {'passed': [], 'issues': ["[!] No locale files found"]}
     
-    # Group by parent folder (language)
-    locales = {}
-    for f in locale_files:
-        if f.suffix == '.json':
-            try:
-                lang = f.parent.name
-                content = json.loads(f.read_text(encoding='utf-8'))
-                if lang not in locales:
-                    locales[lang] = {}
-                locales[lang][f.stem] = set(flatten_keys(content))
-            except:
-                continue
+    project_path = project_path or Path('.')
+    index = LocaleIndex(project_path.resolve(), use_cache)
+    changed_ns = index.update([f.resolve() for f in locale_files])
+    locales = index.key_sets()
     
     if len(locales) < 2:
+        index.save()
         passed.append(f"[OK] Found {len(locale_files)} locale file(s)")
         return {'passed': passed, 'issues': issues}
     
-    passed.append(f"[OK] Found {len(locales)} language(s): {', '.join(locales.keys())}")
+    passed.append(f"[OK] Found {len(locales)} language(s): {', '.join(sorted(locales))}")
     
-    # Compare keys across locales
-    all_langs = list(locales.keys())
-    base_lang = all_langs[0]
+    diffs = index.compare(changed_ns)
+    index.save()
     
-    for namespace in locales.get(base_lang, {}):
-        base_keys = locales[base_lang].get(namespace, set())
-        
-        for lang in all_langs[1:]:
-            other_keys = locales.get(lang, {}).get(namespace, set())
-            
-            missing = base_keys - other_keys
-            if missing:
-                issues.append(f"[X] {lang}/{namespace}: Missing {len(missing)} keys")
-            
-            extra = other_keys - base_keys
-            if extra:
-                issues.append(f"[!] {lang}/{namespace}: {len(extra)} extra keys")
+    for key in sorted(diffs):
+        missing, extra = diffs[key]
+        if missing:
+            issues.append(f"[X] {key}: Missing {len(missing)} keys (e.g. {', '.join(missing[:3])})")
+        if extra:
+            issues.append(f"[!] {key}: {len(extra)} extra keys (e.g. {', '.join(extra[:3])})")
     
     if not issues:
-        passed.append("[OK] All locales have matching keys")
+        passed.append(f"[OK] All locales match base language '{index.base_lang}'")
     
     return {'passed': passed, 'issues': issues}
 
 def flatten_keys(d, prefix=''):
     """Flatten nested dict keys."""
     keys = set()
-    for k, v in d.items():
-        new_key = f"{prefix}.{k}" if prefix else k
-        if isinstance(v, dict):
-            keys.update(flatten_keys(v, new_key))
-        else:
-            keys.add(new_key)
+    stack = [(prefix, d)]
+    while stack:
+        base, node = stack.pop()
+        for k, v in node.items():
+            new_key = f"{base}.{k}" if base else k
+            if isinstance(v, dict):
+                stack.append((new_key, v))
+            else:
+                keys.add(new_key)
     return keys
 
-def check_hardcoded_strings(project_path: Path) -> dict:
-    """Check for hardcoded strings in code files."""
+def iter_code_files(project_path: Path):
+    """Yield code files, pruning SKIP_DIRS before descending."""
+    for root, dirs, files in os.walk(project_path):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for name in files:
+            if Path(name).suffix in CODE_EXTENSIONS and '.test.' not in name and '.spec.' not in name:
+                yield Path(root) / name
+
+def analyze_source(content: str, file_type: str) -> tuple:
+    """Return (has_i18n, hardcoded match examples) for one file's content."""
+    has_i18n = I18N_RE.search(content) is not None
+    examples = []
+    if not has_i18n:
+        for pattern in HARDCODED_RES.get(file_type, []):
+            match = pattern.search(content)
+            if match:
+                examples.append(match.group(0)[:40])
+    return has_i18n, examples
+
+def _analyze_batch(jobs: list) -> list:
+    return [analyze_source(content, file_type) for content, file_type in jobs]
+
+def load_cache(project_path: Path) -> dict:
+    try:
+        data = json.loads((project_path / CACHE_FILE).read_text(encoding='utf-8'))
+        if data.get('version') == PATTERNS_VERSION:
+            return data.get('files', {})
+    except (OSError, ValueError):
+        pass
+    return {}
+
+def save_cache(project_path: Path, files: dict):
+    try:
+        path = project_path / CACHE_FILE
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({'version': PATTERNS_VERSION, 'files': files}), encoding='utf-8')
+    except OSError:
+        pass
+
+def report_progress(done: int, total: int, final: bool = False):
+    """Progress on stderr, interactive terminals only (orchestrators show stderr as errors)."""
+    if sys.stderr.isatty():
+        print(f"\r  Scanning code files... {done}/{total}", end='', file=sys.stderr, flush=True)
+        if final:
+            print(file=sys.stderr)
+
+def check_hardcoded_strings(project_path: Path, use_cache: bool = True) -> dict:
+    """Check every code file for hardcoded strings."""
     issues = []
     passed = []
     
-    # Find code files
-    extensions = {
-        '.tsx': 'jsx', '.jsx': 'jsx', '.ts': 'jsx', '.js': 'jsx',
-        '.vue': 'vue',
-        '.py': 'python'
-    }
+    cache = load_cache(project_path) if use_cache else {}
+    new_cache = {}
+    results = {}   # path -> (has_i18n, examples)
+    total = 0
+    misses = 0
+    
+    # Streaming: each file is read, hashed and analyzed (or handed to the pool)
+    # as the walk reaches it. Only path, digest and result are kept; contents
+    # live only inside the bounded set of batches in flight.
+    pool = None
+    batch_meta, batch_jobs = [], []
+    in_flight = deque()   # (batch_meta, future)
+    max_in_flight = 2 * (os.cpu_count() or 1)
     
-    code_files = []
-    for ext in extensions:
-        code_files.extend(project_path.rglob(f"*{ext}"))
+    def collect(meta: list, analyzed: list):
+        for (file_path, digest), result in zip(meta, analyzed):
+            results[file_path] = result
+            new_cache[digest] = list(result)
+        report_progress(len(results), total)
     
-    code_files = [f for f in code_files if not any(x in str(f) for x in 
-                  ['node_modules', '.git', 'dist', 'build', '__pycache__', 'venv', 'test', 'spec'])]
+    def submit():
+        in_flight.append((batch_meta[:], pool.submit(_analyze_batch, batch_jobs[:])))
+        batch_meta.clear()
+        batch_jobs.clear()
+        while len(in_flight) > max_in_flight:
+            meta, future = in_flight.popleft()
+            collect(meta, future.result())
+    
+    try:
+        for file_path in iter_code_files(project_path):
+            total += 1
+            try:
+                raw = file_path.read_bytes()
+            except OSError:
+                continue
+            digest = hashlib.sha1(raw).hexdigest()
+            hit = cache.get(digest)
+            if hit is not None:
+                results[file_path] = tuple(hit)
+                new_cache[digest] = hit
+                continue
+            
+            misses += 1
+            job = (raw.decode('utf-8', errors='ignore'), CODE_EXTENSIONS[file_path.suffix])
+            if pool is None:
+                # Small changesets never pay for a pool
+                collect([(file_path, digest)], [analyze_source(*job)])
+                if misses >= PARALLEL_THRESHOLD:
+                    pool = ProcessPoolExecutor()
+                continue
+            batch_meta.append((file_path, digest))
+            batch_jobs.append(job)
+            if len(batch_jobs) >= BATCH_SIZE:
+                submit()
+        
+        if batch_jobs:
+            submit()
+        while in_flight:
+            meta, future = in_flight.popleft()
+            collect(meta, future.result())
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    report_progress(len(results), total, final=True)
     
-    if not code_files:
+    if total == 0:
         return {'passed': ["[!] No code files found"], 'issues': []}
     
+    if use_cache:
+        save_cache(project_path, new_cache)
+    
     files_with_i18n = 0
     files_with_hardcoded = 0
     hardcoded_examples = []
     
-    for file_path in code_files[:50]:  # Limit
-        try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            ext = file_path.suffix
-            file_type = extensions.get(ext, 'jsx')
-            
-            # Check for i18n usage
-            has_i18n = any(re.search(p, content) for p in I18N_PATTERNS)
-            if has_i18n:
-                files_with_i18n += 1
-            
-            # Check for hardcoded strings
-            patterns = HARDCODED_PATTERNS.get(file_type, [])
-            hardcoded_found = False
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, content)
-                if matches and not has_i18n:
-                    hardcoded_found = True
-                    if len(hardcoded_examples) < 5:
-                        hardcoded_examples.append(f"{file_path.name}: {str(matches[0])[:40]}...")
-            
-            if hardcoded_found:
-                files_with_hardcoded += 1
-                
-        except:
-            continue
+    for file_path in sorted(results):
+        has_i18n, examples = results[file_path]
+        if has_i18n:
+            files_with_i18n += 1
+        if examples:
+            files_with_hardcoded += 1
+            for ex in examples:
+                if len(hardcoded_examples) < 5:
+                    hardcoded_examples.append(f"{file_path.name}: {ex}...")
     
-    passed.append(f"[OK] Analyzed {len(code_files)} code files")
+    passed.append(f"[OK] Analyzed {len(results)} code files ({len(results) - misses} cached)")
     
     if files_with_i18n > 0:
         passed.append(f"[OK] {files_with_i18n} files use i18n")
@@ -196,9 +399,9 @@ def check_hardcoded_strings(project_path: Path) -> dict:
     
     return {'passed': passed, 'issues': issues}
 
-def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
-    project_path = Path(target)
+def run(project_path=".", use_cache: bool = True, **opts) -> dict:
+    """Run both audits, print the report and return the structured result (importable entry point)."""
+    project_path = Path(project_path)
     
     print("\n" + "=" * 60)
     print("  i18n CHECKER - Internationalization Audit")
@@ -206,10 +409,10 @@ def main():
     
     # Check locale files
     locale_files = find_locale_files(project_path)
-    locale_result = check_locale_completeness(locale_files)
+    locale_result = check_locale_completeness(locale_files, project_path, use_cache)
     
     # Check hardcoded strings
-    code_result = check_hardcoded_strings(project_path)
+    code_result = check_hardcoded_strings(project_path, use_cache)
     
     # Print results
     print("[LOCALE FILES]")
@@ -232,10 +435,22 @@ def main():
     print("\n" + "=" * 60)
     if critical_issues == 0:
         print("[OK] i18n CHECK: PASSED")
-        sys.exit(0)
     else:
         print(f"[X] i18n CHECK: {critical_issues} issues found")
-        sys.exit(1)
+    
+    return {
+        "script": "i18n_checker",
+        "project": str(project_path.resolve()),
+        "locales": locale_result,
+        "code": code_result,
+        "critical_issues": critical_issues,
+        "passed": critical_issues == 0
+    }
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    output = run(args[0] if args else ".", use_cache='--no-cache' not in sys.argv)
+    sys.exit(0 if output["passed"] else 1)
 
 if __name__ == "__main__":
     main()
@@ -4,16 +4,25 @@ Lint Runner - Unified linting and type checking
 Runs appropriate linters based on project type.
 
 Usage:
-    python lint_runner.py <project_path>
+    python lint_runner.py <project_path> [--no-cache] [--timeout SECONDS]
 
 Supports:
     - Node.js: npm run lint, npx tsc --noEmit
     - Python: ruff check, mypy
+
+Linters run concurrently. Full output is streamed to .agent/logs/lint/<name>.log
+and results are cached by a hash of the lint inputs (lockfile, configs and
+source files), so an unchanged tree returns immediately.
 """
 
+import os
+import re
+import time
+import hashlib
 import subprocess
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -67,42 +76,160 @@ def detect_project_type(project_path: Path) -> dict:
     return result
 
 
-def run_linter(linter: dict, cwd: Path) -> dict:
-    """Run a single linter and return results."""
+LOG_DIR = Path(".agent") / "logs" / "lint"
+CACHE_FILE = Path(".agent") / "cache" / "lint_runner.json"
+DEFAULT_TIMEOUT = 120
+
+# Files whose content (not just mtime) feeds the cache key
+CONFIG_FILES = [
+    "package.json", "package-lock.json", "yarn.lock", "pnpm-lock.yaml",
+    "tsconfig.json", "tsconfig.app.json", "tsconfig.node.json",
+    ".eslintrc", ".eslintrc.js", ".eslintrc.cjs", ".eslintrc.json", "eslint.config.js",
+    "eslint.config.mjs", "pyproject.toml", "ruff.toml", ".ruff.toml", "mypy.ini",
+    "setup.cfg", "requirements.txt", "poetry.lock",
+]
+SKIP_DIRS = {"node_modules", ".git", "dist", "build", ".next", "coverage",
+             "__pycache__", "venv", ".venv", ".agent"}
+
+# Diagnostic count parsers, tried in order; first match wins
+DIAGNOSTIC_PATTERNS = {
+    "tsc": [(re.compile(r"Found (\d+) errors?"), "sum"), (re.compile(r"error TS\d+"), "count")],
+    "eslint": [(re.compile(r"\u2716 (\d+) problems?"), "sum"),
+               (re.compile(r"^\s*\d+:\d+\s+(?:error|warning)\b", re.M), "count")],
+    "ruff": [(re.compile(r"Found (\d+) errors?"), "sum"),
+             (re.compile(r"^\S+:\d+:\d+: [A-Z]+\d+", re.M), "count")],
+    "mypy": [(re.compile(r"Found (\d+) errors? in"), "sum"), (re.compile(r": error:"), "count")],
+}
+DIAGNOSTIC_PATTERNS["npm lint"] = DIAGNOSTIC_PATTERNS["eslint"]
+
+
+def list_input_files(project_path: Path) -> list:
+    """Tracked + untracked-not-ignored files via git, else a pruned walk."""
+    try:
+        proc = subprocess.run(
+            ["git", "ls-files", "-co", "--exclude-standard"],
+            cwd=str(project_path), capture_output=True, text=True, timeout=30
+        )
+        if proc.returncode == 0:
+            return sorted(f for f in proc.stdout.splitlines() if not f.startswith(".agent/"))
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        pass
+    
+    files = []
+    for root, dirs, names in os.walk(project_path):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for name in names:
+            files.append(str((Path(root) / name).relative_to(project_path)))
+    return sorted(files)
+
+
+def inputs_hash(project_path: Path) -> str:
+    """Hash config/lockfile contents plus size+mtime of every source file."""
+    h = hashlib.sha256()
+    for name in CONFIG_FILES:
+        path = project_path / name
+        if path.is_file():
+            h.update(name.encode())
+            h.update(path.read_bytes())
+    for rel in list_input_files(project_path):
+        try:
+            st = (project_path / rel).stat()
+        except OSError:
+            continue
+        h.update(f"{rel}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+    return h.hexdigest()
+
+
+def count_diagnostics(name: str, output: str) -> int:
+    for pattern, mode in DIAGNOSTIC_PATTERNS.get(name, []):
+        if mode == "sum":
+            found = pattern.findall(output)
+            if found:
+                return sum(int(n) for n in found)
+        else:
+            count = len(pattern.findall(output))
+            if count:
+                return count
+    return 0
+
+
+def log_tail(log_path: Path, lines: int = 20) -> str:
+    try:
+        with open(log_path, "r", encoding="utf-8", errors="replace") as f:
+            return "".join(f.readlines()[-lines:])
+    except OSError:
+        return ""
+
+
+def run_linter(linter: dict, cwd: Path, timeout: int = DEFAULT_TIMEOUT) -> dict:
+    """Run a single linter, streaming its output to a log file."""
     result = {
         "name": linter["name"],
         "passed": False,
         "output": "",
-        "error": ""
+        "error": "",
+        "diagnostics": 0,
+        "log": "",
+        "duration": 0.0,
+        "cached": False
     }
     
+    log_dir = cwd / LOG_DIR
+    log_dir.mkdir(parents=True, exist_ok=True)
+    safe_name = re.sub(r'[^\w.-]+', '_', linter['name'])
+    log_path = log_dir / f"{safe_name}.log"
+    result["log"] = str(log_path.relative_to(cwd))
+    start = time.monotonic()
+    
     try:
-        proc = subprocess.run(
-            linter["cmd"],
-            cwd=str(cwd),
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='replace',
-            timeout=120
-        )
+        with open(log_path, "w", encoding="utf-8") as log:
+            log.write(f"$ {' '.join(linter['cmd'])}\n")
+            log.flush()
+            proc = subprocess.Popen(linter["cmd"], cwd=str(cwd), stdout=log, stderr=subprocess.STDOUT)
+            try:
+                returncode = proc.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+                raise
         
-        result["output"] = proc.stdout[:2000] if proc.stdout else ""
-        result["error"] = proc.stderr[:500] if proc.stderr else ""
-        result["passed"] = proc.returncode == 0
+        output = log_path.read_text(encoding="utf-8", errors="replace")
+        result["diagnostics"] = count_diagnostics(linter["name"], output)
+        result["output"] = log_tail(log_path)
+        result["passed"] = returncode == 0
+        if not result["passed"]:
+            result["error"] = f"Exit code {returncode}, {result['diagnostics']} diagnostics (see {result['log']})"
         
     except FileNotFoundError:
         result["error"] = f"Command not found: {linter['cmd'][0]}"
     except subprocess.TimeoutExpired:
-        result["error"] = "Timeout after 120s"
+        result["error"] = f"Timeout after {timeout}s"
     except Exception as e:
         result["error"] = str(e)
     
+    result["duration"] = round(time.monotonic() - start, 2)
     return result
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+def load_cache(project_path: Path) -> dict:
+    try:
+        return json.loads((project_path / CACHE_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(project_path: Path, cache: dict):
+    try:
+        path = project_path / CACHE_FILE
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def run(project_path, use_cache: bool = True, timeout: int = DEFAULT_TIMEOUT, **opts) -> dict:
+    """Run all linters and return the structured result (importable entry point)."""
+    project_path = Path(project_path).resolve()
     
     print(f"\n{'='*60}")
     print(f"[LINT RUNNER] Unified Linting")
@@ -126,22 +253,43 @@ def main():
             "passed": True,
             "message": "No linters configured"
         }
-        print(json.dumps(output, indent=2))
-        sys.exit(0)
+        return output
     
-    # Run each linter
-    results = []
-    all_passed = True
+    # Reuse results for an unchanged tree, run the rest concurrently
+    key = inputs_hash(project_path)
+    cache = load_cache(project_path) if use_cache else {}
+    results = {}
+    to_run = []
     
     for linter in project_info["linters"]:
-        print(f"\nRunning: {linter['name']}...")
-        result = run_linter(linter, project_path)
-        results.append(result)
-        
+        entry = cache.get(linter["name"])
+        if entry and entry.get("key") == key and entry.get("cmd") == linter["cmd"]:
+            results[linter["name"]] = {**entry["result"], "cached": True}
+        else:
+            to_run.append(linter)
+    
+    if to_run:
+        print(f"\nRunning concurrently: {', '.join(l['name'] for l in to_run)}...")
+        with ThreadPoolExecutor(max_workers=len(to_run)) as pool:
+            futures = {l["name"]: pool.submit(run_linter, l, project_path, timeout) for l in to_run}
+            for linter in to_run:
+                result = futures[linter["name"]].result()
+                results[linter["name"]] = result
+                # Tool/infra failures (no diagnostics parsed) are retried next run
+                if result["passed"] or result["diagnostics"]:
+                    cache[linter["name"]] = {"key": key, "cmd": linter["cmd"], "result": result}
+        if use_cache:
+            save_cache(project_path, cache)
+    
+    results = [results[l["name"]] for l in project_info["linters"]]
+    all_passed = True
+    
+    for result in results:
+        source = "cached" if result["cached"] else f"{result['duration']}s"
         if result["passed"]:
-            print(f"  [PASS] {linter['name']}")
+            print(f"  [PASS] {result['name']} ({source})")
         else:
-            print(f"  [FAIL] {linter['name']}")
+            print(f"  [FAIL] {result['name']} ({source}, {result['diagnostics']} diagnostics)")
             if result["error"]:
                 print(f"  Error: {result['error'][:200]}")
             all_passed = False
@@ -153,7 +301,7 @@ def main():
     
     for r in results:
         icon = "[PASS]" if r["passed"] else "[FAIL]"
-        print(f"{icon} {r['name']}")
+        print(f"{icon} {r['name']}: {r['diagnostics']} diagnostics  (log: {r['log']})")
     
     output = {
         "script": "lint_runner",
@@ -162,10 +310,21 @@ def main():
         "checks": results,
         "passed": all_passed
     }
+    return output
+
+
+def main():
+    args = sys.argv[1:]
+    use_cache = "--no-cache" not in args
+    timeout = DEFAULT_TIMEOUT
+    if "--timeout" in args:
+        timeout = int(args[args.index("--timeout") + 1])
+        del args[args.index("--timeout"):args.index("--timeout") + 2]
+    positional = [a for a in args if not a.startswith("--")]
     
+    output = run(positional[0] if positional else ".", use_cache=use_cache, timeout=timeout)
     print("\n" + json.dumps(output, indent=2))
-    
-    sys.exit(0 if all_passed else 1)
+    sys.exit(0 if output["passed"] else 1)
 
 
 if __name__ == "__main__":
@@ -2,10 +2,21 @@
 """
 Type Coverage Checker - Measures TypeScript/Python type coverage.
 Identifies untyped functions, any usage, and type safety issues.
+
+Python is analyzed with the ast module; TypeScript with a lightweight
+tokenizer that ignores strings and comments. Vendored and build directories
+are never entered. Uncached files are analyzed in a process pool and results
+are cached per content hash in .agent/cache/type_coverage.json.
+
+Usage: python type_coverage.py <project_path> [--no-cache]
 """
+import os
 import sys
 import re
-import subprocess
+import ast
+import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Fix Windows console encoding for Unicode output
@@ -15,41 +26,308 @@ try:
 except AttributeError:
     pass  # Python < 3.7
 
-def check_typescript_coverage(project_path: Path) -> dict:
+SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '.next', 'coverage',
+             '__pycache__', 'venv', '.venv', 'env', 'site-packages', '.tox', '.mypy_cache'}
+TS_EXTENSIONS = {'.ts', '.tsx'}
+PY_EXTENSIONS = {'.py'}
+
+# Bump when analysis rules change so cached results are discarded
+ANALYZER_VERSION = 3
+CACHE_FILE = Path('.agent') / 'cache' / 'type_coverage.json'
+
+# Below this many uncached files a process pool costs more than it saves
+PARALLEL_THRESHOLD = 100
+
+# Modules listed in the report, lowest coverage first
+MODULES_SHOWN = 10
+
+
+# ============================================================================
+#  PYTHON (ast)
+# ============================================================================
+
+def _is_any(node) -> bool:
+    return (isinstance(node, ast.Name) and node.id == 'Any') or \
+           (isinstance(node, ast.Attribute) and node.attr == 'Any')
+
+def analyze_python(source: str) -> dict:
+    """Count fully annotated functions and Any usage in one module."""
+    stats = {'typed_functions': 0, 'untyped_functions': 0, 'any_count': 0}
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return stats
+
+    methods = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            for item in node.body:
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    methods.add(item)
+
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            args = node.args
+            params = args.posonlyargs + args.args + args.kwonlyargs
+            if args.vararg:
+                params.append(args.vararg)
+            if args.kwarg:
+                params.append(args.kwarg)
+            # self/cls is never annotated
+            is_static = any(isinstance(d, ast.Name) and d.id == 'staticmethod' for d in node.decorator_list)
+            if node in methods and not is_static and (args.posonlyargs + args.args):
+                params = params[1:]
+            typed = all(p.annotation is not None for p in params)
+            if node.name != '__init__':
+                typed = typed and node.returns is not None
+            stats['typed_functions' if typed else 'untyped_functions'] += 1
+
+            annotations = [p.annotation for p in params if p.annotation is not None]
+            if node.returns is not None:
+                annotations.append(node.returns)
+            for ann in annotations:
+                stats['any_count'] += sum(1 for n in ast.walk(ann) if _is_any(n))
+        elif isinstance(node, ast.AnnAssign):
+            stats['any_count'] += sum(1 for n in ast.walk(node.annotation) if _is_any(n))
+    return stats
+
+
+# ============================================================================
+#  TYPESCRIPT (tokenizer)
+# ============================================================================
+
+# A '<' after the name/`=` opens a type parameter list, matched by skip_type_params
+FUNCTION_DECL_RE = re.compile(r'\bfunction\s*\*?\s*\w*\s*([<(])')
+ARROW_DECL_RE = re.compile(
+    r'\b(?:const|let|var)\s+\w+\s*(:[^=;]+)?=\s*(?:async\s+)?(<|\(|\w+\s*=>)')
+ANY_RE = re.compile(r'(?::|\bas|<|,|\||&)\s*any\b')
+OPENERS, CLOSERS = '([{', ')]}'
+
+def strip_strings_and_comments(source: str) -> str:
+    """Blank out comments and string/template contents, keeping offsets stable."""
+    out = []
+    i, n = 0, len(source)
+    while i < n:
+        c = source[i]
+        nxt = source[i + 1] if i + 1 < n else ''
+        if c == '/' and nxt == '/':
+            end = source.find('\n', i)
+            end = n if end == -1 else end
+            out.append(' ' * (end - i))
+            i = end
+        elif c == '/' and nxt == '*':
+            end = source.find('*/', i + 2)
+            end = n if end == -1 else end + 2
+            out.append(re.sub(r'[^\n]', ' ', source[i:end]))
+            i = end
+        elif c in '"\'`':
+            j = i + 1
+            while j < n and source[j] != c:
+                if source[j] == '\\':
+                    j += 1
+                elif source[j] == '\n' and c != '`':
+                    break
+                j += 1
+            j = min(j + 1, n)
+            out.append(c + re.sub(r'[^\n]', ' ', source[i + 1:j - 1]) + (c if j - 1 > i else ''))
+            i = j
+        else:
+            out.append(c)
+            i += 1
+    return ''.join(out)
+
+def split_params(text: str, open_idx: int):
+    """Return (params, close_idx) for the parenthesized list at open_idx."""
+    depth = 0
+    start = open_idx + 1
+    params = []
+    for i in range(open_idx, len(text)):
+        c = text[i]
+        if c in OPENERS or c == '<':
+            depth += 1
+        elif c in CLOSERS or (c == '>' and text[i - 1] != '='):
+            depth -= 1
+            if depth == 0:
+                params.append(text[start:i])
+                return [p.strip() for p in params if p.strip()], i
+        elif c == ',' and depth == 1:
+            params.append(text[start:i])
+            start = i + 1
+    return [], -1
+
+def skip_type_params(text: str, open_idx: int) -> int:
+    """Index of the '(' after the type parameter list at open_idx, or -1."""
+    depth = 0
+    for i in range(open_idx, len(text)):
+        c = text[i]
+        if c == '<':
+            depth += 1
+        elif c == '>' and text[i - 1] != '=':
+            depth -= 1
+            if depth == 0:
+                rest = text[i + 1:]
+                paren = i + 1 + len(rest) - len(rest.lstrip())
+                return paren if text.startswith('(', paren) else -1
+        elif c in ';{}':
+            return -1
+    return -1
+
+def _param_typed(param: str) -> bool:
+    """A parameter is typed when it has a top-level annotation or a default."""
+    depth = 0
+    for c in param:
+        if c in OPENERS or c == '<':
+            depth += 1
+        elif c in CLOSERS or c == '>':
+            depth -= 1
+        elif depth == 0 and c in ':=':
+            return True
+    return param == 'this'
+
+def analyze_typescript(source: str) -> dict:
+    """Count functions with all parameters typed and 'any' usage."""
+    stats = {'typed_functions': 0, 'untyped_functions': 0, 'any_count': 0}
+    code = strip_strings_and_comments(source)
+    stats['any_count'] = len(ANY_RE.findall(code))
+
+    for m in FUNCTION_DECL_RE.finditer(code):
+        paren = m.end() - 1
+        if m.group(1) == '<':
+            paren = skip_type_params(code, paren)
+            if paren == -1:
+                continue
+        params, _ = split_params(code, paren)
+        typed = all(_param_typed(p) for p in params)
+        stats['typed_functions' if typed else 'untyped_functions'] += 1
+
+    for m in ARROW_DECL_RE.finditer(code):
+        if m.group(1):
+            # const fn: Handler = (...) => - contextually typed
+            stats['typed_functions'] += 1
+            continue
+        if m.group(2) in '(<':
+            paren = m.end() - 1
+            if m.group(2) == '<':
+                paren = skip_type_params(code, paren)
+                if paren == -1:
+                    continue
+            params, close = split_params(code, paren)
+            if close == -1 or not code[close + 1:close + 200].lstrip().startswith(('=>', ':')):
+                continue  # parenthesized expression, not an arrow function
+            typed = all(_param_typed(p) for p in params)
+        else:
+            typed = False  # bare `x => ...`
+        stats['typed_functions' if typed else 'untyped_functions'] += 1
+    return stats
+
+
+# ============================================================================
+#  PIPELINE
+# ============================================================================
+
+ANALYZERS = {'python': analyze_python, 'typescript': analyze_typescript}
+
+def _analyze_job(job: tuple) -> dict:
+    kind, source = job
+    return ANALYZERS[kind](source)
+
+def iter_source_files(project_path: Path):
+    """Yield (kind, path), pruning SKIP_DIRS before descending."""
+    for root, dirs, files in os.walk(project_path):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for name in files:
+            suffix = Path(name).suffix
+            if suffix in TS_EXTENSIONS and not name.endswith('.d.ts'):
+                yield 'typescript', Path(root) / name
+            elif suffix in PY_EXTENSIONS:
+                yield 'python', Path(root) / name
+
+def load_cache(project_path: Path) -> dict:
+    try:
+        data = json.loads((project_path / CACHE_FILE).read_text(encoding='utf-8'))
+        if data.get('version') == ANALYZER_VERSION:
+            return data.get('files', {})
+    except (OSError, ValueError):
+        pass
+    return {}
+
+def save_cache(project_path: Path, files: dict):
+    try:
+        path = project_path / CACHE_FILE
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({'version': ANALYZER_VERSION, 'files': files}), encoding='utf-8')
+    except OSError:
+        pass
+
+def analyze_project(project_path: Path, use_cache: bool = True) -> dict:
+    """Per-file stats for every source file: {kind: {relpath: stats}}."""
+    cache = load_cache(project_path) if use_cache else {}
+    new_cache = {}
+    results = {'typescript': {}, 'python': {}}
+    pending = []
+
+    for kind, file_path in iter_source_files(project_path):
+        try:
+            raw = file_path.read_bytes()
+        except OSError:
+            continue
+        rel = str(file_path.relative_to(project_path))
+        # Same bytes in a .ts and a .py file are analyzed differently
+        digest = hashlib.sha1(kind.encode() + raw).hexdigest()
+        hit = cache.get(digest)
+        if hit is not None:
+            results[kind][rel] = hit
+            new_cache[digest] = hit
+        else:
+            pending.append((kind, rel, digest, raw.decode('utf-8', errors='ignore')))
+
+    jobs = [(kind, source) for kind, _, _, source in pending]
+    if len(jobs) >= PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor() as pool:
+            analyzed = list(pool.map(_analyze_job, jobs, chunksize=32))
+    else:
+        analyzed = [_analyze_job(job) for job in jobs]
+
+    for (kind, rel, digest, _), stats in zip(pending, analyzed):
+        results[kind][rel] = stats
+        new_cache[digest] = stats
+
+    if use_cache:
+        save_cache(project_path, new_cache)
+    return results
+
+def module_of(rel: str) -> str:
+    parent = str(Path(rel).parent)
+    return '.' if parent == '.' else parent
+
+def summarize(kind: str, files: dict) -> dict:
+    """Aggregate per-file stats into totals and per-module coverage."""
+    stats = {'any_count': 0, 'typed_functions': 0, 'untyped_functions': 0}
+    modules = {}
+    for rel, s in files.items():
+        for key in stats:
+            stats[key] += s[key]
+        m = modules.setdefault(module_of(rel), {'typed': 0, 'total': 0, 'files': 0})
+        m['typed'] += s['typed_functions']
+        m['total'] += s['typed_functions'] + s['untyped_functions']
+        m['files'] += 1
+    stats['total_functions'] = stats['typed_functions'] + stats['untyped_functions']
+    for m in modules.values():
+        m['coverage'] = round(m['typed'] / m['total'] * 100) if m['total'] else 100
+    return {'type': kind, 'files': len(files), 'stats': stats, 'modules': modules}
+
+def check_typescript_coverage(project_path: Path, files: dict = None) -> dict:
     """Check TypeScript type coverage."""
+    if files is None:
+        files = analyze_project(project_path)['typescript']
+    result = summarize('typescript', files)
+    stats = result['stats']
     issues = []
     passed = []
-    stats = {'any_count': 0, 'untyped_functions': 0, 'total_functions': 0}
-    
-    ts_files = list(project_path.rglob("*.ts")) + list(project_path.rglob("*.tsx"))
-    ts_files = [f for f in ts_files if 'node_modules' not in str(f) and '.d.ts' not in str(f)]
-    
-    if not ts_files:
-        return {'type': 'typescript', 'files': 0, 'passed': [], 'issues': ["[!] No TypeScript files found"], 'stats': stats}
-    
-    for file_path in ts_files[:30]:  # Limit
-        try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            
-            # Count 'any' usage
-            any_matches = re.findall(r':\s*any\b', content)
-            stats['any_count'] += len(any_matches)
-            
-            # Find functions without return types
-            # function name(params) { - no return type
-            untyped = re.findall(r'function\s+\w+\s*\([^)]*\)\s*{', content)
-            # Arrow functions without types: const fn = (x) => or (x) =>
-            untyped += re.findall(r'=\s*\([^:)]*\)\s*=>', content)
-            stats['untyped_functions'] += len(untyped)
-            
-            # Count typed functions
-            typed = re.findall(r'function\s+\w+\s*\([^)]*\)\s*:\s*\w+', content)
-            typed += re.findall(r':\s*\([^)]*\)\s*=>\s*\w+', content)
-            stats['total_functions'] += len(typed) + len(untyped)
-            
-        except Exception:
-            continue
-    
+
+    if not files:
+        return {**result, 'passed': [], 'issues': ["[!] No TypeScript files found"]}
+
     # Analyze results
     if stats['any_count'] == 0:
         passed.append("[OK] No 'any' types found")
@@ -57,98 +335,80 @@ def check_typescript_coverage(project_path: Path) -> dict:
         issues.append(f"[!] {stats['any_count']} 'any' types found (acceptable)")
     else:
         issues.append(f"[X] {stats['any_count']} 'any' types found (too many)")
-    
+
     if stats['total_functions'] > 0:
-        typed_ratio = (stats['total_functions'] - stats['untyped_functions']) / stats['total_functions'] * 100
+        typed_ratio = stats['typed_functions'] / stats['total_functions'] * 100
         if typed_ratio >= 80:
             passed.append(f"[OK] Type coverage: {typed_ratio:.0f}%")
         elif typed_ratio >= 50:
             issues.append(f"[!] Type coverage: {typed_ratio:.0f}% (improve)")
         else:
             issues.append(f"[X] Type coverage: {typed_ratio:.0f}% (too low)")
-    
-    passed.append(f"[OK] Analyzed {len(ts_files)} TypeScript files")
-    
-    return {'type': 'typescript', 'files': len(ts_files), 'passed': passed, 'issues': issues, 'stats': stats}
 
-def check_python_coverage(project_path: Path) -> dict:
+    passed.append(f"[OK] Analyzed {len(files)} TypeScript files")
+
+    return {**result, 'passed': passed, 'issues': issues}
+
+def check_python_coverage(project_path: Path, files: dict = None) -> dict:
     """Check Python type hints coverage."""
+    if files is None:
+        files = analyze_project(project_path)['python']
+    result = summarize('python', files)
+    stats = result['stats']
     issues = []
     passed = []
-    stats = {'untyped_functions': 0, 'typed_functions': 0, 'any_count': 0}
-    
-    py_files = list(project_path.rglob("*.py"))
-    py_files = [f for f in py_files if not any(x in str(f) for x in ['venv', '__pycache__', '.git', 'node_modules'])]
-    
-    if not py_files:
-        return {'type': 'python', 'files': 0, 'passed': [], 'issues': ["[!] No Python files found"], 'stats': stats}
-    
-    for file_path in py_files[:30]:  # Limit
-        try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            
-            # Count Any usage
-            any_matches = re.findall(r':\s*Any\b', content)
-            stats['any_count'] += len(any_matches)
-            
-            # Find functions with type hints
-            typed_funcs = re.findall(r'def\s+\w+\s*\([^)]*:[^)]+\)', content)
-            typed_funcs += re.findall(r'def\s+\w+\s*\([^)]*\)\s*->', content)
-            stats['typed_functions'] += len(typed_funcs)
-            
-            # Find functions without type hints
-            all_funcs = re.findall(r'def\s+\w+\s*\(', content)
-            stats['untyped_functions'] += len(all_funcs) - len(typed_funcs)
-            
-        except Exception:
-            continue
-    
-    total = stats['typed_functions'] + stats['untyped_functions']
-    
-    if total > 0:
-        typed_ratio = stats['typed_functions'] / total * 100
+
+    if not files:
+        return {**result, 'passed': [], 'issues': ["[!] No Python files found"]}
+
+    if stats['total_functions'] > 0:
+        typed_ratio = stats['typed_functions'] / stats['total_functions'] * 100
         if typed_ratio >= 70:
             passed.append(f"[OK] Type hints coverage: {typed_ratio:.0f}%")
         elif typed_ratio >= 40:
             issues.append(f"[!] Type hints coverage: {typed_ratio:.0f}%")
         else:
             issues.append(f"[X] Type hints coverage: {typed_ratio:.0f}% (add type hints)")
-    
+
     if stats['any_count'] == 0:
         passed.append("[OK] No 'Any' types found")
     elif stats['any_count'] <= 3:
         issues.append(f"[!] {stats['any_count']} 'Any' types found")
     else:
         issues.append(f"[X] {stats['any_count']} 'Any' types found")
-    
-    passed.append(f"[OK] Analyzed {len(py_files)} Python files")
-    
-    return {'type': 'python', 'files': len(py_files), 'passed': passed, 'issues': issues, 'stats': stats}
 
-def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
-    project_path = Path(target)
-    
+    passed.append(f"[OK] Analyzed {len(files)} Python files")
+
+    return {**result, 'passed': passed, 'issues': issues}
+
+def run(project_path, use_cache: bool = True, **opts) -> dict:
+    """Analyze and print the report; returns the structured result (importable entry point)."""
+    project_path = Path(project_path).resolve()
+
     print("\n" + "=" * 60)
     print("  TYPE COVERAGE CHECKER")
     print("=" * 60 + "\n")
-    
+
+    analyzed = analyze_project(project_path, use_cache)
     results = []
-    
+
     # Check TypeScript
-    ts_result = check_typescript_coverage(project_path)
+    ts_result = check_typescript_coverage(project_path, analyzed['typescript'])
     if ts_result['files'] > 0:
         results.append(ts_result)
-    
+
     # Check Python
-    py_result = check_python_coverage(project_path)
+    py_result = check_python_coverage(project_path, analyzed['python'])
     if py_result['files'] > 0:
         results.append(py_result)
-    
+
+    output = {"script": "type_coverage", "project": str(project_path),
+              "results": results, "critical_issues": 0, "passed": True}
+
     if not results:
         print("[!] No TypeScript or Python files found.")
-        sys.exit(0)
-    
+        return output
+
     # Print results
     critical_issues = 0
     for result in results:
@@ -160,14 +420,26 @@ def main():
             print(f"  {item}")
             if item.startswith("[X]"):
                 critical_issues += 1
-    
+
+        modules = sorted(result['modules'].items(), key=lambda x: (x[1]['coverage'], x[0]))
+        print(f"  Modules ({len(modules)}, lowest coverage first):")
+        for name, m in modules[:MODULES_SHOWN]:
+            print(f"    {m['coverage']:>3}%  {name} ({m['typed']}/{m['total']} functions, {m['files']} files)")
+
     print("\n" + "=" * 60)
     if critical_issues == 0:
         print("[OK] TYPE COVERAGE: ACCEPTABLE")
-        sys.exit(0)
     else:
         print(f"[X] TYPE COVERAGE: {critical_issues} critical issues")
-        sys.exit(1)
+
+    output["critical_issues"] = critical_issues
+    output["passed"] = critical_issues == 0
+    return output
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    output = run(args[0] if args else ".", use_cache='--no-cache' not in sys.argv)
+    sys.exit(0 if output["passed"] else 1)
 
 if __name__ == "__main__":
     main()
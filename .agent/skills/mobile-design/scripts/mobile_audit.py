@@ -628,6 +628,19 @@ class MobileAuditor:
         }
 
 
+def run(path=".", **opts) -> dict:
+    """Audit a file or directory and return the report (importable entry point)."""
+    auditor = MobileAuditor()
+    if os.path.isfile(path):
+        auditor.audit_file(path)
+    else:
+        auditor.audit_directory(path)
+
+    report = auditor.get_report()
+    report['passed'] = report['compliant']
+    return report
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python mobile_audit.py <directory>")
@@ -636,13 +649,7 @@ def main():
     path = sys.argv[1]
     is_json = "--json" in sys.argv
 
-    auditor = MobileAuditor()
-    if os.path.isfile(path):
-        auditor.audit_file(path)
-    else:
-        auditor.audit_directory(path)
-
-    report = auditor.get_report()
+    report = run(path)
 
     if is_json:
         print(json.dumps(report, indent=2))
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Import Graph
+Single-pass module import index for JS/TS projects.
+Shared by react_performance_checker and other static analyzers.
+
+Usage: python import_graph.py <project_path> [module]
+"""
+
+import os
+import re
+import sys
+import json
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Union, Iterable
+
+SOURCE_EXTENSIONS = {'.ts', '.tsx', '.js', '.jsx', '.mjs', '.cjs'}
+SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '.next', 'coverage', '__pycache__'}
+
+# Suffixes tried, in order, when resolving an extensionless specifier
+RESOLVE_SUFFIXES = ['', '.ts', '.tsx', '.js', '.jsx', '.mjs', '.cjs', '.json',
+                    '/index.ts', '/index.tsx', '/index.js', '/index.jsx']
+
+# import X from 'a' / import { X } from 'a' / import type X from 'a' / export * from 'a'
+STATIC_IMPORT_RE = re.compile(
+    r"""(?:^|[;\n])\s*(?:import|export)\s+(?:type\s+)?[^'";]*?\s+from\s+['"]([^'"]+)['"]""")
+# import 'a' (side effect only)
+BARE_IMPORT_RE = re.compile(r"""(?:^|[;\n])\s*import\s+['"]([^'"]+)['"]""")
+# require('a')
+REQUIRE_RE = re.compile(r"""\brequire\(\s*['"]([^'"]+)['"]\s*\)""")
+# import('a'), including dynamic(() => import('a')) and lazy(() => import('a'))
+DYNAMIC_IMPORT_RE = re.compile(r"""\bimport\(\s*['"]([^'"]+)['"]\s*\)""")
+
+Module = Union[Path, str]  # local file path, or bare package name
+
+
+class ImportEdge(NamedTuple):
+    importer: Path
+    target: Module
+    kind: str  # 'static' or 'dynamic'
+
+
+def collect_sources(project_path: Path, extensions: Iterable[str] = SOURCE_EXTENSIONS,
+                    skip_dirs: Iterable[str] = SKIP_DIRS) -> Dict[Path, str]:
+    """Walk the project once, never entering skipped dirs, and decode sources"""
+    extensions = set(extensions)
+    skip_dirs = set(skip_dirs)
+    sources = {}
+    for root, dirs, files in os.walk(project_path):
+        # Prune in place so excluded trees are never entered
+        dirs[:] = [d for d in dirs if d not in skip_dirs]
+        for name in files:
+            filepath = Path(root) / name
+            if filepath.suffix not in extensions:
+                continue
+            try:
+                sources[filepath] = filepath.read_text(encoding='utf-8')
+            except (OSError, UnicodeDecodeError):
+                continue
+    return sources
+
+
+def package_name(specifier: str) -> str:
+    """Reduce a bare specifier to its package name ('@a/b/c' -> '@a/b')"""
+    parts = specifier.split('/')
+    if specifier.startswith('@') and len(parts) > 1:
+        return '/'.join(parts[:2])
+    return parts[0]
+
+
+class ImportGraph:
+    """Module -> importers index, built in one pass over the sources"""
+
+    def __init__(self, project_path: Path, sources: Dict[Path, str],
+                 aliases: Optional[Dict[str, Path]] = None):
+        self.project_path = Path(project_path)
+        self.sources = sources
+        # '@/x' resolves against the project root by default (tsconfig/vite convention)
+        self.aliases = aliases if aliases is not None else {'@/': self.project_path}
+        self.imports: Dict[Path, List[ImportEdge]] = {}
+        self.importers: Dict[Module, List[ImportEdge]] = {}
+        self._resolved: Dict[tuple, Module] = {}
+        self._build()
+
+    def _build(self):
+        for filepath, content in self.sources.items():
+            edges = []
+            seen = set()
+            for kind, pattern in (('dynamic', DYNAMIC_IMPORT_RE),
+                                  ('static', STATIC_IMPORT_RE),
+                                  ('static', BARE_IMPORT_RE),
+                                  ('static', REQUIRE_RE)):
+                for specifier in pattern.findall(content):
+                    target = self.resolve(filepath, specifier)
+                    if target is None or (target, kind) in seen:
+                        continue
+                    seen.add((target, kind))
+                    edge = ImportEdge(filepath, target, kind)
+                    edges.append(edge)
+                    self.importers.setdefault(target, []).append(edge)
+            self.imports[filepath] = edges
+
+    def resolve(self, importer: Path, specifier: str) -> Optional[Module]:
+        """Resolve a specifier to a file Path, a package name, or None if unresolvable"""
+        key = (importer.parent, specifier)
+        if key in self._resolved:
+            return self._resolved[key]
+
+        base = None
+        if specifier.startswith('.'):
+            base = importer.parent / specifier
+        else:
+            for prefix, target_dir in self.aliases.items():
+                if specifier.startswith(prefix):
+                    base = target_dir / specifier[len(prefix):]
+                    break
+
+        if base is None:
+            resolved = package_name(specifier)
+        else:
+            resolved = None
+            for suffix in RESOLVE_SUFFIXES:
+                candidate = Path(os.path.normpath(str(base) + suffix))
+                if candidate in self.sources or candidate.is_file():
+                    resolved = candidate
+                    break
+
+        self._resolved[key] = resolved
+        return resolved
+
+    def importers_of(self, module: Module, kind: Optional[str] = None) -> List[ImportEdge]:
+        """Edges importing module, optionally filtered by kind"""
+        edges = self.importers.get(module, [])
+        if kind is None:
+            return list(edges)
+        return [e for e in edges if e.kind == kind]
+
+    def imports_of(self, filepath: Path, kind: Optional[str] = None) -> List[ImportEdge]:
+        """Edges going out of filepath, optionally filtered by kind"""
+        edges = self.imports.get(filepath, [])
+        if kind is None:
+            return list(edges)
+        return [e for e in edges if e.kind == kind]
+
+    def label(self, module: Module) -> str:
+        """Project-relative display name for a module"""
+        if isinstance(module, Path):
+            try:
+                return str(module.relative_to(self.project_path))
+            except ValueError:
+                return str(module)
+        return module
+
+
+def build_import_graph(project_path: Union[str, Path],
+                       sources: Optional[Dict[Path, str]] = None) -> ImportGraph:
+    """Convenience wrapper: collect sources (unless given) and index them"""
+    project_path = Path(project_path).resolve()
+    if sources is None:
+        sources = collect_sources(project_path)
+    return ImportGraph(project_path, sources)
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python import_graph.py <project_path> [module]")
+        sys.exit(1)
+
+    graph = build_import_graph(sys.argv[1])
+
+    if len(sys.argv) > 2:
+        module = graph.resolve(graph.project_path / '_', sys.argv[2])
+        result = [
+            {"importer": graph.label(e.importer), "kind": e.kind}
+            for e in graph.importers_of(module)
+        ] if module is not None else []
+        print(json.dumps({"module": sys.argv[2], "importers": result}, indent=2))
+        return
+
+    print(json.dumps({
+        graph.label(module): [
+            {"importer": graph.label(e.importer), "kind": e.kind} for e in edges
+        ]
+        for module, edges in graph.importers.items()
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -7,9 +7,16 @@ Based on Vercel Engineering best practices
 
 import os
 import re
+import sys
 import json
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Iterator
+
+sys.path.insert(0, str(Path(__file__).parent))
+from import_graph import ImportGraph, collect_sources, SOURCE_EXTENSIONS
+
+# Files above this size should be code-split rather than imported statically
+LARGE_COMPONENT_BYTES = 10000
 
 class PerformanceChecker:
     def __init__(self, project_path: str):
@@ -17,18 +24,34 @@ class PerformanceChecker:
         self.issues = []
         self.warnings = []
         self.passed = []
+        self._sources = None  # Path -> decoded content, filled once per run
+        self._graph = None
+
+    def load_sources(self) -> Dict[Path, str]:
+        """Walk the project once and cache decoded source files"""
+        if self._sources is None:
+            self._sources = collect_sources(self.project_path)
+        return self._sources
+
+    @property
+    def import_graph(self) -> ImportGraph:
+        """Import graph over the cached sources, built on first use"""
+        if self._graph is None:
+            self._graph = ImportGraph(self.project_path, self.load_sources())
+        return self._graph
+
+    def iter_sources(self, extensions=SOURCE_EXTENSIONS) -> Iterator[Tuple[Path, str]]:
+        """Yield (path, content) for cached sources matching extensions"""
+        for filepath, content in self.load_sources().items():
+            if filepath.suffix in extensions:
+                yield filepath, content
 
     def check_waterfalls(self):
         """Check for sequential await patterns (Section 1)"""
         print("\n[*] Checking for waterfalls (sequential awaits)...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx,js,jsx}'):
-            if 'node_modules' in str(filepath):
-                continue
-
+        for filepath, content in self.iter_sources():
             try:
-                content = filepath.read_text(encoding='utf-8')
-
                 # Pattern: multiple awaits in sequence without Promise.all
                 sequential_awaits = re.findall(r'await\s+\w+.*?\n\s*await\s+\w+', content)
 
@@ -47,13 +70,8 @@ class PerformanceChecker:
         """Check for barrel imports (Section 2)"""
         print("[*] Checking for barrel imports...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx,js,jsx}'):
-            if 'node_modules' in str(filepath):
-                continue
-
+        for filepath, content in self.iter_sources():
             try:
-                content = filepath.read_text(encoding='utf-8')
-
                 # Pattern: import from index files or barrel exports
                 barrel_imports = re.findall(r"import.*from\s+['\"](@/.*?)/index['\"]", content)
                 barrel_imports += re.findall(r"import.*from\s+['\"]\.\.?/.*?['\"](?!.*?\.tsx?)", content)
@@ -73,48 +91,27 @@ class PerformanceChecker:
         """Check if large components use dynamic imports (Section 2)"""
         print("[*] Checking for missing dynamic imports...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx}'):
-            if 'node_modules' in str(filepath):
+        graph = self.import_graph
+        for filepath, content in self.iter_sources({'.ts', '.tsx'}):
+            # Check file size - if > 10KB, should probably use dynamic import
+            if len(content) <= LARGE_COMPONENT_BYTES:
                 continue
 
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Check file size - if > 10KB, should probably use dynamic import
-                if len(content) > 10000:
-                    # Check if it's imported statically somewhere
-                    filename = filepath.stem
-
-                    # Search for static imports of this component
-                    for check_file in self.project_path.rglob('*.{ts,tsx}'):
-                        if check_file == filepath or 'node_modules' in str(check_file):
-                            continue
-
-                        check_content = check_file.read_text(encoding='utf-8')
-                        if f"import {filename}" in check_content or f"import {{ {filename}" in check_content:
-                            if 'dynamic(' not in check_content:
-                                self.warnings.append({
-                                    'file': str(check_file.relative_to(self.project_path)),
-                                    'type': 'CRITICAL',
-                                    'issue': f'Large component {filename} imported statically',
-                                    'fix': 'Use dynamic() for code splitting',
-                                    'section': '2-bundle-bundle-size-optimization.md'
-                                })
-                                break
-            except Exception as e:
-                continue
+            for edge in graph.importers_of(filepath, kind='static'):
+                self.warnings.append({
+                    'file': str(edge.importer.relative_to(self.project_path)),
+                    'type': 'CRITICAL',
+                    'issue': f'Large component {filepath.stem} imported statically',
+                    'fix': 'Use dynamic() for code splitting',
+                    'section': '2-bundle-bundle-size-optimization.md'
+                })
 
     def check_useEffect_fetching(self):
         """Check for data fetching in useEffect (Section 4)"""
         print("[*] Checking for useEffect data fetching...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx}'):
-            if 'node_modules' in str(filepath):
-                continue
-
+        for filepath, content in self.iter_sources({'.ts', '.tsx'}):
             try:
-                content = filepath.read_text(encoding='utf-8')
-
                 # Pattern: fetch or axios in useEffect
                 if 'useEffect' in content:
                     if re.search(r'useEffect.*?fetch\(', content, re.DOTALL):
@@ -132,13 +129,8 @@ class PerformanceChecker:
         """Check for missing React.memo, useMemo, useCallback (Section 5)"""
         print("[*] Checking for missing memoization...")
 
-        for filepath in self.project_path.rglob('*.{tsx}'):
-            if 'node_modules' in str(filepath):
-                continue
-
+        for filepath, content in self.iter_sources({'.tsx'}):
             try:
-                content = filepath.read_text(encoding='utf-8')
-
                 # Check for component definitions without memo
                 components = re.findall(r'(?:export\s+)?(?:const|function)\s+([A-Z]\w+)', content)
 
@@ -159,13 +151,8 @@ class PerformanceChecker:
         """Check for unoptimized images (Section 6)"""
         print("[*] Checking for image optimization...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx,js,jsx}'):
-            if 'node_modules' in str(filepath):
-                continue
-
+        for filepath, content in self.iter_sources():
             try:
-                content = filepath.read_text(encoding='utf-8')
-
                 # Check for <img> tags instead of next/image
                 if '<img' in content and 'next/image' not in content:
                     self.warnings.append({
@@ -221,6 +208,9 @@ class PerformanceChecker:
         print("="*60)
         print(f"Scanning: {self.project_path}")
 
+        self.load_sources()
+        print(f"Indexed: {len(self._sources)} source files")
+
         self.check_waterfalls()
         self.check_barrel_imports()
         self.check_dynamic_imports()
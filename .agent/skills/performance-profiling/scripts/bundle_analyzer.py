@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Bundle Analyzer - Offline Bundle Impact Estimate
+Walks the frontend import graph from its entry points and estimates the
+transitive byte weight each entry pulls in. Works on source files only:
+no build, browser or network required, so it can gate merges.
+
+PURPOSE:
+    - Estimate initial (static) and lazy (dynamic) weight per entry point
+    - Flag heavy packages imported statically that should be code-split
+    - Show the heaviest modules in each entry's static graph
+
+HOW SIZES ARE ESTIMATED:
+    - Local modules: source file size on disk
+    - Packages: the approximate minified size in KNOWN_PACKAGE_KB, whether or
+      not node_modules is installed, so the verdict does not depend on it.
+      Packages without an estimate are listed as unweighed; the installed
+      entry file size is shown next to packages as information only (it is
+      often a small CJS stub, not the shipped weight)
+
+Usage:
+    python bundle_analyzer.py <project_path> [--entry index.tsx] [--budget-kb 500]
+"""
+import sys
+import json
+import re
+import argparse
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+# Fix Windows console encoding
+try:
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+except:
+    pass
+
+# Shared single-pass import graph (nextjs-react-expert skill)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'nextjs-react-expert' / 'scripts'))
+from import_graph import ImportGraph, collect_sources, SKIP_DIRS
+
+# Backend/tooling dirs that never ship in the browser bundle
+FRONTEND_SKIP_DIRS = SKIP_DIRS | {'.agent', 'server', 'supabase', 'docs', 'public', 'database'}
+
+# Fallback entry points when index.html has no module script
+DEFAULT_ENTRIES = ['index.tsx', 'src/main.tsx', 'src/index.tsx', 'main.tsx', 'App.tsx', 'src/App.tsx']
+
+MODULE_SCRIPT_RE = re.compile(r'<script[^>]+type=["\']module["\'][^>]*src=["\']/?([^"\']+)["\']', re.I)
+
+# Approximate minified sizes (KB) of common packages
+KNOWN_PACKAGE_KB = {
+    'xlsx': 430, 'xlsx-js-style': 450, 'exceljs': 940, 'jspdf': 360, 'pdfjs-dist': 330,
+    'moment': 290, 'lodash': 70, 'chart.js': 200, 'recharts': 390, 'd3': 280,
+    'three': 650, 'monaco-editor': 2500, 'firebase': 500, 'aws-sdk': 2200,
+    '@supabase/supabase-js': 110, 'react-dom': 130, 'react': 7, 'framer-motion': 120,
+    'date-fns': 75, 'axios': 30, 'lucide-react': 15,
+}
+
+# Statically imported packages at or above this size should be lazy-loaded
+HEAVY_PACKAGE_KB = 200
+
+# Framework/runtime packages the app cannot start without - never flagged
+CORE_PACKAGES = {'react', 'react-dom', 'next', 'vue', 'svelte', 'preact', '@supabase/supabase-js'}
+
+# Fail when an entry's initial (static) graph exceeds this
+DEFAULT_BUDGET_KB = 500
+
+
+def find_entries(project_path: Path) -> List[Path]:
+    """Entry points from index.html module scripts, else conventional names."""
+    entries = []
+    index_html = project_path / 'index.html'
+    if index_html.exists():
+        html = index_html.read_text(encoding='utf-8', errors='ignore')
+        for src in MODULE_SCRIPT_RE.findall(html):
+            candidate = project_path / src
+            if candidate.exists():
+                entries.append(candidate)
+    if entries:
+        return entries
+    return [project_path / e for e in DEFAULT_ENTRIES if (project_path / e).exists()][:1]
+
+
+def package_size(name: str) -> Tuple[int, str]:
+    """Estimate a package's shipped bytes. Returns (bytes, source)."""
+    if name in KNOWN_PACKAGE_KB:
+        return KNOWN_PACKAGE_KB[name] * 1024, 'estimate'
+    return 0, 'unknown'
+
+
+def installed_entry_size(project_path: Path, name: str) -> Optional[int]:
+    """Size of the installed package's entry file (informational only)."""
+    pkg_dir = project_path / 'node_modules' / name
+    try:
+        meta = json.loads((pkg_dir / 'package.json').read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    for field in ('module', 'browser', 'main'):
+        entry = meta.get(field)
+        if isinstance(entry, str) and (pkg_dir / entry).is_file():
+            return (pkg_dir / entry).stat().st_size
+    return None
+
+
+class BundleAnalyzer:
+    def __init__(self, project_path: Path):
+        self.project_path = project_path
+        sources = collect_sources(project_path, skip_dirs=FRONTEND_SKIP_DIRS)
+        self.graph = ImportGraph(project_path, sources)
+        self._package_sizes: Dict[str, Tuple[int, str]] = {}
+
+    def module_size(self, module) -> int:
+        if isinstance(module, Path):
+            try:
+                return module.stat().st_size
+            except OSError:
+                return 0
+        if module not in self._package_sizes:
+            self._package_sizes[module] = package_size(module)
+        return self._package_sizes[module][0]
+
+    def describe(self, module) -> dict:
+        item = {"module": self.graph.label(module), "kb": round(self.module_size(module) / 1024, 1)}
+        if not isinstance(module, Path):
+            installed = installed_entry_size(self.project_path, module)
+            if installed is not None:
+                item["installed_entry_kb"] = round(installed / 1024, 1)
+        return item
+
+    def unweighed(self, modules: Set) -> List[str]:
+        """Packages with no size estimate (counted as 0 KB)."""
+        return sorted(m for m in modules if not isinstance(m, Path) and package_size(m)[1] == 'unknown')
+
+    def reachable(self, roots: List, follow_dynamic: bool) -> Set:
+        """Transitive closure over the import graph from roots."""
+        seen = set(roots)
+        stack = list(roots)
+        while stack:
+            module = stack.pop()
+            if not isinstance(module, Path):
+                continue  # package internals are not walked
+            for edge in self.graph.imports_of(module):
+                if edge.kind == 'dynamic' and not follow_dynamic:
+                    continue
+                if edge.target not in seen:
+                    seen.add(edge.target)
+                    stack.append(edge.target)
+        return seen
+
+    def analyze_entry(self, entry: Path) -> dict:
+        initial = self.reachable([entry], follow_dynamic=False)
+        everything = self.reachable([entry], follow_dynamic=True)
+        lazy = everything - initial
+
+        initial_bytes = sum(self.module_size(m) for m in initial)
+        lazy_bytes = sum(self.module_size(m) for m in lazy)
+        heaviest = sorted(initial, key=self.module_size, reverse=True)[:5]
+
+        return {
+            "entry": self.graph.label(entry),
+            "initial_kb": round(initial_bytes / 1024, 1),
+            "lazy_kb": round(lazy_bytes / 1024, 1),
+            "modules": len(initial),
+            "heaviest": [self.describe(m) for m in heaviest],
+            "unweighed_packages": self.unweighed(everything),
+            "_initial": initial,
+        }
+
+    def heavy_static_imports(self, initial: Set) -> List[dict]:
+        """Heavy packages pulled into the initial graph by a static import."""
+        findings = []
+        for module in initial:
+            if isinstance(module, Path) or module in CORE_PACKAGES:
+                continue
+            size = self.module_size(module)
+            if size < HEAVY_PACKAGE_KB * 1024:
+                continue
+            for edge in self.graph.importers_of(module, kind='static'):
+                if edge.importer in initial:
+                    findings.append({
+                        "package": module,
+                        "kb": round(size / 1024, 1),
+                        "size_source": self._package_sizes[module][1],
+                        "importer": self.graph.label(edge.importer),
+                        "fix": f"Load with import('{module}') where it is used",
+                    })
+        return findings
+
+
+def run(project_path=".", entry: List[str] = None, budget_kb: float = DEFAULT_BUDGET_KB,
+        **opts) -> dict:
+    """Analyze the entries, print the report and return the result (importable entry point)."""
+    project_path = Path(project_path).resolve()
+
+    print(f"\n{'='*60}")
+    print(f"  BUNDLE ANALYZER - Offline Bundle Impact")
+    print(f"{'='*60}")
+    print(f"Project: {project_path}")
+    print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("-"*60)
+
+    entries = [project_path / e for e in entry] if entry else find_entries(project_path)
+    if not entries:
+        print("\n[!] No frontend entry point found.")
+        return {"script": "bundle_analyzer", "entries": [], "passed": True}
+
+    analyzer = BundleAnalyzer(project_path)
+    reports = []
+    heavy = []
+    over_budget = []
+
+    for entry_path in entries:
+        report = analyzer.analyze_entry(entry_path)
+        initial = report.pop("_initial")
+        reports.append(report)
+        heavy.extend(analyzer.heavy_static_imports(initial))
+        if report["initial_kb"] > budget_kb:
+            over_budget.append(report["entry"])
+
+        print(f"\nEntry: {report['entry']}")
+        print(f"  Initial (static): {report['initial_kb']} KB across {report['modules']} modules")
+        print(f"  Lazy (dynamic):   {report['lazy_kb']} KB")
+        print("  Heaviest modules:")
+        for item in report["heaviest"]:
+            installed = f"  (installed entry: {item['installed_entry_kb']} KB)" if "installed_entry_kb" in item else ""
+            print(f"    {item['kb']:>8} KB  {item['module']}{installed}")
+        if report["unweighed_packages"]:
+            print(f"  No size estimate (counted as 0 KB): {', '.join(report['unweighed_packages'])}")
+
+    if heavy:
+        print("\nHeavy static imports (should be split out):")
+        for item in heavy:
+            print(f"  [{item['kb']} KB] {item['package']} <- {item['importer']}")
+            print(f"    Fix: {item['fix']}")
+
+    if over_budget:
+        print(f"\n[!] Over budget ({budget_kb} KB): {', '.join(over_budget)}")
+
+    passed = not heavy and not over_budget
+    if passed:
+        print("\n[OK] Bundle within budget, no heavy static imports")
+
+    output = {
+        "script": "bundle_analyzer",
+        "project": str(project_path),
+        "budget_kb": budget_kb,
+        "entries": reports,
+        "heavy_static_imports": heavy,
+        "over_budget": over_budget,
+        "passed": passed
+    }
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline bundle impact analyzer")
+    parser.add_argument("project", nargs="?", default=".", help="Project path")
+    parser.add_argument("--entry", action="append", help="Entry point (repeatable)")
+    parser.add_argument("--budget-kb", type=float, default=DEFAULT_BUDGET_KB,
+                        help=f"Initial graph budget per entry (default {DEFAULT_BUDGET_KB} KB)")
+    args, _ = parser.parse_known_args()
+
+    output = run(args.project, entry=args.entry, budget_kb=args.budget_kb)
+    print("\n" + json.dumps(output, indent=2))
+    sys.exit(0 if output["passed"] else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -67,6 +67,14 @@ def get_summary(categories: dict) -> str:
     else:
         return "[X] Poor performance"
 
+def run(project_path: str = ".", url: str = None, **opts) -> dict:
+    """Importable entry point: audit url; fails when Lighthouse could not produce a report."""
+    if not url:
+        return {"error": "No URL provided", "passed": False}
+    result = run_lighthouse(url)
+    result["passed"] = "error" not in result
+    return result
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print(json.dumps({"error": "Usage: python lighthouse_audit.py <url>"}))
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Performance Budget - Offline Build Inspection
+Inspects the built output (dist/) directly and compares it against a
+performance budget. No Chrome, Lighthouse CLI or live URL required, so every
+verification run gets a performance signal.
+
+MEASURES:
+    - Total JS, CSS and other asset bytes (raw and gzip)
+    - Render-blocking resources referenced by index.html
+    - The largest chunks
+
+BUDGET FILE (optional, JSON, sizes in KB of raw bytes):
+    performance-budget.json at the project root, or --budget <path>
+    {"js_kb": 500, "css_kb": 100, "assets_kb": 2000, "total_kb": 2500,
+     "largest_chunk_kb": 250, "render_blocking": 3}
+
+Usage:
+    python perf_budget.py <project_path> [--dist dist] [--budget performance-budget.json]
+"""
+import sys
+import json
+import gzip
+import re
+import argparse
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List
+
+# Fix Windows console encoding
+try:
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+except:
+    pass
+
+BUDGET_FILE = 'performance-budget.json'
+BUILD_DIRS = ['dist', 'build', 'out']
+
+DEFAULT_BUDGET = {
+    "js_kb": 500,
+    "css_kb": 100,
+    "assets_kb": 2000,
+    "total_kb": 2500,
+    "largest_chunk_kb": 250,
+    "render_blocking": 3,
+}
+
+JS_EXTENSIONS = {'.js', '.mjs', '.cjs'}
+CSS_EXTENSIONS = {'.css'}
+# Not shipped to the browser
+IGNORED_EXTENSIONS = {'.map', '.txt'}
+
+HEAD_RE = re.compile(r'<head[^>]*>(.*?)</head>', re.I | re.S)
+SCRIPT_TAG_RE = re.compile(r'<script\b([^>]*)>', re.I)
+LINK_TAG_RE = re.compile(r'<link\b([^>]*)>', re.I)
+ATTR_RE = re.compile(r'([\w-]+)(?:\s*=\s*["\']([^"\']*)["\'])?')
+
+
+def find_build_dir(project_path: Path, override: str = None) -> Path:
+    if override:
+        return (project_path / override).resolve()
+    for name in BUILD_DIRS:
+        candidate = project_path / name
+        if (candidate / 'index.html').exists():
+            return candidate
+    return None
+
+
+def load_budget(project_path: Path, override: str = None) -> Dict:
+    budget = dict(DEFAULT_BUDGET)
+    path = Path(override) if override else project_path / BUDGET_FILE
+    if path.exists():
+        try:
+            budget.update(json.loads(path.read_text(encoding='utf-8')))
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Invalid budget file {path}: {e}") from e
+    return budget
+
+
+def gzip_size(data: bytes) -> int:
+    return len(gzip.compress(data, compresslevel=6))
+
+
+def measure_assets(build_dir: Path) -> Dict:
+    """Byte totals by type and the largest chunks."""
+    totals = {"js": [0, 0], "css": [0, 0], "assets": [0, 0]}
+    chunks = []
+    for f in build_dir.rglob('*'):
+        if not f.is_file() or f.suffix in IGNORED_EXTENSIONS:
+            continue
+        data = f.read_bytes()
+        raw, gz = len(data), gzip_size(data)
+        if f.suffix in JS_EXTENSIONS:
+            kind = "js"
+        elif f.suffix in CSS_EXTENSIONS:
+            kind = "css"
+        else:
+            kind = "assets"
+        totals[kind][0] += raw
+        totals[kind][1] += gz
+        if kind in ("js", "css"):
+            chunks.append({"file": str(f.relative_to(build_dir)), "kb": round(raw / 1024, 1),
+                           "gzip_kb": round(gz / 1024, 1)})
+
+    chunks.sort(key=lambda c: -c["kb"])
+    metrics = {
+        kind: {"kb": round(raw / 1024, 1), "gzip_kb": round(gz / 1024, 1)}
+        for kind, (raw, gz) in totals.items()
+    }
+    metrics["largest_chunks"] = chunks[:5]
+    return metrics
+
+
+def render_blocking_resources(html: str) -> List[str]:
+    """Scripts and stylesheets in <head> that block first render."""
+    head = HEAD_RE.search(html)
+    head = head.group(1) if head else html
+    blocking = []
+
+    for attrs in SCRIPT_TAG_RE.findall(head):
+        a = {k.lower(): v for k, v in ATTR_RE.findall(attrs)}
+        if 'src' not in a:
+            continue
+        if 'async' in a or 'defer' in a or a.get('type', '').lower() == 'module':
+            continue
+        blocking.append(a['src'])
+
+    for attrs in LINK_TAG_RE.findall(head):
+        a = {k.lower(): v for k, v in ATTR_RE.findall(attrs)}
+        if a.get('rel', '').lower() != 'stylesheet':
+            continue
+        if a.get('media', 'all').lower() not in ('all', 'screen') or 'disabled' in a:
+            continue
+        blocking.append(a.get('href', '<inline>'))
+
+    return blocking
+
+
+def compare(metrics: Dict, budget: Dict) -> List[str]:
+    js, css, assets = metrics["js"]["kb"], metrics["css"]["kb"], metrics["assets"]["kb"]
+    largest = metrics["largest_chunks"][0]["kb"] if metrics["largest_chunks"] else 0
+    actual = {
+        "js_kb": js,
+        "css_kb": css,
+        "assets_kb": assets,
+        "total_kb": round(js + css + assets, 1),
+        "largest_chunk_kb": largest,
+        "render_blocking": len(metrics["render_blocking"]),
+    }
+    metrics["totals"] = actual
+    return [
+        f"{key}: {actual[key]} > {limit}"
+        for key, limit in budget.items()
+        if key in actual and actual[key] > limit
+    ]
+
+
+def run(project_path=".", dist: str = None, budget: str = None, **opts) -> dict:
+    """Inspect the build, print the report and return the result (importable entry point)."""
+    project_path = Path(project_path).resolve()
+
+    print(f"\n{'='*60}")
+    print(f"  PERFORMANCE BUDGET - Offline Build Inspection")
+    print(f"{'='*60}")
+    print(f"Project: {project_path}")
+    print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("-"*60)
+
+    build_dir = find_build_dir(project_path, dist)
+    if not build_dir or not build_dir.exists():
+        print("\n[!] No build output found (dist/, build/, out/).")
+        print("    Run the production build first, e.g. npm run build")
+        # Nothing was measured: report a skip, not a green run
+        return {"script": "perf_budget", "build_dir": None, "passed": True, "skipped": True,
+                "message": "No build output found (dist/, build/, out/) - run the production build first"}
+
+    try:
+        budget = load_budget(project_path, budget)
+    except ValueError as e:
+        print(f"\n[X] {e}")
+        return {"script": "perf_budget", "build_dir": str(build_dir), "error": str(e), "passed": False}
+    metrics = measure_assets(build_dir)
+    index_html = build_dir / 'index.html'
+    html = index_html.read_text(encoding='utf-8', errors='ignore') if index_html.exists() else ''
+    metrics["render_blocking"] = render_blocking_resources(html)
+    violations = compare(metrics, budget)
+
+    try:
+        build_label = build_dir.relative_to(project_path)
+    except ValueError:  # --dist outside the project
+        build_label = build_dir
+    print(f"Build: {build_label}\n")
+    for kind in ("js", "css", "assets"):
+        print(f"  {kind.upper():<7} {metrics[kind]['kb']:>9} KB  (gzip {metrics[kind]['gzip_kb']} KB)")
+    print(f"\n  Render-blocking resources: {len(metrics['render_blocking'])}")
+    for res in metrics["render_blocking"]:
+        print(f"    - {res}")
+    print("\n  Largest chunks:")
+    for chunk in metrics["largest_chunks"]:
+        print(f"    {chunk['kb']:>9} KB  {chunk['file']}")
+
+    if violations:
+        print("\nBudget exceeded:")
+        for v in violations:
+            print(f"  [X] {v}")
+    else:
+        print("\n[OK] Within performance budget")
+
+    passed = not violations
+    output = {
+        "script": "perf_budget",
+        "project": str(project_path),
+        "build_dir": str(build_dir),
+        "budget": budget,
+        "metrics": metrics,
+        "violations": violations,
+        "passed": passed
+    }
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline performance budget check")
+    parser.add_argument("project", nargs="?", default=".", help="Project path")
+    parser.add_argument("--dist", help="Build output dir (default: first of dist/build/out)")
+    parser.add_argument("--budget", help=f"Budget JSON (default: <project>/{BUDGET_FILE})")
+    args, _ = parser.parse_known_args()
+
+    output = run(args.project, dist=args.dist, budget=args.budget)
+    print("\n" + json.dumps(output, indent=2))
+    sys.exit(0 if output["passed"] else 1)
+
+
+if __name__ == "__main__":
+    main()
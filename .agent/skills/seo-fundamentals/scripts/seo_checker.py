@@ -17,6 +17,7 @@ WHAT IT CHECKS:
 Usage:
     python seo_checker.py <project_path>
 """
+import os
 import sys
 import json
 import re
@@ -45,52 +46,65 @@ SKIP_PATTERNS = [
 ]
 
 
-def is_page_file(file_path: Path) -> bool:
-    """Check if this file is likely a public-facing page."""
+PAGE_EXTENSIONS = {'.html', '.htm', '.jsx', '.tsx'}
+PAGE_DIRS = {'pages', 'app', 'routes', 'views', 'screens'}
+PAGE_NAMES = ['page', 'index', 'home', 'about', 'contact', 'blog',
+              'post', 'article', 'product', 'landing', 'layout']
+
+
+def walk_files(project_path: Path, extensions: set):
+    """Yield files by extension, pruning SKIP_DIRS before descending."""
+    for root, dirs, files in os.walk(project_path):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for name in files:
+            if Path(name).suffix.lower() in extensions:
+                yield Path(root) / name
+
+
+def page_score(file_path: Path) -> int:
+    """Score how likely a file is a public-facing page (0 = not a page)."""
     name = file_path.name.lower()
     stem = file_path.stem.lower()
     
     # Skip utility/config files
     if any(skip in name for skip in SKIP_PATTERNS):
-        return False
+        return 0
+    
+    score = 0
     
     # Check path - pages in specific directories are likely pages
     parts = [p.lower() for p in file_path.parts]
-    page_dirs = ['pages', 'app', 'routes', 'views', 'screens']
-    
-    if any(d in parts for d in page_dirs):
-        return True
+    if any(d in parts for d in PAGE_DIRS):
+        score += 3
     
     # Filename indicators for pages
-    page_names = ['page', 'index', 'home', 'about', 'contact', 'blog', 
-                  'post', 'article', 'product', 'landing', 'layout']
-    
-    if any(p in stem for p in page_names):
-        return True
+    if stem in PAGE_NAMES:
+        score += 2
+    elif any(p in stem for p in PAGE_NAMES):
+        score += 1
     
     # HTML files are usually pages
     if file_path.suffix.lower() in ['.html', '.htm']:
-        return True
+        score += 2
     
-    return False
+    return score
+
+
+def is_page_file(file_path: Path) -> bool:
+    """Check if this file is likely a public-facing page."""
+    return page_score(file_path) > 0
 
 
 def find_pages(project_path: Path) -> list:
-    """Find page files to check."""
-    patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
+    """Find page files to check, most page-like first."""
+    scored = []
+    for f in walk_files(project_path, PAGE_EXTENSIONS):
+        score = page_score(f.relative_to(project_path))
+        if score > 0:
+            scored.append((score, f))
     
-    files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            # Skip excluded directories
-            if any(skip in f.parts for skip in SKIP_DIRS):
-                continue
-            
-            # Check if it's likely a page
-            if is_page_file(f):
-                files.append(f)
-    
-    return files[:50]  # Limit to 50 files
+    scored.sort(key=lambda x: (-x[0], str(x[1])))
+    return [f for _, f in scored]
 
 
 def check_page(file_path: Path) -> dict:
@@ -145,8 +159,9 @@ def check_page(file_path: Path) -> dict:
     }
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+def run(project_path=".", **opts) -> dict:
+    """Run the checks and return the structured result (importable entry point)."""
+    project_path = Path(project_path).resolve()
     
     print(f"\n{'='*60}")
     print(f"  SEO CHECKER - Search Engine Optimization Audit")
@@ -162,8 +177,7 @@ def main():
         print("\n[!] No page files found.")
         print("    Looking for: HTML, JSX, TSX in pages/app/routes directories")
         output = {"script": "seo_checker", "files_checked": 0, "passed": True}
-        print("\n" + json.dumps(output, indent=2))
-        sys.exit(0)
+        return output
     
     print(f"Found {len(pages)} page files to analyze\n")
     
@@ -210,9 +224,13 @@ def main():
         "passed": passed
     }
     
+    return output
+
+
+def main():
+    output = run(sys.argv[1] if len(sys.argv) > 1 else ".")
     print("\n" + json.dumps(output, indent=2))
-    
-    sys.exit(0 if passed else 1)
+    sys.exit(0 if output["passed"] else 1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Skill: vulnerability-scanner
+Script: dependency_analyzer.py
+Purpose: Offline dependency analysis from package-lock.json
+Usage: python dependency_analyzer.py <project_path> [--advisories <db.json>] [--no-sizes]
+       python dependency_analyzer.py <project_path> --import-audit <npm-audit.json>
+Output: JSON with dependency tree stats and findings
+
+This script reports:
+1. Duplicate versions - Same package installed at several versions
+2. Depth - Longest dependency chain from the project root
+3. Install-size outliers - Largest installed packages (needs node_modules)
+4. Known advisories - Matched against a locally cached advisory database
+   (a missing database is reported as a warning, not a clean pass)
+
+No network calls are made. The advisory database is a JSON file that can be
+refreshed from any machine with `npm audit --json > audit.json` followed by
+`--import-audit audit.json`.
+"""
+import json
+import os
+import sys
+import argparse
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+from datetime import datetime
+
+# Fix Windows console encoding for Unicode output
+try:
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
+except AttributeError:
+    pass  # Python < 3.7
+
+
+# ============================================================================
+#  CONFIGURATION
+# ============================================================================
+
+LOCK_FILES = ["package-lock.json", "npm-shrinkwrap.json"]
+
+# Locally cached advisories: {package: [{id, title, severity, range}]}
+ADVISORY_DB = Path(__file__).resolve().parent.parent / "data" / "advisories.json"
+
+# A package is a size outlier above max(SIZE_OUTLIER_MIN_MB, median * SIZE_OUTLIER_FACTOR)
+SIZE_OUTLIER_MIN_MB = 5
+SIZE_OUTLIER_FACTOR = 20
+
+# Dependency chains longer than this are reported
+MAX_DEPTH = 8
+
+FAILING_SEVERITIES = {"critical", "high"}
+
+
+# ============================================================================
+#  LOCKFILE INDEX
+# ============================================================================
+
+class PackageEntry:
+    __slots__ = ("path", "name", "version", "dev", "dependencies")
+
+    def __init__(self, path: str, name: str, version: str, dev: bool, dependencies: Dict[str, str]):
+        self.path = path
+        self.name = name
+        self.version = version
+        self.dev = dev
+        self.dependencies = dependencies
+
+
+def name_from_path(path: str) -> str:
+    """'node_modules/a/node_modules/@b/c' -> '@b/c'"""
+    return path.rsplit("node_modules/", 1)[-1]
+
+
+def load_lockfile(project_path: Path) -> Optional[Tuple[Path, Dict[str, PackageEntry]]]:
+    """
+    Index the lockfile into {install path: PackageEntry}.
+    The stdlib C JSON decoder parses multi-MB lockfiles in milliseconds, so the
+    file is decoded once and the package map is consumed in a single pass.
+    """
+    for name in LOCK_FILES:
+        lock_path = project_path / name
+        if lock_path.exists():
+            break
+    else:
+        return None
+
+    with open(lock_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    index: Dict[str, PackageEntry] = {}
+
+    if "packages" in data:
+        # lockfileVersion 2/3: flat map keyed by install path
+        for path, meta in data["packages"].items():
+            deps = {}
+            for field in ("dependencies", "optionalDependencies"):
+                deps.update(meta.get(field, {}))
+            if path == "":
+                deps.update(meta.get("devDependencies", {}))
+            index[path] = PackageEntry(
+                path, name_from_path(path) if path else meta.get("name", ""),
+                meta.get("version", ""), bool(meta.get("dev")), deps
+            )
+    else:
+        # lockfileVersion 1: nested "dependencies" tree
+        root_deps = {k: v.get("version", "") for k, v in data.get("dependencies", {}).items()}
+        index[""] = PackageEntry("", data.get("name", ""), data.get("version", ""), False, root_deps)
+        stack = [("", data.get("dependencies", {}))]
+        while stack:
+            parent, deps = stack.pop()
+            for dep_name, meta in deps.items():
+                path = f"{parent}/node_modules/{dep_name}".lstrip("/")
+                index[path] = PackageEntry(path, dep_name, meta.get("version", ""),
+                                           bool(meta.get("dev")), dict(meta.get("requires", {})))
+                if meta.get("dependencies"):
+                    stack.append((path, meta["dependencies"]))
+        index[""].dependencies = v1_root_dependencies(project_path, index, root_deps)
+
+    return lock_path, index
+
+
+def v1_root_dependencies(project_path: Path, index: Dict[str, PackageEntry],
+                         top_level: Dict[str, str]) -> Dict[str, str]:
+    """
+    lockfileVersion 1 lists every hoisted package at the top level, so the
+    root's real edges come from package.json, else from the top-level
+    packages no other package requires.
+    """
+    try:
+        with open(project_path / "package.json", "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        declared = {}
+        for field in ("dependencies", "devDependencies", "optionalDependencies"):
+            declared.update(manifest.get(field, {}))
+        return {name: spec for name, spec in declared.items() if f"node_modules/{name}" in index}
+    except (OSError, ValueError):
+        pass
+    required = {resolve_dependency(index, path, dep)
+                for path, entry in index.items() if path for dep in entry.dependencies}
+    return {name: version for name, version in top_level.items()
+            if f"node_modules/{name}" not in required}
+
+
+def resolve_dependency(index: Dict[str, PackageEntry], from_path: str, dep: str) -> Optional[str]:
+    """Node resolution: nearest node_modules/<dep> walking up from from_path."""
+    base = from_path
+    while True:
+        candidate = f"{base}/node_modules/{dep}" if base else f"node_modules/{dep}"
+        if candidate in index:
+            return candidate
+        if not base:
+            return None
+        cut = base.rfind("/node_modules/")
+        base = base[:cut] if cut != -1 else ""
+
+
+def dependency_depths(index: Dict[str, PackageEntry]) -> Dict[str, Tuple[int, Optional[str]]]:
+    """BFS from the root: {path: (depth, parent path)}."""
+    depths = {"": (0, None)}
+    queue = deque([""])
+    while queue:
+        path = queue.popleft()
+        depth = depths[path][0]
+        for dep in index[path].dependencies:
+            target = resolve_dependency(index, path, dep)
+            if target is not None and target not in depths:
+                depths[target] = (depth + 1, path)
+                queue.append(target)
+    return depths
+
+
+# ============================================================================
+#  ANALYSES
+# ============================================================================
+
+def find_duplicates(index: Dict[str, PackageEntry]) -> List[Dict[str, Any]]:
+    versions: Dict[str, Dict[str, List[str]]] = {}
+    for path, entry in index.items():
+        if path:
+            versions.setdefault(entry.name, {}).setdefault(entry.version, []).append(path)
+    return [
+        {"package": name, "versions": sorted(by_version), "installs": sum(len(p) for p in by_version.values())}
+        for name, by_version in sorted(versions.items())
+        if len(by_version) > 1
+    ]
+
+
+def dir_size(path: Path) -> int:
+    """Bytes under path, not descending into nested node_modules."""
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name != "node_modules":
+                            stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+    return total
+
+
+def find_size_outliers(project_path: Path, index: Dict[str, PackageEntry]) -> Optional[List[Dict[str, Any]]]:
+    if not (project_path / "node_modules").is_dir():
+        return None
+    sizes = {}
+    for path in index:
+        if path and (project_path / path).is_dir():
+            sizes[path] = dir_size(project_path / path)
+    if not sizes:
+        return []
+    ordered = sorted(sizes.values())
+    median = ordered[len(ordered) // 2]
+    threshold = max(SIZE_OUTLIER_MIN_MB * 1024 * 1024, median * SIZE_OUTLIER_FACTOR)
+    return [
+        {"package": index[path].name, "version": index[path].version, "mb": round(size / 1024 / 1024, 1)}
+        for path, size in sorted(sizes.items(), key=lambda x: -x[1])
+        if size > threshold
+    ]
+
+
+def parse_version(version: str) -> Tuple[int, ...]:
+    core = version.strip().lstrip("v=").split("-", 1)[0].split("+", 1)[0]
+    parts = []
+    for piece in core.split(".")[:3]:
+        parts.append(int(piece) if piece.isdigit() else 0)
+    while len(parts) < 3:
+        parts.append(0)
+    return tuple(parts)
+
+
+def version_in_range(version: str, range_spec: str) -> bool:
+    """Minimal npm range check: '||' unions of space-separated comparators."""
+    v = parse_version(version)
+    for alternative in range_spec.split("||"):
+        comparators = alternative.split()
+        if not comparators or comparators == ["*"]:
+            return True
+        matched = True
+        for comp in comparators:
+            for op in ("<=", ">=", "<", ">", "="):
+                if comp.startswith(op):
+                    target = parse_version(comp[len(op):])
+                    break
+            else:
+                op, target = "=", parse_version(comp)
+            if not {"<": v < target, "<=": v <= target, ">": v > target,
+                    ">=": v >= target, "=": v == target}[op]:
+                matched = False
+                break
+        if matched:
+            return True
+    return False
+
+
+def load_advisories(db_path: Path) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    if not db_path.exists():
+        return None
+    with open(db_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def import_npm_audit(audit_path: Path, db_path: Path) -> int:
+    """Merge advisories from an `npm audit --json` report into the local DB."""
+    with open(audit_path, "r", encoding="utf-8") as f:
+        audit = json.load(f)
+    db = load_advisories(db_path) or {}
+    added = 0
+    for vuln in audit.get("vulnerabilities", {}).values():
+        for via in vuln.get("via", []):
+            if not isinstance(via, dict) or not via.get("name"):
+                continue  # string entries point at another vulnerable package
+            entries = db.setdefault(via["name"], [])
+            advisory_id = via.get("url") or str(via.get("source", ""))
+            if any(e["id"] == advisory_id for e in entries):
+                continue
+            entries.append({
+                "id": advisory_id,
+                "title": via.get("title", ""),
+                "severity": via.get("severity", "low"),
+                "range": via.get("range", "*"),
+            })
+            added += 1
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(db_path, "w", encoding="utf-8") as f:
+        json.dump(db, f, indent=2, sort_keys=True)
+    return added
+
+
+def match_advisories(index: Dict[str, PackageEntry], db: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    findings = []
+    seen = set()
+    for path, entry in index.items():
+        if not path or entry.name not in db or (entry.name, entry.version) in seen:
+            continue
+        seen.add((entry.name, entry.version))
+        for advisory in db[entry.name]:
+            if version_in_range(entry.version, advisory.get("range", "*")):
+                findings.append({
+                    "package": entry.name,
+                    "version": entry.version,
+                    "dev": entry.dev,
+                    "severity": advisory.get("severity", "low"),
+                    "id": advisory.get("id", ""),
+                    "title": advisory.get("title", ""),
+                })
+    return findings
+
+
+# ============================================================================
+#  MAIN
+# ============================================================================
+
+def analyze(project_path: Path, db_path: Path = ADVISORY_DB, sizes: bool = True) -> Dict[str, Any]:
+    report = {
+        "project": str(project_path),
+        "timestamp": datetime.now().isoformat(),
+        "lockfile": None,
+        "findings": [],
+        "passed": True,
+    }
+
+    loaded = load_lockfile(project_path)
+    if loaded is None:
+        report["status"] = "[?] No package-lock.json found, nothing to analyze"
+        return report
+    lock_path, index = loaded
+    report["lockfile"] = lock_path.name
+
+    depths = dependency_depths(index)
+    deepest = max(depths, key=lambda p: depths[p][0])
+    chain = []
+    node = deepest
+    while node:
+        chain.append(index[node].name)
+        node = depths[node][1]
+
+    report["packages"] = len(index) - 1
+    report["dev_packages"] = sum(1 for p, e in index.items() if p and e.dev)
+    report["max_depth"] = depths[deepest][0]
+    report["deepest_chain"] = list(reversed(chain))
+    report["unreachable"] = sorted(index[p].name for p in index if p not in depths)
+    report["duplicates"] = find_duplicates(index)
+    report["size_outliers"] = find_size_outliers(project_path, index) if sizes else None
+
+    db = load_advisories(db_path)
+    report["advisory_db"] = str(db_path) if db is not None else None
+    report["advisories"] = match_advisories(index, db) if db is not None else []
+
+    for dup in report["duplicates"]:
+        report["findings"].append({"type": "Duplicate Versions", "severity": "low",
+                                   "message": f"{dup['package']}: {', '.join(dup['versions'])}"})
+    if report["max_depth"] > MAX_DEPTH:
+        report["findings"].append({"type": "Deep Dependency Chain", "severity": "low",
+                                   "message": " > ".join(report["deepest_chain"])})
+    for outlier in report["size_outliers"] or []:
+        report["findings"].append({"type": "Install Size Outlier", "severity": "low",
+                                   "message": f"{outlier['package']}@{outlier['version']}: {outlier['mb']} MB"})
+    if db is None:
+        report["findings"].append({"type": "Advisory DB Missing", "severity": "medium",
+                                   "message": f"{db_path} not found - advisories were not checked; "
+                                              f"refresh it with --import-audit <npm-audit.json>"})
+    for adv in report["advisories"]:
+        report["findings"].append({"type": "Known Advisory", "severity": adv["severity"],
+                                   "message": f"{adv['package']}@{adv['version']}: {adv['title']} ({adv['id']})"})
+
+    failing = [a for a in report["advisories"] if a["severity"] in FAILING_SEVERITIES]
+    report["passed"] = not failing
+    if failing:
+        report["status"] = f"[!!] {len(failing)} high/critical advisories"
+    elif report["findings"]:
+        report["status"] = "[?] Review recommended"
+    else:
+        report["status"] = "[OK] Dependency tree clean"
+    return report
+
+
+def run(project_path=".", advisories: str = str(ADVISORY_DB), sizes: bool = True, **opts) -> dict:
+    """Importable entry point: analyze project_path and return the report."""
+    project_path = Path(project_path)
+    if not project_path.is_dir():
+        return {"error": f"Directory not found: {project_path}", "passed": False}
+    return analyze(project_path.resolve(), Path(advisories), sizes=sizes)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Offline dependency analysis from package-lock.json"
+    )
+    parser.add_argument("project_path", nargs="?", default=".", help="Project directory")
+    parser.add_argument("--advisories", default=str(ADVISORY_DB), help="Local advisory DB (JSON)")
+    parser.add_argument("--import-audit", help="Merge an `npm audit --json` report into the advisory DB and exit")
+    parser.add_argument("--no-sizes", action="store_true", help="Skip node_modules size scan")
+    args, _ = parser.parse_known_args()
+
+    db_path = Path(args.advisories)
+
+    if args.import_audit:
+        added = import_npm_audit(Path(args.import_audit), db_path)
+        print(json.dumps({"advisory_db": str(db_path), "added": added}, indent=2))
+        sys.exit(0)
+
+    report = run(args.project_path, advisories=str(db_path), sizes=not args.no_sizes)
+    print(json.dumps(report, indent=2))
+    sys.exit(0 if report["passed"] else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -418,6 +418,15 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
     return report
 
 
+def run(project_path: str = ".", scan_type: str = "all", **opts) -> dict:
+    """Importable entry point. Findings are reported, not gated: "passed" mirrors the CLI exit code."""
+    if not os.path.isdir(project_path):
+        return {"error": f"Directory not found: {project_path}", "passed": False}
+    result = run_full_scan(project_path, scan_type)
+    result["passed"] = True
+    return result
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate security principles from vulnerability-scanner skill"
@@ -149,6 +149,16 @@ def run_accessibility_check(url: str) -> dict:
     return result
 
 
+def run(project_path: str = ".", url: str = None, screenshot: bool = False,
+        a11y: bool = False, **opts) -> dict:
+    """Importable entry point: test url; fails when the page errored or did not load."""
+    if not url:
+        return {"error": "No URL provided", "passed": False}
+    result = run_accessibility_check(url) if a11y else run_basic_test(url, screenshot)
+    result["passed"] = "error" not in result and result.get("status") == "success"
+    return result
+
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print(json.dumps({